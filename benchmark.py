@@ -0,0 +1,342 @@
+"""
+Benchmark suite for the report loaders and dashboard computations.
+
+Generates seeded synthetic exports for the four inputs (OpenAI cost, OpenAI
+activity, AstraDB and job CSVs), then times every loader and every create_*
+and show_* function of the dashboards at each requested size, recording wall
+time and peak memory. Besides the bare CSV readers, the loaders include the
+paths the dashboards use: the Parquet frame cache (cold and warm), several
+monthly exports merged by load_exports, and AstraDB store ingestion (first
+ingest and daily refresh). Their caches live under the data directory. The dashboard functions run outside `streamlit run`,
+so their Streamlit calls only build the elements: the timings cover the
+aggregation, figure construction and serialization work of a render.
+
+    python benchmark.py --sizes 10000 1000000 --output benchmarks/baseline.json
+    python benchmark.py --sizes 10000 1000000 --compare benchmarks/baseline.json
+
+With --compare the exit status is 1 when a benchmark regressed.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import argparse
+import logging
+import os
+import shutil
+import sys
+
+# *************** IMPORTS: HELPERS ***************
+from helper.benchmarking import (
+    BENCHMARK_TOLERANCE,
+    compare_results,
+    environment_info,
+    load_results,
+    measure,
+    save_results,
+)
+from helper.synthetic_data import PERIOD_DAYS, synthetic_csv, synthetic_csv_days
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+
+# Every benchmark first runs once on this many rows, untimed, so one-time
+# imports and initialization do not land on whichever benchmark runs first
+WARMUP_ROWS = 1_000
+
+# Synthetic exports are kept here and reused by later runs
+DEFAULT_DATA_DIR = '.benchmark_data'
+
+# Frame cache and AstraDB stores of the benchmarks, inside the data directory;
+# emptied by the cold benchmarks, so never the dashboards' own cache
+BENCHMARK_CACHE_DIR_NAME = 'report_cache'
+
+# Monthly exports the load_exports benchmarks split an activity export into
+EXPORT_PARTS = 4
+
+LOGGER = logging.getLogger('benchmark')
+
+
+# *************** HELPERS ***************
+#*************** Import the dashboards without their bare-mode warnings
+def _import_dashboards(data_dir: str) -> tuple:
+    # Read by helper.parquet_cache on import
+    os.environ['REPORT_CACHE_DIR'] = os.path.join(data_dir, BENCHMARK_CACHE_DIR_NAME)
+
+    from streamlit import config as streamlit_config
+    from streamlit import logger as streamlit_logger
+
+    # Every Streamlit call outside `streamlit run` logs a missing-context warning
+    streamlit_config.set_option('logger.level', 'error')
+    streamlit_logger.set_log_level(logging.ERROR)
+
+    import app
+    import job_analytics
+    return app, job_analytics
+
+
+#*************** Inputs shared by the benchmarks of one size, built once
+class BenchmarkInputs:
+    def __init__(self, rows: int, data_dir: str, seed: int):
+        self.rows = rows
+        self.data_dir = data_dir
+        self.seed = seed
+        self._values = {}
+
+    def get(self, name: str, build):
+        if name not in self._values:
+            self._values[name] = build()
+        return self._values[name]
+
+    def path(self, kind: str) -> str:
+        return self.get(f"path:{kind}", lambda: synthetic_csv(kind, self.rows, self.data_dir, self.seed))
+
+
+#*************** Function to time and optional reset of a benchmark
+def _case_functions(case) -> tuple:
+    # A factory returns the function to time, or (function, reset)
+    return case if isinstance(case, tuple) else (case, None)
+
+
+# *************** DATA PROCESSING: BENCHMARKS ***************
+#*************** Benchmark name to a factory returning the function to time
+def benchmark_cases(app, job_analytics) -> dict:
+    """
+    List every benchmark. Each factory takes the BenchmarkInputs of a size,
+    prepares what the benchmark needs (untimed) and returns the function to time.
+    A factory may also return (function, reset), reset being called before
+    every run, outside the timing.
+    Args:
+        app: the OpenAI/AstraDB dashboard module
+        job_analytics: the job dashboard module
+    Returns:
+        dict : benchmark name to factory
+    """
+    from helper.activity_stream import stream_activity_rollups
+    from helper.astradb_cube import build_astradb_cube
+    from helper.astradb_store import ingest_astradb_report
+    from helper.multi_file import load_exports
+    from helper.openai_rollups import build_activity_rollups, build_cost_rollups
+    from helper.parquet_cache import REPORT_CACHE_DIR, load_cached_frame
+    from helper.report_loaders import read_astradb_csv, read_openai_activity_csv, read_openai_cost_csv
+
+    def clear_report_cache():
+        shutil.rmtree(REPORT_CACHE_DIR, ignore_errors=True)
+
+    def cost_df(inputs):
+        return inputs.get('cost_df', lambda: read_openai_cost_csv(inputs.path('openai_cost')))
+
+    def activity_df(inputs):
+        return inputs.get('activity_df', lambda: read_openai_activity_csv(inputs.path('openai_activity')))
+
+    def astradb_df(inputs):
+        return inputs.get('astradb_df', lambda: read_astradb_csv(inputs.path('astradb')))
+
+    def cost_rollups(inputs):
+        return inputs.get('cost_rollups', lambda: build_cost_rollups(cost_df(inputs)))
+
+    def activity_rollups(inputs):
+        return inputs.get('activity_rollups', lambda: build_activity_rollups(activity_df(inputs)))
+
+    def cube(inputs):
+        return inputs.get('cube', lambda: build_astradb_cube(astradb_df(inputs)))
+
+    def job_bytes(inputs):
+        return inputs.get('job_bytes', lambda: open(inputs.path('jobs'), 'rb').read())
+
+    def job_dataset(inputs):
+        # (df, gps_coords, job_skills, filter_index, search_index)
+        return inputs.get('job_dataset', lambda: job_analytics.process_job_data(job_bytes(inputs)))
+
+    def export_paths(inputs):
+        # Consecutive slices of one export, each repeating the last day of the previous one
+        def build():
+            edges = [PERIOD_DAYS * part // EXPORT_PARTS for part in range(EXPORT_PARTS + 1)]
+            return [synthetic_csv_days('openai_activity', inputs.rows, inputs.data_dir, inputs.seed,
+                                       max(edges[part] - 1, 0), edges[part + 1])
+                    for part in range(EXPORT_PARTS)]
+        return inputs.get('export_paths', build)
+
+    def cached_frame_case(cold):
+        def factory(inputs):
+            path = inputs.path('openai_activity')
+            run = lambda: load_cached_frame(path, 'openai_activity', read_openai_activity_csv)
+            # Warm runs load once beforehand, so the cache holds the frame whatever ran before
+            return run, clear_report_cache if cold else run
+        return factory
+
+    def exports_case(cold):
+        def factory(inputs):
+            paths = export_paths(inputs)
+            run = lambda: load_exports(paths, 'openai_activity', read_openai_activity_csv)
+            # Warm runs load once beforehand, so the cache holds every export
+            return run, clear_report_cache if cold else run
+        return factory
+
+    def astradb_ingest_case(refresh):
+        def factory(inputs):
+            path = inputs.path('astradb')
+            # Yesterday's report: every day of the period but the last
+            previous_path = synthetic_csv_days('astradb', inputs.rows, inputs.data_dir, inputs.seed, 0, PERIOD_DAYS - 1)
+            store_dir = os.path.join(REPORT_CACHE_DIR, 'astradb_store_benchmark')
+
+            def reset():
+                shutil.rmtree(store_dir, ignore_errors=True)
+                if refresh:
+                    ingest_astradb_report(previous_path, store_dir)
+            return (lambda: ingest_astradb_report(path, store_dir)), reset
+        return factory
+
+    def job_section(show, *extra):
+        def factory(inputs):
+            df, gps_coords, job_skills, _, _ = job_dataset(inputs)
+            arguments = {'gps_coords': gps_coords, 'job_skills': job_skills}
+            return lambda: show(df, *[arguments[name] for name in extra])
+        return factory
+
+    return {
+        # Loaders
+        'load.openai_cost': lambda inputs: (lambda path=inputs.path('openai_cost'): read_openai_cost_csv(path)),
+        'load.openai_activity': lambda inputs: (lambda path=inputs.path('openai_activity'): read_openai_activity_csv(path)),
+        'load.openai_activity_stream': lambda inputs: (lambda path=inputs.path('openai_activity'): stream_activity_rollups(path)),
+        'load.astradb': lambda inputs: (lambda path=inputs.path('astradb'): read_astradb_csv(path)),
+        'load.cached_frame_cold': cached_frame_case(cold=True),
+        'load.cached_frame_warm': cached_frame_case(cold=False),
+        'load.exports_cold': exports_case(cold=True),
+        'load.exports_warm': exports_case(cold=False),
+        'load.astradb_ingest_first': astradb_ingest_case(refresh=False),
+        'load.astradb_ingest_refresh': astradb_ingest_case(refresh=True),
+        'load.jobs': lambda inputs: (lambda raw=job_bytes(inputs): job_analytics.process_job_data(raw)),
+        # OpenAI and AstraDB reports
+        'openai.build_cost_rollups': lambda inputs: (lambda df=cost_df(inputs): build_cost_rollups(df)),
+        'openai.build_activity_rollups': lambda inputs: (lambda df=activity_df(inputs): build_activity_rollups(df)),
+        'openai.create_openai_cost_analysis': lambda inputs: (
+            lambda rollups=cost_rollups(inputs): app.create_openai_cost_analysis(rollups)),
+        'openai.create_openai_activity_analysis': lambda inputs: (
+            lambda rollups=activity_rollups(inputs): app.create_openai_activity_analysis(rollups)),
+        'openai.generate_openai_stakeholder_summary': lambda inputs: (
+            lambda cost=cost_rollups(inputs), activity=activity_rollups(inputs):
+            app.generate_openai_stakeholder_summary(cost, activity)),
+        'astradb.build_astradb_cube': lambda inputs: (lambda df=astradb_df(inputs): build_astradb_cube(df)),
+        'astradb.create_astradb_analysis': lambda inputs: (lambda data=cube(inputs): app.create_astradb_analysis(data)),
+        'astradb.generate_astradb_stakeholder_summary': lambda inputs: (
+            lambda data=cube(inputs): app.generate_astradb_stakeholder_summary(data)),
+        # Job dashboard sections
+        'jobs.show_overview_metrics': job_section(job_analytics.show_overview_metrics),
+        'jobs.show_job_trends': job_section(job_analytics.show_job_trends),
+        'jobs.show_location_analysis': job_section(job_analytics.show_location_analysis, 'gps_coords'),
+        'jobs.show_company_analysis': job_section(job_analytics.show_company_analysis),
+        'jobs.show_salary_analysis': job_section(job_analytics.show_salary_analysis),
+        'jobs.show_skills_analysis': job_section(job_analytics.show_skills_analysis, 'job_skills'),
+        'jobs.show_source_comparison': job_section(job_analytics.show_source_comparison),
+        'jobs.show_job_type_analysis': job_section(job_analytics.show_job_type_analysis),
+        'jobs.show_data_quality_report': job_section(job_analytics.show_data_quality_report),
+    }
+
+
+#*************** Run the selected benchmarks at every size
+def run_benchmarks(sizes: list, data_dir: str, seed: int = 0, repeat: int = 3, only: list = None) -> dict:
+    """
+    Time the benchmarks whose name contains one of the only patterns (all when empty).
+    Args:
+        sizes (list): row counts of the synthetic inputs
+        data_dir (str): directory of the synthetic exports
+        seed (int): random seed of the synthetic exports
+        repeat (int): timed repetitions per benchmark
+        only (list): name substrings selecting benchmarks
+    Returns:
+        dict : environment, run settings and one result per benchmark and size
+    """
+    from helper.figure_cache import FIGURE_CACHE
+
+    app, job_analytics = _import_dashboards(data_dir)
+    cases = {name: factory for name, factory in benchmark_cases(app, job_analytics).items()
+             if not only or any(pattern in name for pattern in only)}
+
+    warmup_inputs = BenchmarkInputs(WARMUP_ROWS, data_dir, seed)
+    for name, factory in cases.items():
+        try:
+            run, reset = _case_functions(factory(warmup_inputs))
+            if reset is not None:
+                reset()
+            run()
+        except Exception:
+            # Reported by the measured runs below
+            pass
+    FIGURE_CACHE.clear()
+
+    results = []
+    for rows in sizes:
+        inputs = BenchmarkInputs(rows, data_dir, seed)
+        for name, factory in cases.items():
+            LOGGER.info("%s at %s rows", name, f"{rows:,}")
+            try:
+                run, reset = _case_functions(factory(inputs))
+
+                def before_each(reset=reset):
+                    # Every run builds its figures from scratch, as on a first render
+                    FIGURE_CACHE.clear()
+                    if reset is not None:
+                        reset()
+                measurement = measure(run, repeat, before_each=before_each)
+                results.append({'benchmark': name, 'rows': rows, **measurement, 'error': None})
+            except Exception as error:
+                LOGGER.exception("%s failed at %s rows", name, f"{rows:,}")
+                results.append({'benchmark': name, 'rows': rows, 'error': f"{type(error).__name__}: {error}"})
+
+    return {**environment_info(), 'seed': seed, 'repeat': repeat, 'results': results}
+
+
+# *************** DISPLAY ***************
+def print_results(results: dict, comparisons: list = None) -> None:
+    comparison_by_key = {(entry['benchmark'], entry['rows']): entry for entry in comparisons or []}
+    print(f"{'benchmark':<46} {'rows':>12} {'wall s':>10} {'peak MB':>10}  vs baseline")
+    for entry in results['results']:
+        if entry['error']:
+            print(f"{entry['benchmark']:<46} {entry['rows']:>12,} {'failed':>10} {'':>10}  {entry['error']}")
+            continue
+        comparison = comparison_by_key.get((entry['benchmark'], entry['rows']))
+        versus = '' if comparison is None else \
+            f"time x{comparison['time_ratio']:.2f}, memory x{comparison['memory_ratio']:.2f}" \
+            f"{'  REGRESSION' if comparison['regression'] else ''}"
+        print(f"{entry['benchmark']:<46} {entry['rows']:>12,} {entry['wall_seconds']:>10.3f} "
+              f"{entry['peak_memory_mb']:>10.1f}  {versus}")
+
+
+#*************** Parse the command line
+def parse_args(argv: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the report loaders and dashboard computations on synthetic data.")
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES,
+                        help="Row counts of the synthetic inputs (default: 10000 1000000 10000000)")
+    parser.add_argument('--only', nargs='+', default=None,
+                        help="Run only benchmarks whose name contains one of these strings (e.g. load. jobs.)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed repetitions per benchmark; the fastest counts (default: 3)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed of the synthetic data (default: 0)")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR,
+                        help=f"Directory of the generated synthetic exports (default: {DEFAULT_DATA_DIR})")
+    parser.add_argument('--output', default=None, help="Write the results to this JSON file, e.g. a new baseline")
+    parser.add_argument('--compare', default=None, help="Baseline JSON file to compare the results against")
+    parser.add_argument('--tolerance', type=float, default=BENCHMARK_TOLERANCE,
+                        help=f"Accepted slowdown or memory growth before flagging a regression (default: {BENCHMARK_TOLERANCE})")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    results = run_benchmarks(args.sizes, args.data_dir, args.seed, args.repeat, args.only)
+    comparisons = compare_results(results, load_results(args.compare), args.tolerance) if args.compare else None
+    print_results(results, comparisons)
+
+    if args.output:
+        save_results(results, args.output)
+        LOGGER.info("Results written to %s", args.output)
+
+    if comparisons is not None:
+        regressions = [entry for entry in comparisons if entry['regression']]
+        LOGGER.info("%d of %d benchmarks regressed against %s", len(regressions), len(comparisons), args.compare)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+"""
+Shared helpers for the cost report and job analytics dashboards.
+"""
@@ -0,0 +1,156 @@
+"""
+Chunked streaming ingestion for OpenAI activity CSVs larger than memory.
+
+The file is read in bounded-size chunks. Each chunk is typed with the
+activity schema (categoricals, downcast token counters) and folded into the same rollups the dashboard
+reads (see helper.openai_rollups). Only a bounded reservoir sample of raw
+rows is kept for the Raw Data tab, so peak memory does not grow with the
+input size.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import numpy as np
+import pandas as pd
+
+# *************** IMPORTS: HELPERS ***************
+from helper.multi_file import align_categories
+from helper.openai_rollups import ActivityRollups
+from helper.report_loaders import process_openai_activity_frame
+from helper.schemas import OPENAI_ACTIVITY_SCHEMA, apply_schema, read_dtypes, validate_schema, widen_for_sum
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+DEFAULT_CHUNK_ROWS = 250_000
+DEFAULT_SAMPLE_ROWS = 10_000
+
+# Column holding the position of a sampled row in the source file
+SOURCE_ROW_COLUMN = '_source_row'
+
+
+# *************** HELPERS ***************
+#*************** Merge a chunk-level partial sum into the running total
+def _fold(running: pd.Series | None, partial: pd.Series | None) -> pd.Series | None:
+    if running is None:
+        return partial
+    # Chunks carry their own categories: share their union so the keys stay categorical
+    if isinstance(running.index, pd.CategoricalIndex) and isinstance(partial.index, pd.CategoricalIndex):
+        categories = running.index.categories.union(partial.index.categories, sort=False)
+        running = running.set_axis(running.index.set_categories(categories))
+        partial = partial.set_axis(partial.index.set_categories(categories))
+    return pd.concat([running, partial]).groupby(level=0, observed=True).sum()
+
+
+#*************** Sum a value column per key for a single chunk
+def _partial_sum(chunk: pd.DataFrame, key_column: str) -> pd.Series | None:
+    if key_column not in chunk.columns:
+        return None
+    # Widen to 64 bits so sums across chunks cannot overflow a downcast dtype
+    return widen_for_sum(chunk['num_requests']).groupby(chunk[key_column], observed=True).sum()
+
+
+# *************** MODELS ***************
+class ReservoirSample:
+    """Uniform fixed-size sample of the rows seen so far (Algorithm R, vectorized per chunk)"""
+
+    def __init__(self, capacity: int, seed: int = 0):
+        if capacity <= 0:
+            raise ValueError("Sample capacity must be positive.")
+        self.capacity = capacity
+        self.rows_seen = 0
+        self.rows = None
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        chunk = chunk.assign(**{SOURCE_ROW_COLUMN: np.arange(self.rows_seen, self.rows_seen + len(chunk))})
+
+        # *************** START: Fill The Reservoir ***************
+        current_size = 0 if self.rows is None else len(self.rows)
+        free_slots = max(self.capacity - current_size, 0)
+        if free_slots:
+            head = chunk.iloc[:free_slots]
+            self.rows = head if self.rows is None else pd.concat(align_categories([self.rows, head]), ignore_index=True)
+            self.rows_seen += len(head)
+            chunk = chunk.iloc[free_slots:]
+        if chunk.empty:
+            return
+        # *************** END: Fill The Reservoir ***************
+
+        # *************** START: Replace Random Slots ***************
+        # Row t (0-based over the whole file) is kept with probability capacity / (t + 1)
+        positions = np.arange(self.rows_seen, self.rows_seen + len(chunk))
+        slots = self._rng.integers(0, positions + 1)
+        accepted = np.flatnonzero(slots < self.capacity)
+        self.rows_seen += len(chunk)
+        if accepted.size == 0:
+            return
+
+        # Later rows overwrite earlier ones landing on the same slot
+        reversed_slots = slots[accepted][::-1]
+        _, last_index = np.unique(reversed_slots, return_index=True)
+        winners = accepted[::-1][last_index]
+        evicted = slots[winners]
+
+        kept = np.ones(len(self.rows), dtype=bool)
+        kept[evicted] = False
+        # Each chunk is typed with its own categories; concatenating them as-is falls back to object
+        self.rows = pd.concat(align_categories([self.rows[kept], chunk.iloc[winners]]), ignore_index=True)
+        # *************** END: Replace Random Slots ***************
+
+    def to_frame(self) -> pd.DataFrame:
+        if self.rows is None:
+            return pd.DataFrame()
+        return self.rows.sort_values(SOURCE_ROW_COLUMN).drop(columns=SOURCE_ROW_COLUMN).reset_index(drop=True)
+
+
+# *************** DATA PROCESSING ***************
+#*************** Stream an activity CSV into rollups and a bounded raw-row sample
+def stream_activity_rollups(file_path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                            sample_rows: int = DEFAULT_SAMPLE_ROWS, seed: int = 0) -> tuple:
+    """
+    Read an OpenAI activity CSV in bounded chunks and fold it into dashboard rollups.
+    Args:
+        file_path (str): path to the activity CSV
+        chunk_rows (int): number of rows parsed per chunk
+        sample_rows (int): maximum number of raw rows kept for display
+        seed (int): seed of the reservoir sampler, for reproducible samples
+    Returns:
+        tuple : (ActivityRollups, pd.DataFrame sample of processed raw rows)
+    """
+    # *************** START: Input Validation ***************
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive.")
+    # *************** END: Input Validation ***************
+
+    total_requests = 0
+    total_tokens = 0
+    record_count = 0
+    daily_requests = None
+    model_requests = None
+    user_requests = None
+    sample = ReservoirSample(sample_rows, seed=seed)
+
+    # *************** START: Chunked Fold ***************
+    for chunk in pd.read_csv(file_path, chunksize=chunk_rows, dtype=read_dtypes(OPENAI_ACTIVITY_SCHEMA)):
+        validate_schema(chunk, OPENAI_ACTIVITY_SCHEMA)
+        chunk = apply_schema(process_openai_activity_frame(chunk), OPENAI_ACTIVITY_SCHEMA)
+
+        record_count += len(chunk)
+        total_requests += widen_for_sum(chunk['num_requests']).sum()
+        total_tokens += widen_for_sum(chunk['total_tokens']).sum()
+        daily_requests = _fold(daily_requests, _partial_sum(chunk, 'date'))
+        model_requests = _fold(model_requests, _partial_sum(chunk, 'model'))
+        user_requests = _fold(user_requests, _partial_sum(chunk, 'user'))
+        sample.add(chunk)
+    # *************** END: Chunked Fold ***************
+
+    if daily_requests is None:
+        raise ValueError(f"No rows found in {file_path}")
+
+    rollups = ActivityRollups(
+        total_requests=total_requests,
+        total_tokens=total_tokens,
+        record_count=record_count,
+        daily_requests=daily_requests.sort_index(),
+        model_requests=model_requests.sort_index() if model_requests is not None else None,
+        user_requests=user_requests.sort_index() if user_requests is not None else None,
+    )
+    return rollups, sample.to_frame()
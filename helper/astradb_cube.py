@@ -0,0 +1,125 @@
+"""
+Precomputed rollup cube for the AstraDB usage report.
+
+The cube holds CALCULATED_COST and USAGE sums for every observed combination
+of the report dimensions. Each AstraDB chart and metric then rolls the (much
+smaller) cube up instead of scanning the full line-item table again.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+from dataclasses import dataclass
+
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+CUBE_DIMENSIONS = [
+    'USAGE_TYPE',
+    'REGION',
+    'CLOUD_PROVIDER',
+    'ORG_NAME',
+    'RESOURCE_NAME',
+    'BREAKDOWN_START_TIMESTAMP_DATE',
+]
+CUBE_MEASURES = ['CALCULATED_COST', 'USAGE']
+
+# Extra measures kept per cell: line item count, and position of the first
+# line item so 'first' style lookups keep the original row order
+RECORD_COUNT_COLUMN = 'RECORD_COUNT'
+FIRST_ROW_COLUMN = 'FIRST_ROW'
+
+# Attributes shown next to each resource in the resource breakdown
+RESOURCE_ATTRIBUTES = ['REGION', 'CLOUD_PROVIDER', 'USAGE_TYPE']
+
+
+# *************** MODELS ***************
+@dataclass
+class AstraDBCube:
+    # One row per observed combination of dimensions with the summed measures
+    cells: pd.DataFrame
+    dimensions: list
+    measures: list
+
+    @property
+    def record_count(self) -> int:
+        return int(self.cells[RECORD_COUNT_COLUMN].sum())
+
+    @property
+    def total_cost(self) -> float:
+        return self.cells['CALCULATED_COST'].sum()
+
+    def has_dimension(self, dimension: str) -> bool:
+        return dimension in self.dimensions
+
+    #*************** Roll the cube up to a single dimension
+    def rollup(self, dimension: str, measure: str = 'CALCULATED_COST') -> pd.Series:
+        """
+        Sum a measure per value of one dimension, skipping missing dimension values.
+        Args:
+            dimension (str): dimension column to group by
+            measure (str): measure column to sum
+        Returns:
+            pd.Series : measure totals indexed by dimension value
+        """
+        if dimension not in self.dimensions:
+            raise KeyError(f"'{dimension}' is not a dimension of this cube")
+        if measure not in self.measures:
+            raise KeyError(f"'{measure}' is not a measure of this cube")
+        return self.cells.groupby(dimension, observed=True)[measure].sum()
+
+    def nunique(self, dimension: str) -> int:
+        if dimension not in self.dimensions:
+            raise KeyError(f"'{dimension}' is not a dimension of this cube")
+        return self.cells[dimension].nunique()
+
+    #*************** Per-resource totals with the first seen region, provider and usage type
+    def resource_breakdown(self) -> pd.DataFrame:
+        """
+        Build the resource breakdown table: measure totals per resource and the
+        first non-missing attribute values in original line-item order.
+        Returns:
+            pd.DataFrame : one row per RESOURCE_NAME
+        """
+        ordered_cells = self.cells.sort_values(FIRST_ROW_COLUMN, kind='stable')
+        aggregations = {measure: 'sum' for measure in self.measures}
+        for attribute in RESOURCE_ATTRIBUTES:
+            if attribute in self.dimensions:
+                aggregations[attribute] = 'first'
+
+        breakdown = ordered_cells.groupby('RESOURCE_NAME', observed=True).agg(aggregations)
+        for attribute in RESOURCE_ATTRIBUTES:
+            if attribute not in breakdown.columns:
+                breakdown[attribute] = 'N/A'
+        return breakdown[self.measures + RESOURCE_ATTRIBUTES]
+
+
+# *************** DATA PROCESSING ***************
+#*************** Build the cube from the processed AstraDB line items
+def build_astradb_cube(df: pd.DataFrame) -> AstraDBCube:
+    """
+    Aggregate AstraDB line items into a cube over every available report dimension.
+    Args:
+        df (pd.DataFrame): processed AstraDB frame with CALCULATED_COST and RESOURCE_NAME
+    Returns:
+        AstraDBCube : summed measures per observed dimension combination
+    """
+    # *************** START: Input Validation ***************
+    missing_columns = [col for col in ['CALCULATED_COST', 'RESOURCE_NAME'] if col not in df.columns]
+    if missing_columns:
+        raise ValueError(f"AstraDB data is missing required columns: {', '.join(missing_columns)}")
+    # *************** END: Input Validation ***************
+
+    dimensions = [col for col in CUBE_DIMENSIONS if col in df.columns]
+    measures = [col for col in CUBE_MEASURES if col in df.columns]
+
+    # *************** START: Single Grouped Pass ***************
+    line_items = df[dimensions + measures].reset_index(drop=True)
+    line_items[FIRST_ROW_COLUMN] = line_items.index
+    aggregations = {measure: 'sum' for measure in measures}
+    aggregations[FIRST_ROW_COLUMN] = ['min', 'size']
+
+    cells = line_items.groupby(dimensions, dropna=False, observed=True, sort=False).agg(aggregations)
+    cells.columns = measures + [FIRST_ROW_COLUMN, RECORD_COUNT_COLUMN]
+    cells = cells.reset_index()
+    # *************** END: Single Grouped Pass ***************
+
+    return AstraDBCube(cells=cells, dimensions=dimensions, measures=measures)
@@ -0,0 +1,315 @@
+"""
+Persistent incremental store for AstraDB usage reports.
+
+Each daily report repeats the whole history. Instead of re-reading it, the
+store records every ingested usage range (organization and
+BREAKDOWN_START/END timestamps) in its state file, with the number of line
+items and a digest of their contents. An ingest compares the report's
+ranges with that record and writes only the ranges that are new or that the
+report restates: a restated range replaces the stored line items of that
+range, so late or corrected items never count twice. Ranges the report no
+longer covers (older history, an organization dropped from the report) stay
+in the store.
+
+Line items are kept as one Parquet part per day of BREAKDOWN_START, next
+to a cube (see helper.astradb_cube) of that day. An ingest reads and
+rewrites only the days holding new or restated ranges, so a daily refresh
+costs time proportional to the new data, not the whole history.
+
+The state file is written last and lists the part and cube of each day.
+Files a crashed ingest left behind are not listed, are ignored on load and
+are removed by the next ingest.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import glob
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+# *************** IMPORTS: MODELS ***************
+from helper.astradb_cube import FIRST_ROW_COLUMN, AstraDBCube, build_astradb_cube
+
+# *************** IMPORTS: HELPERS ***************
+from helper.multi_file import align_categories
+from helper.parquet_cache import REPORT_CACHE_DIR
+from helper.report_loaders import ASTRADB_NUMERIC_COLUMNS, ASTRADB_TIMESTAMP_COLUMNS, read_astradb_csv
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+ASTRADB_STORE_DIR = os.path.join(REPORT_CACHE_DIR, 'astradb_store')
+
+# Bump when the layout of parts, cubes or state changes
+STORE_VERSION = 3
+
+STATE_FILE_NAME = 'state.json'
+PARTS_DIR_NAME = 'parts'
+CUBES_DIR_NAME = 'cubes'
+
+# Columns identifying a usage range; a report restating a range replaces it
+RANGE_COLUMNS = ['ORG_NAME'] + ASTRADB_TIMESTAMP_COLUMNS
+
+# Hash of a line item's range, stored in each part to replace restated ranges
+RANGE_KEY_COLUMN = '_RANGE_KEY'
+
+# Position of a line item in the report that wrote it. Reports repeat the
+# history in the same order, so it orders 'first seen' cube lookups as the
+# full report would
+REPORT_ROW_COLUMN = '_REPORT_ROW'
+
+# Day of the part holding line items without a BREAKDOWN_START_TIMESTAMP
+UNDATED_DAY = 'undated'
+
+# Columns derived from others, left out of a line item's identity
+DERIVED_COLUMNS = [f'{col}_DATE' for col in ASTRADB_TIMESTAMP_COLUMNS]
+
+_STORE_LOCK = threading.Lock()
+
+
+# *************** CUSTOM EXCEPTIONS ***************
+class AstraDBStoreError(Exception):
+    pass
+
+
+# *************** HELPERS: STATE ***************
+def _empty_state() -> dict:
+    return {
+        'store_version': STORE_VERSION,
+        'generation': 0,
+        'key_columns': [],
+        'dimensions': [],
+        'measures': [],
+        'ranges': {},
+        'days': {},
+    }
+
+
+def _read_state(store_dir: str) -> dict:
+    state_path = os.path.join(store_dir, STATE_FILE_NAME)
+    if not os.path.exists(state_path):
+        return _empty_state()
+    try:
+        with open(state_path, 'r', encoding='utf-8') as state_file:
+            state = json.load(state_file)
+    except (OSError, ValueError) as error:
+        raise AstraDBStoreError(f"Unreadable AstraDB store state {state_path}: {error}")
+    if state.get('store_version') != STORE_VERSION:
+        raise AstraDBStoreError(
+            f"AstraDB store at {store_dir} has version {state.get('store_version')}, "
+            f"expected {STORE_VERSION}; delete the directory to rebuild it."
+        )
+    return state
+
+
+def _write_state(store_dir: str, state: dict) -> None:
+    state_path = os.path.join(store_dir, STATE_FILE_NAME)
+    temp_path = f"{state_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as state_file:
+        json.dump(state, state_file)
+    os.replace(temp_path, state_path)
+
+
+def _write_parquet(df: pd.DataFrame, target_path: str) -> None:
+    temp_path = f"{target_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    df.to_parquet(temp_path, index=False)
+    os.replace(temp_path, target_path)
+
+
+#*************** Delete part and cube files the state does not list
+def _remove_unlisted_files(store_dir: str, state: dict) -> None:
+    listed = {os.path.join(store_dir, PARTS_DIR_NAME, day['part']) for day in state['days'].values()}
+    listed |= {os.path.join(store_dir, CUBES_DIR_NAME, day['cube']) for day in state['days'].values()}
+    for directory in [PARTS_DIR_NAME, CUBES_DIR_NAME]:
+        for file_path in glob.glob(os.path.join(store_dir, directory, '*')):
+            if file_path not in listed:
+                os.remove(file_path)
+
+
+def _check_schema(state: dict, name: str, values: list) -> None:
+    if state[name] and state[name] != values:
+        raise AstraDBStoreError(
+            f"AstraDB report {name.replace('_', ' ')} {values} differ from the stored {state[name]}; "
+            f"use a separate store or delete the existing one to rebuild it."
+        )
+
+
+# *************** HELPERS: IDENTITY ***************
+#*************** Hash the identity of every line item
+def line_item_keys(df: pd.DataFrame, key_columns: list) -> pd.Series:
+    """
+    Hash each line item's identity columns together with its occurrence number
+    among rows sharing them, so repeated rows stay distinct.
+    Args:
+        df (pd.DataFrame): processed AstraDB frame
+        key_columns (list): identity columns (dimensions and range, no measures)
+    Returns:
+        pd.Series : uint64 key per row
+    """
+    identity = df[key_columns].copy()
+    identity['_OCCURRENCE'] = identity.groupby(key_columns, dropna=False, observed=True).cumcount()
+    return pd.util.hash_pandas_object(identity, index=False)
+
+
+#*************** Summarize the ranges of a report
+def report_ranges(df: pd.DataFrame, key_columns: list) -> tuple:
+    """
+    Hash the range of every line item and digest the contents of each range.
+    A range digest combines the identity and measures of its line items, so it
+    changes when the report adds, drops or restates an item of the range.
+    Args:
+        df (pd.DataFrame): processed AstraDB frame
+        key_columns (list): non-derived report columns
+    Returns:
+        tuple : (uint64 range key per row, pd.DataFrame indexed by range key
+                 with digest, rows and day)
+    """
+    range_columns = [col for col in RANGE_COLUMNS if col in df.columns]
+    measure_columns = [col for col in key_columns if col in ASTRADB_NUMERIC_COLUMNS]
+    identity_columns = [col for col in key_columns if col not in ASTRADB_NUMERIC_COLUMNS]
+
+    range_keys = pd.util.hash_pandas_object(df[range_columns], index=False).to_numpy()
+    item_digests = pd.util.hash_pandas_object(
+        df[measure_columns].assign(_LINE_ITEM_KEY=line_item_keys(df, identity_columns).to_numpy()), index=False
+    ).to_numpy()
+
+    # uint64 sums wrap around, which keeps the digest independent of row order
+    ranges = pd.DataFrame({
+        'digest': item_digests,
+        'rows': 1,
+        'start': df['BREAKDOWN_START_TIMESTAMP'].to_numpy(),
+    }).groupby(range_keys, sort=False).agg(digest=('digest', 'sum'), rows=('rows', 'sum'), start=('start', 'first'))
+    ranges['day'] = pd.to_datetime(ranges['start'], errors='coerce').dt.strftime('%Y-%m-%d').fillna(UNDATED_DAY)
+    return range_keys, ranges.drop(columns='start')
+
+
+# *************** DATA PROCESSING ***************
+#*************** Store the new and restated ranges of a report
+def ingest_astradb_report(file_path: str, store_dir: str = ASTRADB_STORE_DIR) -> tuple:
+    """
+    Write the ranges of a report that are not stored yet or that it restates,
+    rewriting only the daily parts and cubes holding them.
+    Args:
+        file_path (str): path to the AstraDB report CSV
+        store_dir (str): store directory
+    Returns:
+        tuple : (store directory, number of line items written)
+    """
+    # *************** START: Input Validation ***************
+    if not os.path.isfile(file_path):
+        raise AstraDBStoreError(f"File not found: {file_path}")
+    # *************** END: Input Validation ***************
+
+    df = read_astradb_csv(file_path)
+    if 'BREAKDOWN_START_TIMESTAMP' not in df.columns:
+        raise AstraDBStoreError(f"{file_path} has no BREAKDOWN_START_TIMESTAMP column to detect new ranges.")
+    key_columns = [col for col in df.columns if col not in DERIVED_COLUMNS]
+
+    with _STORE_LOCK:
+        os.makedirs(os.path.join(store_dir, PARTS_DIR_NAME), exist_ok=True)
+        os.makedirs(os.path.join(store_dir, CUBES_DIR_NAME), exist_ok=True)
+        state = _read_state(store_dir)
+        _check_schema(state, 'key_columns', key_columns)
+
+        # *************** START: Detect New And Restated Ranges ***************
+        range_keys, ranges = report_ranges(df, key_columns)
+        range_ids = [f"{key:016x}" for key in ranges.index]
+        changed = np.array([
+            state['ranges'].get(range_id) != {'digest': f"{digest:016x}", 'rows': int(rows), 'day': day}
+            for range_id, digest, rows, day in zip(range_ids, ranges['digest'], ranges['rows'], ranges['day'])
+        ], dtype=bool)
+        if not changed.any():
+            return store_dir, 0
+        changed_ranges = ranges[changed]
+        # *************** END: Detect New And Restated Ranges ***************
+
+        # *************** START: Rewrite Touched Days ***************
+        # Files are named after the new generation; they only count once the state lists them
+        generation = state['generation'] + 1
+        written_rows = 0
+        for day, day_ranges in changed_ranges.groupby('day', sort=True):
+            is_new = np.isin(range_keys, day_ranges.index.to_numpy())
+            new_rows = df[is_new].assign(**{
+                RANGE_KEY_COLUMN: range_keys[is_new],
+                REPORT_ROW_COLUMN: np.flatnonzero(is_new),
+            })
+            written_rows += len(new_rows)
+
+            stored = state['days'].get(day)
+            if stored:
+                # Restated ranges replace their stored line items
+                kept_rows = pd.read_parquet(os.path.join(store_dir, PARTS_DIR_NAME, stored['part']))
+                kept_rows = kept_rows[~kept_rows[RANGE_KEY_COLUMN].isin(day_ranges.index)]
+                new_rows = pd.concat(align_categories([kept_rows, new_rows]), ignore_index=True)
+            new_rows = new_rows.sort_values(REPORT_ROW_COLUMN, kind='stable').reset_index(drop=True)
+
+            cube = build_astradb_cube(new_rows)
+            # Cube row positions point into this part; store report positions instead
+            report_rows = new_rows[REPORT_ROW_COLUMN].to_numpy()
+            cube.cells[FIRST_ROW_COLUMN] = report_rows[cube.cells[FIRST_ROW_COLUMN].to_numpy()]
+            _check_schema(state, 'dimensions', cube.dimensions)
+            _check_schema(state, 'measures', cube.measures)
+            state.update({'dimensions': cube.dimensions, 'measures': cube.measures})
+
+            day_files = {
+                'part': f"part-{day}-{generation:06d}.parquet",
+                'cube': f"cube-{day}-{generation:06d}.parquet",
+            }
+            _write_parquet(new_rows, os.path.join(store_dir, PARTS_DIR_NAME, day_files['part']))
+            _write_parquet(cube.cells, os.path.join(store_dir, CUBES_DIR_NAME, day_files['cube']))
+            state['days'][day] = day_files
+        # *************** END: Rewrite Touched Days ***************
+
+        for range_id, digest, rows, day in zip(
+            np.array(range_ids)[changed], changed_ranges['digest'], changed_ranges['rows'], changed_ranges['day']
+        ):
+            state['ranges'][range_id] = {'digest': f"{digest:016x}", 'rows': int(rows), 'day': day}
+        state.update({'generation': generation, 'key_columns': key_columns})
+        _write_state(store_dir, state)
+        _remove_unlisted_files(store_dir, state)
+
+    return store_dir, written_rows
+
+
+#*************** Read every stored line item
+def load_astradb_store_frame(store_dir: str) -> pd.DataFrame:
+    """
+    Concatenate every stored part into the full line-item history.
+    Args:
+        store_dir (str): store directory returned by ingest_astradb_report
+    Returns:
+        pd.DataFrame : line items ordered by day
+    """
+    state = _read_state(store_dir)
+    if not state['days']:
+        raise AstraDBStoreError(f"The AstraDB store at {store_dir} is empty.")
+    frames = [
+        pd.read_parquet(os.path.join(store_dir, PARTS_DIR_NAME, state['days'][day]['part']), memory_map=True)
+        .drop(columns=[RANGE_KEY_COLUMN, REPORT_ROW_COLUMN])
+        for day in sorted(state['days'])
+    ]
+    return pd.concat(align_categories(frames), ignore_index=True)
+
+
+#*************** Read the cubes of every day as one
+def load_astradb_store_cube(store_dir: str) -> AstraDBCube:
+    """
+    Load the cube covering every stored line item.
+    Args:
+        store_dir (str): store directory returned by ingest_astradb_report
+    Returns:
+        AstraDBCube : cube over the whole stored history
+    """
+    state = _read_state(store_dir)
+    if not state['days']:
+        raise AstraDBStoreError(f"The AstraDB store at {store_dir} is empty.")
+    # Daily cells are concatenated without regrouping: every cube lookup sums
+    # over cells, so repeated dimension combinations stay correct
+    frames = [pd.read_parquet(os.path.join(store_dir, CUBES_DIR_NAME, state['days'][day]['cube']), memory_map=True)
+              for day in sorted(state['days'])]
+    return AstraDBCube(
+        cells=pd.concat(align_categories(frames), ignore_index=True),
+        dimensions=state['dimensions'],
+        measures=state['measures'],
+    )
@@ -0,0 +1,277 @@
+"""
+Headless generation of the OpenAI and AstraDB reports for a directory tree.
+
+Every directory holding cost-*.csv or activity-*.csv exports becomes one
+OpenAI report, and every report-*.csv file one AstraDB report. Each report
+goes through the same loaders, rollups, summary metrics and figures as the
+dashboard, and is written as JSON, HTML and/or static images. Reports are
+independent, so they are generated on a process pool, one report per task.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import html
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+# *************** IMPORTS: HELPERS ***************
+from helper.astradb_cube import build_astradb_cube
+from helper.multi_file import OPENAI_ACTIVITY_EXPORT_PATTERN, OPENAI_COST_EXPORT_PATTERN, load_exports, resolve_export_paths
+from helper.openai_rollups import build_activity_rollups, build_cost_rollups
+from helper.parquet_cache import load_cached_frame
+from helper.report_figures import astradb_report_figures, openai_report_figures
+from helper.report_loaders import read_astradb_csv, read_openai_activity_csv, read_openai_cost_csv
+from helper.report_summaries import (
+    ASTRADB_RECOMMENDATIONS,
+    OPENAI_RECOMMENDATIONS,
+    astradb_summary_insights,
+    astradb_summary_metrics,
+    openai_summary_insights,
+    openai_summary_metrics,
+)
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# File name pattern of the AstraDB usage reports
+ASTRADB_REPORT_PATTERN = 'report-*.csv'
+
+# Output formats; image formats need the optional kaleido package
+REPORT_FORMATS = ['json', 'html', 'png', 'svg']
+IMAGE_FORMATS = ['png', 'svg']
+
+# Name of the file listing every generated report
+BATCH_INDEX_FILE_NAME = 'index.json'
+
+LOGGER = logging.getLogger(__name__)
+
+
+# *************** CUSTOM EXCEPTIONS ***************
+class BatchReportError(Exception):
+    pass
+
+
+# *************** MODELS ***************
+@dataclass
+class ReportJob:
+    # 'openai' or 'astradb'
+    kind: str
+    # Output path without extension, relative to the output directory
+    name: str
+    cost_paths: list = field(default_factory=list)
+    activity_paths: list = field(default_factory=list)
+    astradb_path: str = None
+
+
+# *************** HELPERS ***************
+#*************** Convert summary values to JSON-compatible builtins
+def _to_builtin(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+#*************** Render the markdown emphasis used by the insight lines
+def _markdown_line_to_html(line: str) -> str:
+    return re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html.escape(line))
+
+
+def _check_image_support(formats: list) -> None:
+    if any(fmt in IMAGE_FORMATS for fmt in formats):
+        try:
+            import kaleido  # noqa: F401
+        except ImportError as error:
+            raise BatchReportError("Image output (png, svg) requires the kaleido package: pip install kaleido") from error
+
+
+# *************** DATA PROCESSING: DISCOVERY ***************
+#*************** Find every OpenAI and AstraDB report below a directory
+def discover_report_jobs(input_dir: str) -> list:
+    """
+    Walk a directory tree and list the reports to generate.
+    Args:
+        input_dir (str): root directory of the monthly exports
+    Returns:
+        list : ReportJob per OpenAI export directory and per AstraDB report, in path order
+    """
+    # *************** START: Input Validation ***************
+    if not os.path.isdir(input_dir):
+        raise BatchReportError(f"Input directory not found: {input_dir}")
+    # *************** END: Input Validation ***************
+
+    jobs = []
+    for directory, subdirectories, _ in os.walk(input_dir):
+        subdirectories.sort()
+        relative_dir = os.path.relpath(directory, input_dir)
+        relative_dir = '' if relative_dir == os.curdir else relative_dir
+
+        cost_paths = resolve_export_paths(directory, OPENAI_COST_EXPORT_PATTERN)
+        activity_paths = resolve_export_paths(directory, OPENAI_ACTIVITY_EXPORT_PATTERN)
+        if cost_paths or activity_paths:
+            jobs.append(ReportJob(
+                kind='openai',
+                name=os.path.join(relative_dir, 'openai'),
+                cost_paths=cost_paths,
+                activity_paths=activity_paths,
+            ))
+
+        for astradb_path in resolve_export_paths(directory, ASTRADB_REPORT_PATTERN):
+            stem = os.path.splitext(os.path.basename(astradb_path))[0]
+            jobs.append(ReportJob(kind='astradb', name=os.path.join(relative_dir, f"astradb-{stem}"), astradb_path=astradb_path))
+    return jobs
+
+
+# *************** DATA PROCESSING: REPORTS ***************
+#*************** Compute the summary and charts of one report
+def build_report(job: ReportJob) -> tuple:
+    """
+    Load a report's exports and compute the same summary and charts as the dashboard.
+    Args:
+        job (ReportJob): report to compute
+    Returns:
+        tuple : (summary dict ready for JSON, chart name to plotly figure)
+    """
+    if job.kind == 'openai':
+        cost_rollups = build_cost_rollups(load_exports(job.cost_paths, 'openai_cost', read_openai_cost_csv)) \
+            if job.cost_paths else None
+        activity_rollups = build_activity_rollups(load_exports(job.activity_paths, 'openai_activity', read_openai_activity_csv)) \
+            if job.activity_paths else None
+        metrics = openai_summary_metrics(cost_rollups, activity_rollups)
+        insights = openai_summary_insights(metrics)
+        recommendations = OPENAI_RECOMMENDATIONS
+        figures = openai_report_figures(cost_rollups, activity_rollups)
+        sources = job.cost_paths + job.activity_paths
+    elif job.kind == 'astradb':
+        cube = build_astradb_cube(load_cached_frame(job.astradb_path, 'astradb', read_astradb_csv))
+        metrics = astradb_summary_metrics(cube)
+        insights = astradb_summary_insights(metrics)
+        recommendations = ASTRADB_RECOMMENDATIONS
+        figures = astradb_report_figures(cube)
+        sources = [job.astradb_path]
+    else:
+        raise BatchReportError(f"Unknown report kind '{job.kind}'")
+
+    summary = {
+        'report': job.kind,
+        'name': job.name,
+        'sources': sources,
+        'metrics': {key: _to_builtin(value) for key, value in metrics.items()},
+        'insights': insights,
+        'recommendations': recommendations,
+        'charts': list(figures),
+    }
+    return summary, figures
+
+
+#*************** Write one report in the requested formats
+def write_report(summary: dict, figures: dict, base_path: str, formats: list) -> list:
+    """
+    Write a computed report next to base_path.
+    Args:
+        summary (dict): output of build_report
+        figures (dict): chart name to plotly figure
+        base_path (str): output path without extension
+        formats (list): subset of REPORT_FORMATS
+    Returns:
+        list : paths of the written files
+    """
+    os.makedirs(os.path.dirname(base_path) or os.curdir, exist_ok=True)
+    written = []
+
+    if 'json' in formats:
+        with open(f"{base_path}.json", 'w', encoding='utf-8') as json_file:
+            json.dump(summary, json_file, indent=2, ensure_ascii=False)
+        written.append(f"{base_path}.json")
+
+    if 'html' in formats:
+        title = f"{'OpenAI' if summary['report'] == 'openai' else 'AstraDB'} report: {summary['name']}"
+        sections = [
+            f"<h1>{html.escape(title)}</h1>",
+            "<h2>Key Findings</h2><ul>",
+            *[f"<li>{_markdown_line_to_html(line)}</li>" for line in summary['insights']],
+            "</ul><h2>Recommendations</h2><ul>",
+            *[f"<li>{_markdown_line_to_html(line)}</li>" for line in summary['recommendations']],
+            "</ul>",
+        ]
+        # plotly.js is loaded once, from the CDN, by the first chart
+        for position, fig in enumerate(figures.values()):
+            sections.append(fig.to_html(full_html=False, include_plotlyjs='cdn' if position == 0 else False))
+        with open(f"{base_path}.html", 'w', encoding='utf-8') as html_file:
+            html_file.write(f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head>"
+                            f"<body>\n{chr(10).join(sections)}\n</body></html>\n")
+        written.append(f"{base_path}.html")
+
+    for image_format in [fmt for fmt in formats if fmt in IMAGE_FORMATS]:
+        for chart_name, fig in figures.items():
+            image_path = f"{base_path}-{chart_name}.{image_format}"
+            fig.write_image(image_path)
+            written.append(image_path)
+
+    return written
+
+
+#*************** Compute and write one report, reporting failures instead of raising
+def run_report_job(job: ReportJob, output_dir: str, formats: list) -> dict:
+    """
+    Generate one report; runs inside a worker process.
+    Args:
+        job (ReportJob): report to generate
+        output_dir (str): root output directory
+        formats (list): subset of REPORT_FORMATS
+    Returns:
+        dict : name, kind, written files and the error message (None on success)
+    """
+    try:
+        summary, figures = build_report(job)
+        outputs = write_report(summary, figures, os.path.join(output_dir, job.name), formats)
+        return {'name': job.name, 'kind': job.kind, 'outputs': outputs, 'error': None}
+    except Exception as error:
+        LOGGER.exception("Report %s failed", job.name)
+        return {'name': job.name, 'kind': job.kind, 'outputs': [], 'error': str(error)}
+
+
+#*************** Generate every report below a directory on a process pool
+def generate_reports(input_dir: str, output_dir: str, formats: list, max_workers: int = None) -> list:
+    """
+    Discover, compute and write every report of a directory tree in parallel.
+    Args:
+        input_dir (str): root directory of the monthly exports
+        output_dir (str): root output directory, mirroring the input layout
+        formats (list): subset of REPORT_FORMATS
+        max_workers (int): worker processes, os.cpu_count() when None; 1 runs in-process
+    Returns:
+        list : result dict of run_report_job per report, in discovery order
+    """
+    # *************** START: Input Validation ***************
+    unknown_formats = [fmt for fmt in formats if fmt not in REPORT_FORMATS]
+    if unknown_formats:
+        raise BatchReportError(f"Unknown report formats: {', '.join(unknown_formats)}. Expected {REPORT_FORMATS}.")
+    _check_image_support(formats)
+    # *************** END: Input Validation ***************
+
+    jobs = discover_report_jobs(input_dir)
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs) or 1))
+    LOGGER.info("Generating %d reports with %d workers", len(jobs), max_workers)
+
+    # *************** START: Parallel Generation ***************
+    if max_workers == 1:
+        results = [run_report_job(job, output_dir, formats) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_report_job, job, output_dir, formats) for job in jobs]
+            results = [future.result() for future in futures]
+    # *************** END: Parallel Generation ***************
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, BATCH_INDEX_FILE_NAME), 'w', encoding='utf-8') as index_file:
+        json.dump({'generated_at': datetime.now().isoformat(timespec='seconds'), 'reports': results}, index_file, indent=2)
+    return results
@@ -0,0 +1,132 @@
+"""
+Timing, peak-memory measurement and baseline comparison for benchmark.py.
+
+Each benchmark first runs once under tracemalloc for its peak allocation,
+then is timed over a few repetitions (the fastest counts, the others are kept
+for reference). tracemalloc sees the allocations of Python, NumPy and pandas but
+not memory pyarrow allocates on its own pool, so Parquet-heavy steps read low.
+Results are saved as JSON and compared against a saved baseline.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import gc
+import json
+import os
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Slowdown (or memory growth) above which a benchmark counts as a regression
+BENCHMARK_TOLERANCE = float(os.getenv('BENCHMARK_TOLERANCE', '0.25'))
+
+# Differences below these are treated as noise, whatever the ratio
+BENCHMARK_MIN_SECONDS = 0.05
+BENCHMARK_MIN_MEMORY_MB = 16.0
+
+_BYTES_PER_MB = 1024 ** 2
+
+
+# *************** DATA PROCESSING: MEASUREMENT ***************
+#*************** Time a function and record its peak allocation
+def measure(run, repeat: int = 3, before_each=None) -> dict:
+    """
+    Run a benchmark function once under tracemalloc for peak memory, then
+    repeat times for wall time.
+    Args:
+        run (callable): takes no argument; its return value is discarded
+        repeat (int): timed repetitions
+        before_each (callable): called before every run, outside the timing (e.g. to clear caches)
+    Returns:
+        dict : wall_seconds (fastest run), wall_seconds_runs and peak_memory_mb
+    """
+    # The traced run comes first and doubles as warm-up (imports, lazy initialization)
+    if before_each is not None:
+        before_each()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings = []
+    for _ in range(max(repeat, 1)):
+        if before_each is not None:
+            before_each()
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+
+    return {
+        'wall_seconds': round(min(timings), 6),
+        'wall_seconds_runs': [round(timing, 6) for timing in timings],
+        'peak_memory_mb': round(peak / _BYTES_PER_MB, 3),
+    }
+
+
+#*************** Describe the machine and library versions behind a result file
+def environment_info() -> dict:
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+    }
+
+
+# *************** DATA PROCESSING: BASELINES ***************
+def save_results(results: dict, file_path: str) -> None:
+    os.makedirs(os.path.dirname(file_path) or os.curdir, exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as results_file:
+        json.dump(results, results_file, indent=2)
+
+
+def load_results(file_path: str) -> dict:
+    with open(file_path, 'r', encoding='utf-8') as results_file:
+        return json.load(results_file)
+
+
+#*************** Compare a run against a saved baseline
+def compare_results(current: dict, baseline: dict, tolerance: float = BENCHMARK_TOLERANCE) -> list:
+    """
+    Match benchmarks by name and row count and flag those slower, or using
+    more memory, than the baseline by more than the tolerance.
+    Args:
+        current (dict): results of this run
+        baseline (dict): saved baseline results
+        tolerance (float): accepted relative increase, e.g. 0.25 for +25%
+    Returns:
+        list : one dict per benchmark present in both, with the ratios and a regression flag
+    """
+    baseline_by_key = {(entry['benchmark'], entry['rows']): entry
+                       for entry in baseline.get('results', []) if not entry.get('error')}
+    comparisons = []
+    for entry in current.get('results', []):
+        reference = baseline_by_key.get((entry['benchmark'], entry['rows']))
+        if reference is None or entry.get('error'):
+            continue
+
+        time_ratio = entry['wall_seconds'] / max(reference['wall_seconds'], 1e-9)
+        memory_ratio = entry['peak_memory_mb'] / max(reference['peak_memory_mb'], 1e-9)
+        slower = (time_ratio > 1 + tolerance
+                  and entry['wall_seconds'] - reference['wall_seconds'] > BENCHMARK_MIN_SECONDS)
+        larger = (memory_ratio > 1 + tolerance
+                  and entry['peak_memory_mb'] - reference['peak_memory_mb'] > BENCHMARK_MIN_MEMORY_MB)
+        comparisons.append({
+            'benchmark': entry['benchmark'],
+            'rows': entry['rows'],
+            'time_ratio': round(time_ratio, 3),
+            'memory_ratio': round(memory_ratio, 3),
+            'regression': slower or larger,
+        })
+    return comparisons
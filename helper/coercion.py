@@ -0,0 +1,71 @@
+"""
+Vectorized value coercion for scraped job data.
+
+Scraped columns mix booleans, numbers and free-text flags ("Yes", "remote",
+"1"). The helpers here map a whole column in one pass, dispatching on its
+dtype, instead of calling a Python function on every row.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import numpy as np
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Lowercased, stripped strings read as True; every other string reads as False
+TRUE_STRINGS = frozenset({'true', '1', 'yes', 'remote', 'y'})
+
+# Yes/no style columns of the scraped job dataset
+JOB_BOOLEAN_COLUMNS = ['remote_working']
+
+
+# *************** DATA PROCESSING ***************
+#*************** Coerce the strings of a column through the lookup table
+def _coerce_strings(strings: pd.Series, true_values: frozenset) -> pd.Series:
+    return strings.str.strip().str.lower().isin(true_values)
+
+
+#*************** Map a mixed yes/no column to plain booleans in one pass
+def coerce_boolean(series: pd.Series, true_values: frozenset = TRUE_STRINGS) -> pd.Series:
+    """
+    Convert a column of booleans, numbers and yes/no strings to a bool column.
+    Missing values are False, numbers are True when non-zero, strings are True
+    when their lowercased, stripped form is in true_values.
+    Args:
+        series (pd.Series): column to coerce
+        true_values (frozenset): lowercase strings that read as True
+    Returns:
+        pd.Series : bool column with the same index
+    """
+    dtype = series.dtype
+
+    # *************** START: Dtype Dispatch ***************
+    if dtype == bool:
+        return series
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Coerce each category once and broadcast through the codes
+        category_values = coerce_boolean(pd.Series(dtype.categories), true_values).to_numpy()
+        # Missing values have code -1, which picks the False appended last
+        codes = series.cat.codes.to_numpy()
+        return pd.Series(np.append(category_values, False)[codes], index=series.index)
+    if pd.api.types.is_bool_dtype(dtype):
+        return series.fillna(False).astype(bool)
+    if pd.api.types.is_numeric_dtype(dtype):
+        return series.fillna(0).astype(bool)
+    if pd.api.types.is_string_dtype(dtype) and not pd.api.types.is_object_dtype(dtype):
+        return _coerce_strings(series, true_values).fillna(False).astype(bool)
+    # *************** END: Dtype Dispatch ***************
+
+    # *************** START: Mixed Object Column ***************
+    # .str yields NaN for every non-string entry, which then goes through the numeric path
+    try:
+        strings = series.str.strip()
+    except AttributeError:
+        # No string entries at all
+        strings = pd.Series(index=series.index, dtype=object)
+    is_string = strings.notna()
+    result = strings.str.lower().isin(true_values) & is_string
+    numbers = pd.to_numeric(series.where(~is_string), errors='coerce')
+    result |= numbers.fillna(0).astype(bool)
+    # *************** END: Mixed Object Column ***************
+
+    return result
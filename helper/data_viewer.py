@@ -0,0 +1,133 @@
+"""
+Paginated Raw Data viewer for the dashboards.
+
+st.dataframe serializes every row it is given to the browser, which freezes
+the Raw Data tabs on large reports. The viewer keeps the frame on the server:
+sorting and column projection are applied here, and only the rows of the
+current page are handed to st.dataframe. The sort order of a column is
+memoized per session, so flipping pages does not sort the frame again.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# *************** IMPORTS: HELPERS ***************
+from helper.figure_cache import fingerprint
+from helper.lazy_sections import memoize_section
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Rows per page offered to the user
+DATA_VIEWER_PAGE_SIZES = [25, 50, 100, 250, 500]
+DATA_VIEWER_DEFAULT_PAGE_SIZE = 100
+
+# Sort option keeping the order the frame was given in (e.g. search ranking)
+ORIGINAL_ORDER = "(original order)"
+
+
+# *************** DATA PROCESSING ***************
+#*************** Row positions of a column in sorted order
+def sort_positions(series: pd.Series, ascending: bool = True) -> np.ndarray:
+    """
+    Sort a column through its factorized codes, so text columns are sorted by
+    their distinct values only. Missing values go last and ties keep row order.
+    Args:
+        series (pd.Series): column to sort on
+        ascending (bool): sort direction
+    Returns:
+        np.ndarray : row positions in sorted order
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categories sort in category order, as sort_values does
+        codes, unique_count = series.cat.codes.to_numpy().astype(np.int64), len(series.cat.categories)
+    else:
+        try:
+            codes, uniques = pd.factorize(series, sort=True)
+        except TypeError:
+            # Mixed types that do not compare: sort on their text
+            codes, uniques = pd.factorize(series.astype(object).where(series.notna()).map(str, na_action='ignore'), sort=True)
+        unique_count = len(uniques)
+
+    keys = codes if ascending else unique_count - 1 - codes
+    keys = np.where(codes < 0, unique_count, keys)
+    return np.argsort(keys, kind='stable')
+
+
+#*************** Bounds of one page
+def page_bounds(page: int, page_size: int, row_count: int) -> tuple:
+    """
+    First and last (exclusive) row positions of a page, clamped to the frame.
+    Args:
+        page (int): 1-based page number
+        page_size (int): rows per page
+        row_count (int): number of rows being paged
+    Returns:
+        tuple : (start, stop) positions
+    """
+    start = min(max(page - 1, 0) * page_size, row_count)
+    return start, min(start + page_size, row_count)
+
+
+# *************** DISPLAY ***************
+#*************** Render one page of a frame with sort and column controls
+def show_paginated_dataframe(df: pd.DataFrame, key: str, page_sizes: list = None, state_key=None,
+                             **dataframe_kwargs) -> None:
+    """
+    Show a frame one page at a time. Sorting and column selection happen on
+    the server, so only the visible window of rows is sent to the browser.
+    Args:
+        df (pd.DataFrame): frame to browse
+        key (str): widget key prefix, unique per viewer on the page
+        page_sizes (list): rows per page options (DATA_VIEWER_PAGE_SIZES by default)
+        state_key: hashable description of the frame's content (e.g. file signature
+                   and filter values) keying the memoized sort order; a fingerprint
+                   of the sort column is used when None
+        **dataframe_kwargs: passed on to st.dataframe (e.g. use_container_width)
+    """
+    page_sizes = page_sizes or DATA_VIEWER_PAGE_SIZES
+    columns = df.columns.tolist()
+
+    # *************** START: Controls ***************
+    shown_columns = st.multiselect("Columns", columns, default=columns, key=f"{key}_columns")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        sort_column = st.selectbox("Sort by", [ORIGINAL_ORDER] + columns, key=f"{key}_sort")
+    with col2:
+        descending = st.selectbox("Order", ["Ascending", "Descending"], key=f"{key}_order") == "Descending"
+    with col3:
+        default_size = DATA_VIEWER_DEFAULT_PAGE_SIZE if DATA_VIEWER_DEFAULT_PAGE_SIZE in page_sizes else page_sizes[0]
+        page_size = st.selectbox("Rows per page", page_sizes, index=page_sizes.index(default_size), key=f"{key}_page_size")
+    with col4:
+        page_count = max(math.ceil(len(df) / page_size), 1)
+        # A narrower filter or larger page can leave the stored page out of range
+        page_key = f"{key}_page"
+        if st.session_state.get(page_key, 1) > page_count:
+            st.session_state[page_key] = page_count
+        page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, step=1, key=page_key)
+    # *************** END: Controls ***************
+
+    # *************** START: Visible Window ***************
+    start, stop = page_bounds(int(page), page_size, len(df))
+    if sort_column == ORIGINAL_ORDER:
+        positions = np.arange(start, stop)
+    else:
+        sort_series = df[sort_column]
+        # Without a state key, hash the column (values and row labels) to identify the frame
+        content_key = state_key if state_key is not None else fingerprint(sort_series)
+        order = memoize_section(
+            'sort_positions', (content_key, key, sort_column, descending),
+            lambda: sort_positions(sort_series, ascending=not descending)
+        )
+        positions = order[start:stop]
+    column_positions = [columns.index(col) for col in shown_columns]
+    window = df.iloc[positions, column_positions]
+    # *************** END: Visible Window ***************
+
+    st.dataframe(window, **dataframe_kwargs)
+    if len(df):
+        st.caption(f"Rows {start + 1:,}–{stop:,} of {len(df):,}")
+    else:
+        st.caption("No rows to show")
@@ -0,0 +1,166 @@
+"""
+In-process cache of processed upload datasets, keyed by upload content.
+
+Streamlit reruns the whole script on every widget interaction, so an upload
+would otherwise be parsed again on each rerun. The cache keeps the processed
+frame together with its derived artifacts (GPS points, skill table, filter
+and search indexes) under the hash of the uploaded bytes. It lives at module
+level, so it is shared by every session of the server process, and evicts
+the least recently used datasets once a byte or entry budget is exceeded.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import dataclasses
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Approximate memory budget of the cached datasets
+DATASET_CACHE_MAX_BYTES = int(os.getenv('DATASET_CACHE_MAX_BYTES', str(2 * 1024 ** 3)))
+
+# Maximum number of cached datasets, whatever their size
+DATASET_CACHE_MAX_ENTRIES = int(os.getenv('DATASET_CACHE_MAX_ENTRIES', '8'))
+
+
+# *************** HELPERS ***************
+#*************** Hash the raw bytes of an upload
+def hash_content(raw_bytes: bytes) -> str:
+    """
+    Hash uploaded content with the same digest as the on-disk frame cache.
+    Args:
+        raw_bytes (bytes): uploaded file content
+    Returns:
+        str : hexadecimal BLAKE2b digest
+    """
+    return hashlib.blake2b(raw_bytes, digest_size=20).hexdigest()
+
+
+#*************** Approximate memory held by a cached value
+def estimate_nbytes(value, _seen: set = None) -> int:
+    """
+    Sum the memory of the frames and arrays reachable from a value, through
+    tuples, lists, dicts, dataclasses and plain objects. Each object is counted once.
+    Args:
+        value: cached value
+    Returns:
+        int : estimated size in bytes
+    """
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list, set)):
+        return sum(estimate_nbytes(item, seen) for item in value)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(item, seen) for item in value.values())
+    if dataclasses.is_dataclass(value) or hasattr(value, '__dict__'):
+        return sum(estimate_nbytes(item, seen) for item in vars(value).values())
+    return 0
+
+
+# *************** MODELS ***************
+class DatasetCache:
+    """Size-bounded LRU cache of processed datasets keyed by content hash"""
+
+    def __init__(self, max_bytes: int = DATASET_CACHE_MAX_BYTES, max_entries: int = DATASET_CACHE_MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        # Upload identifiers already hashed, so a rerun does not rehash the same upload
+        self._aliases = {}
+        self._build_locks = {}
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(size for _, size in self._entries.values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup(self, content_hash: str):
+        with self._lock:
+            if content_hash not in self._entries:
+                return None
+            self._entries.move_to_end(content_hash)
+            return self._entries[content_hash][0]
+
+    def _store(self, content_hash: str, value, size: int) -> None:
+        with self._lock:
+            self._entries[content_hash] = (value, size)
+            self._entries.move_to_end(content_hash)
+            total = sum(entry_size for _, entry_size in self._entries.values())
+            # The newest entry is always kept, even when it alone exceeds the budget
+            while len(self._entries) > 1 and (total > self.max_bytes or len(self._entries) > self.max_entries):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                total -= evicted_size
+            self._aliases = {alias: key for alias, key in self._aliases.items() if key in self._entries}
+
+    def get_or_build(self, read_bytes, build, alias: str = None):
+        """
+        Return the dataset built from an upload, building it only when its
+        content has not been seen by this process (or was evicted).
+        Args:
+            read_bytes (callable): returns the uploaded bytes; only called when needed
+            build (callable): takes the uploaded bytes and returns the processed dataset
+            alias (str): stable identifier of the upload (e.g. Streamlit's file_id), optional
+        Returns:
+            the cached or freshly built dataset
+        """
+        # *************** START: Cache Lookup ***************
+        with self._lock:
+            content_hash = self._aliases.get(alias) if alias is not None else None
+        if content_hash is not None:
+            cached = self._lookup(content_hash)
+            if cached is not None:
+                return cached
+
+        raw_bytes = read_bytes()
+        content_hash = hash_content(raw_bytes)
+        if alias is not None:
+            with self._lock:
+                self._aliases[alias] = content_hash
+        cached = self._lookup(content_hash)
+        if cached is not None:
+            return cached
+        # *************** END: Cache Lookup ***************
+
+        # *************** START: Build Once ***************
+        # Sessions uploading the same content wait for a single build
+        with self._lock:
+            build_lock = self._build_locks.setdefault(content_hash, threading.Lock())
+        with build_lock:
+            cached = self._lookup(content_hash)
+            if cached is not None:
+                return cached
+            value = build(raw_bytes)
+            # The raw size stands in for text copies made later by background indexes
+            self._store(content_hash, value, estimate_nbytes(value) + len(raw_bytes))
+        with self._lock:
+            self._build_locks.pop(content_hash, None)
+        # *************** END: Build Once ***************
+
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+
+
+# Shared by every session of the Streamlit server process
+JOB_DATASET_CACHE = DatasetCache()
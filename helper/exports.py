@@ -0,0 +1,153 @@
+"""
+On-demand CSV, compressed CSV and Parquet exports for the download buttons.
+
+Building a download with df.to_csv() on every rerun serializes the whole
+frame even when nobody downloads it. Exports here are only generated after
+the user asks for one, and are written chunk by chunk into a temporary file,
+so serializing holds one chunk of text at a time on top of the finished
+file. Compressed CSV and Parquet keep that file small. The finished file is
+kept in the session until the exported frame or the chosen format changes.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import gzip
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Rows serialized at a time (CSV chunk or Parquet row group)
+EXPORT_CHUNK_ROWS = int(os.getenv('EXPORT_CHUNK_ROWS', '50000'))
+
+# Download format to (file extension, MIME type)
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'CSV (gzip)': ('csv.gz', 'application/gzip'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+
+# *************** HELPERS ***************
+#*************** Identify the frame an export was prepared from
+def frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Cheap identity of a frame's shape and rows, used to drop stale exports.
+    Args:
+        df (pd.DataFrame): exported frame
+    Returns:
+        tuple : row count, column names and a hash of the index
+    """
+    index_hash = int(pd.util.hash_pandas_object(df.index, index=False).sum()) if len(df) else 0
+    return len(df), tuple(map(str, df.columns)), index_hash
+
+
+def _chunks(df: pd.DataFrame, chunk_rows: int):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+# *************** DATA PROCESSING ***************
+#*************** Write a frame as CSV, one chunk at a time
+def write_csv(df: pd.DataFrame, target, chunk_rows: int = EXPORT_CHUNK_ROWS) -> None:
+    """
+    Write the same bytes as df.to_csv(index=False), chunk by chunk.
+    Args:
+        df (pd.DataFrame): frame to export
+        target: binary file-like object
+        chunk_rows (int): rows serialized at a time
+    """
+    target.write(df.head(0).to_csv(index=False).encode('utf-8'))
+    for chunk in _chunks(df, chunk_rows):
+        target.write(chunk.to_csv(index=False, header=False).encode('utf-8'))
+
+
+#*************** Write a frame as Parquet, one row group per chunk
+def write_parquet(df: pd.DataFrame, target, chunk_rows: int = EXPORT_CHUNK_ROWS) -> None:
+    """
+    Write a frame to Parquet without converting it to Arrow all at once.
+    Args:
+        df (pd.DataFrame): frame to export
+        target: binary file-like object
+        chunk_rows (int): rows per row group
+    """
+    if len(df) == 0:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), target)
+        return
+
+    writer = None
+    try:
+        for chunk in _chunks(df, chunk_rows):
+            # Later chunks are cast to the schema inferred from the first one
+            table = pa.Table.from_pandas(chunk, schema=writer.schema if writer else None, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(target, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+#*************** Export a frame to a temporary file in the chosen format
+def build_export(df: pd.DataFrame, export_format: str, chunk_rows: int = EXPORT_CHUNK_ROWS) -> bytes:
+    """
+    Serialize a frame for download.
+    Args:
+        df (pd.DataFrame): frame to export
+        export_format (str): key of EXPORT_FORMATS
+        chunk_rows (int): rows serialized at a time
+    Returns:
+        bytes : content of the exported file
+    """
+    # *************** START: Input Validation ***************
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{export_format}'. Expected one of {list(EXPORT_FORMATS)}.")
+    # *************** END: Input Validation ***************
+
+    with tempfile.TemporaryFile() as target:
+        if export_format == 'CSV':
+            write_csv(df, target, chunk_rows)
+        elif export_format == 'CSV (gzip)':
+            with gzip.GzipFile(fileobj=target, mode='wb', mtime=0) as compressed:
+                write_csv(df, compressed, chunk_rows)
+        else:
+            write_parquet(df, target, chunk_rows)
+        target.seek(0)
+        return target.read()
+
+
+# *************** DISPLAY ***************
+#*************** Format picker, prepare button and download button for one frame
+def show_export_controls(df: pd.DataFrame, key: str, file_stem: str, label: str) -> None:
+    """
+    Offer a download of a frame that is only generated when the user prepares it.
+    Args:
+        df (pd.DataFrame): frame to export
+        key (str): widget and session key prefix, unique per export on the page
+        file_stem (str): downloaded file name without extension
+        label (str): download button label
+    """
+    export_key = f"{key}_export"
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        export_format = st.selectbox("Format", list(EXPORT_FORMATS), key=f"{key}_format")
+    extension, mime = EXPORT_FORMATS[export_format]
+
+    # An export prepared for other rows or another format is stale
+    fingerprint = (frame_fingerprint(df), export_format)
+    prepared = st.session_state.get(export_key)
+    if prepared is not None and prepared[0] != fingerprint:
+        del st.session_state[export_key]
+        prepared = None
+
+    with col2:
+        if prepared is None:
+            if st.button(f"⚙️ Prepare {export_format} export ({len(df):,} rows)", key=f"{key}_prepare"):
+                with st.spinner("Preparing export..."):
+                    prepared = (fingerprint, build_export(df, export_format))
+                st.session_state[export_key] = prepared
+        if prepared is not None:
+            st.download_button(label, prepared[1], f"{file_stem}.{extension}", mime, key=f"{key}_download")
@@ -0,0 +1,153 @@
+"""
+Process-wide LRU cache of built Plotly figures.
+
+Building a figure with plotly express (trace generation, templating and
+validation) costs far more than the small aggregate behind it. Figures are
+cached under the chart name and a fingerprint of the aggregated data the
+chart is drawn from, plus any chart parameters, so a rerun whose aggregate
+did not change reuses the figure built earlier, in any session. The cache
+holds plain figures; callers must not modify a figure they get from it.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# *************** IMPORTS: HELPERS ***************
+# Imported as a module: helper.instrumentation reads FIGURE_CACHE's counters
+from helper import instrumentation
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Figures kept in memory, least recently used evicted first
+FIGURE_CACHE_MAX_ENTRIES = int(os.getenv('FIGURE_CACHE_MAX_ENTRIES', '128'))
+
+
+# *************** HELPERS ***************
+def _hash_pandas(digest, value) -> None:
+    try:
+        hashed = pd.util.hash_pandas_object(value, index=True)
+    except TypeError:
+        # Unhashable cells (lists, dicts): hash their text instead
+        hashed = pd.util.hash_pandas_object(value.astype(str), index=True)
+    digest.update(hashed.to_numpy().tobytes())
+
+
+def _update_digest(digest, value) -> None:
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr(('DataFrame', value.shape, list(value.columns), [str(dtype) for dtype in value.dtypes])).encode())
+        _hash_pandas(digest, value)
+    elif isinstance(value, pd.Series):
+        digest.update(repr(('Series', value.shape, value.name, str(value.dtype))).encode())
+        _hash_pandas(digest, value)
+    elif isinstance(value, pd.Index):
+        digest.update(repr(('Index', value.shape, str(value.dtype))).encode())
+        _hash_pandas(digest, value)
+    elif isinstance(value, np.ndarray):
+        digest.update(repr(('ndarray', value.shape, str(value.dtype))).encode())
+        if value.dtype == object:
+            _hash_pandas(digest, pd.Series(value.ravel()))
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(repr((type(value).__name__, len(value))).encode())
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+
+#*************** Cheap fingerprint of a chart's aggregated input
+def fingerprint(value) -> str:
+    """
+    Hash frames, series, arrays and plain values (nested in lists, tuples and dicts).
+    Args:
+        value: aggregate a chart is drawn from, or chart parameters
+    Returns:
+        str : hexadecimal BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update_digest(digest, value)
+    return digest.hexdigest()
+
+
+# *************** MODELS ***************
+class FigureCache:
+    """Size-bounded LRU cache of figures keyed by chart name and input fingerprint"""
+
+    def __init__(self, max_entries: int = FIGURE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_or_build(self, name: str, data, build, params: dict = None):
+        """
+        Return the figure built for the same chart and input, building it on a miss.
+        Args:
+            name (str): chart name, unique per chart definition
+            data: aggregate the chart is drawn from (frame, series, array or tuple of them)
+            build (callable): takes no argument and returns the figure
+            params (dict): chart parameters not contained in data, optional
+        Returns:
+            the cached or freshly built figure
+        """
+        key = (name, fingerprint(data), fingerprint(params or {}))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        figure = build()
+        with self._lock:
+            self._entries[key] = figure
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every session of the Streamlit server process
+FIGURE_CACHE = FigureCache()
+
+
+#*************** Build a figure through the shared cache
+def cached_figure(name: str, data, build, **params):
+    """
+    Shortcut for FIGURE_CACHE.get_or_build, recorded as a cached span named
+    after the chart so the performance panel separates figure construction
+    from the aggregation of the section around it.
+    Args:
+        name (str): chart name, unique per chart definition
+        data: aggregate the chart is drawn from
+        build (callable): takes no argument and returns the figure
+        **params: chart parameters not contained in data
+    Returns:
+        the cached or freshly built figure
+    """
+    def build_on_miss():
+        instrumentation.mark_cache_miss()
+        return build()
+
+    with instrumentation.trace_span(name, kind='transform', cached=True):
+        return FIGURE_CACHE.get_or_build(name, data, build_on_miss, params)
@@ -0,0 +1,185 @@
+"""
+Inverted indexes for the job dashboard sidebar filters.
+
+Each filter used to build a boolean mask over the whole frame and copy it.
+The indexes here are built once per upload: every filterable column maps each
+value to the sorted row positions holding it, and every date column keeps its
+rows sorted by date. A filter change intersects position arrays and the
+filtered frame is materialized once, with a single iloc.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+# *************** IMPORTS: HELPERS ***************
+from helper.instrumentation import instrumented
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Columns offered as sidebar selectboxes
+JOB_FILTER_COLUMNS = ['location', 'company', 'source', 'remote_working']
+
+# Candidate columns for the date range filter, in order of preference
+JOB_DATE_FILTER_COLUMNS = ['publication_date', 'date_of_publication', 'scrapped_on_date']
+
+
+# *************** MODELS ***************
+@dataclass
+class ColumnIndex:
+    # Distinct values of the column, indexed by code
+    values: np.ndarray
+    # Code of every row, -1 for missing values
+    codes: np.ndarray
+    # Row positions grouped by code; rows of code c are positions[offsets[c]:offsets[c + 1]]
+    positions: np.ndarray
+    offsets: np.ndarray
+    # Codes in order of first appearance over the whole frame
+    first_seen_codes: np.ndarray
+    code_of: dict = field(default_factory=dict)
+
+    def rows_for(self, value) -> np.ndarray:
+        """Sorted row positions holding value (empty when the value is unknown)"""
+        code = self.code_of.get(value)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return self.positions[self.offsets[code]:self.offsets[code + 1]]
+
+    def present_values(self, rows: np.ndarray = None) -> list:
+        """Non-missing values occurring in rows (all rows when None), in order of first appearance"""
+        if rows is None:
+            present_codes = self.first_seen_codes
+        else:
+            row_codes = self.codes[rows]
+            present_codes = pd.unique(row_codes[row_codes >= 0])
+        return self.values[present_codes].tolist()
+
+
+@dataclass
+class DateIndex:
+    # Non-missing timestamps in ascending order (UTC for timezone-aware columns)
+    sorted_values: np.ndarray
+    # Row position of each sorted timestamp
+    order: np.ndarray
+    tz: object = None
+
+    def _to_index_time(self, day: date) -> np.datetime64:
+        timestamp = pd.Timestamp(day)
+        if self.tz is not None:
+            timestamp = timestamp.tz_localize(self.tz).tz_convert(None)
+        return timestamp.to_datetime64()
+
+    def date_bounds(self) -> tuple:
+        """First and last calendar date of the column, as shown in the column's timezone"""
+        first, last = pd.Timestamp(self.sorted_values[0]), pd.Timestamp(self.sorted_values[-1])
+        if self.tz is not None:
+            first, last = first.tz_localize('UTC').tz_convert(self.tz), last.tz_localize('UTC').tz_convert(self.tz)
+        return first.date(), last.date()
+
+    def rows_between(self, start_date: date, end_date: date) -> np.ndarray:
+        """Sorted row positions whose calendar date lies within [start_date, end_date]"""
+        low = np.searchsorted(self.sorted_values, self._to_index_time(start_date), side='left')
+        high = np.searchsorted(self.sorted_values, self._to_index_time(end_date + timedelta(days=1)), side='left')
+        return np.sort(self.order[low:high])
+
+
+@dataclass
+class FilterIndex:
+    row_count: int
+    columns: dict = field(default_factory=dict)
+    dates: dict = field(default_factory=dict)
+
+
+# *************** DATA PROCESSING ***************
+#*************** Inverted index of one column
+def build_column_index(series: pd.Series) -> ColumnIndex:
+    """
+    Group the row positions of a column by value.
+    Args:
+        series (pd.Series): categorical, boolean or plain column
+    Returns:
+        ColumnIndex : value to row positions index of the column
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy().astype(np.int64)
+        values = series.cat.categories.to_numpy(dtype=object)
+    else:
+        codes, uniques = pd.factorize(series)
+        values = np.asarray(uniques, dtype=object)
+
+    valid_rows = np.flatnonzero(codes >= 0)
+    positions = valid_rows[np.argsort(codes[valid_rows], kind='stable')]
+    counts = np.bincount(codes[valid_rows], minlength=len(values))
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    first_seen_codes = pd.unique(codes[valid_rows])
+
+    return ColumnIndex(
+        values=values,
+        codes=codes,
+        positions=positions,
+        offsets=offsets,
+        first_seen_codes=first_seen_codes,
+        code_of={value: code for code, value in enumerate(values.tolist())},
+    )
+
+
+#*************** Sorted index of one datetime column
+def build_date_index(series: pd.Series) -> DateIndex | None:
+    """
+    Sort the non-missing rows of a datetime column by timestamp.
+    Args:
+        series (pd.Series): datetime64 column, naive or timezone-aware
+    Returns:
+        DateIndex | None : sorted index, or None when the column holds no dates
+    """
+    tz = getattr(series.dt, 'tz', None)
+    timestamps = series.dt.tz_convert(None) if tz is not None else series
+    values = timestamps.to_numpy(dtype='datetime64[ns]')
+
+    valid_rows = np.flatnonzero(~np.isnat(values))
+    if len(valid_rows) == 0:
+        return None
+    order = valid_rows[np.argsort(values[valid_rows], kind='stable')]
+    return DateIndex(sorted_values=values[order], order=order, tz=tz)
+
+
+#*************** Indexes of every sidebar filter
+@instrumented(kind='transform')
+def build_filter_index(df: pd.DataFrame, columns: list = None, date_columns: list = None) -> FilterIndex:
+    """
+    Build the inverted and date indexes behind the sidebar filters, once per upload.
+    Args:
+        df (pd.DataFrame): processed job frame
+        columns (list): selectbox filter columns (JOB_FILTER_COLUMNS by default)
+        date_columns (list): date range filter candidates (JOB_DATE_FILTER_COLUMNS by default)
+    Returns:
+        FilterIndex : indexes of the columns present in df
+    """
+    filter_index = FilterIndex(row_count=len(df))
+    for col in columns if columns is not None else JOB_FILTER_COLUMNS:
+        if col in df.columns:
+            filter_index.columns[col] = build_column_index(df[col])
+    for col in date_columns if date_columns is not None else JOB_DATE_FILTER_COLUMNS:
+        if col in df.columns and pd.api.types.is_datetime64_any_dtype(df[col]):
+            date_index = build_date_index(df[col])
+            if date_index is not None:
+                filter_index.dates[col] = date_index
+    return filter_index
+
+
+#*************** Combine the rows kept so far with the rows of one more filter
+@instrumented(kind='transform')
+def intersect_rows(rows: np.ndarray | None, filter_rows: np.ndarray) -> np.ndarray:
+    """
+    Intersect two sorted position arrays.
+    Args:
+        rows (np.ndarray | None): rows kept by the previous filters, None for every row
+        filter_rows (np.ndarray): sorted rows matching the new filter
+    Returns:
+        np.ndarray : sorted rows matching every filter
+    """
+    if rows is None:
+        return filter_rows
+    return np.intersect1d(rows, filter_rows, assume_unique=True)
@@ -0,0 +1,75 @@
+"""
+Grouped top-N and distribution queries for side-by-side charts.
+
+Comparison charts (top locations per source, salary spread per source, ...)
+need the same query for every selected group. The helpers here answer it for
+all groups at once: a single mask selects the groups, a single groupby counts
+them, and the result comes back as one long frame ready for plotly express.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import numpy as np
+import pandas as pd
+
+
+# *************** HELPERS ***************
+#*************** Position of each row's group in the requested group order
+def _group_positions(group_values: pd.Series, groups: list) -> np.ndarray:
+    return pd.Categorical(group_values, categories=pd.unique(pd.Series(groups, dtype=object))).codes
+
+
+# *************** DATA PROCESSING ***************
+#*************** Most frequent values of a column for each selected group
+def grouped_top_n(df: pd.DataFrame, group_column: str, value_column: str, groups: list, n: int = 5) -> pd.DataFrame:
+    """
+    Count the values of a column inside each selected group and keep the n most frequent.
+    Args:
+        df (pd.DataFrame): source frame
+        group_column (str): column defining the groups (e.g. source)
+        value_column (str): column whose values are counted (e.g. location)
+        groups (list): groups to report, in display order
+        n (int): number of values kept per group
+    Returns:
+        pd.DataFrame : group_column, value_column and 'count' columns, ordered by
+                       group (as in groups), then count descending; values that
+                       do not occur in a group are left out
+    """
+    selected = df.loc[df[group_column].isin(groups), [group_column, value_column]]
+    counts = selected.groupby([group_column, value_column], observed=True).size()
+    counts = counts.reset_index(name='count')
+
+    # Stable sort keeps values with the same count in category order, as value_counts does
+    counts['_position'] = _group_positions(counts[group_column], groups)
+    counts = counts.sort_values(['_position', 'count'], ascending=[True, False], kind='stable')
+    top = counts.groupby('_position', sort=False).head(n)
+
+    return pd.DataFrame({
+        group_column: top[group_column].to_numpy(dtype=object),
+        value_column: top[value_column].to_numpy(dtype=object),
+        'count': top['count'].to_numpy(),
+    })
+
+
+#*************** Values of a column for each selected group, for box and violin plots
+def grouped_distribution(df: pd.DataFrame, group_column: str, value_column: str, groups: list, row_mask: pd.Series = None) -> pd.DataFrame:
+    """
+    Slice the values of a column belonging to the selected groups, grouped in display order.
+    Args:
+        df (pd.DataFrame): source frame
+        group_column (str): column defining the groups (e.g. source)
+        value_column (str): column holding the distributed values (e.g. salary_avg)
+        groups (list): groups to report, in display order
+        row_mask (pd.Series): optional boolean mask of the rows to consider
+    Returns:
+        pd.DataFrame : group_column and value_column, rows of the first group first,
+                       keeping row order inside each group
+    """
+    keep = df[group_column].isin(groups).to_numpy()
+    if row_mask is not None:
+        keep = keep & row_mask.to_numpy(dtype=bool)
+
+    group_values = df[group_column].to_numpy(dtype=object)[keep]
+    values = df[value_column].to_numpy()[keep]
+    order = np.argsort(_group_positions(group_values, groups), kind='stable')
+
+    return pd.DataFrame({group_column: group_values[order], value_column: values[order]})
@@ -0,0 +1,392 @@
+"""
+Opt-in timing and memory instrumentation of the dashboards.
+
+Loaders, transforms and dashboard sections are wrapped with the instrumented
+decorator (or a trace_span block). While recording is switched on in the
+sidebar "Performance" panel, every wrapped call of a rerun becomes a span
+holding its wall time, rows in and out, peak allocation and, for cached
+steps, whether the cache was hit. The panel lists the spans of the last rerun
+and exports the recent reruns as a Chrome trace file (chrome://tracing or
+ui.perfetto.dev). When recording is off a wrapped call costs one attribute
+lookup.
+
+Peak allocation comes from tracemalloc, which slows the traced code down and
+sees only Python, NumPy and pandas allocations; it is therefore a separate
+switch. tracemalloc is process-wide, so sessions recording memory at the same
+time see each other's allocations.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# *************** IMPORTS: HELPERS ***************
+# Imported as a module: helper.figure_cache records its lookups as spans of this module
+from helper import figure_cache
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Recording is off unless switched on in the panel, or by default with PERFORMANCE_INSTRUMENTATION=1
+PERFORMANCE_DEFAULT_ENABLED = os.getenv('PERFORMANCE_INSTRUMENTATION', '0') == '1'
+
+# Reruns kept per browser session for the trace export
+PERFORMANCE_HISTORY_RERUNS = int(os.getenv('PERFORMANCE_HISTORY_RERUNS', '20'))
+
+PERFORMANCE_ENABLED_KEY = 'perf_enabled'
+PERFORMANCE_MEMORY_KEY = 'perf_track_memory'
+PERFORMANCE_HISTORY_STATE_KEY = '_perf_history'
+
+_BYTES_PER_MB = 1024 ** 2
+
+# Each session runs its script on its own thread: the rerun being recorded is per thread
+_THREAD_STATE = threading.local()
+
+# Reruns currently tracing memory; tracemalloc runs while there is at least one
+_MEMORY_TRACING_LOCK = threading.Lock()
+_memory_tracing_reruns = 0
+
+
+# *************** MODELS ***************
+@dataclass
+class Span:
+    name: str
+    # 'rerun', 'loader', 'transform' or 'section'
+    kind: str
+    depth: int
+    # Seconds since the start of the rerun
+    start: float
+    wall_seconds: float = None
+    rows_in: int = None
+    rows_out: int = None
+    peak_bytes: int = None
+    # None for uncached steps, 'hit' or 'miss' otherwise
+    cache: str = None
+    cached: bool = False
+    # Set when anything ran inside the span: for a cached step, the cache missed
+    computed: bool = False
+    base_memory: int = 0
+    seen_peak: int = 0
+
+    def to_record(self) -> dict:
+        return {
+            'name': self.name,
+            'kind': self.kind,
+            'depth': self.depth,
+            'start': round(self.start, 6),
+            'wall_seconds': round(self.wall_seconds or 0.0, 6),
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'peak_bytes': self.peak_bytes,
+            'cache': self.cache,
+        }
+
+
+@dataclass
+class RerunRecorder:
+    track_memory: bool
+    started_at: float = field(default_factory=time.time)
+    started: float = field(default_factory=time.perf_counter)
+    spans: list = field(default_factory=list)
+    stack: list = field(default_factory=list)
+    figure_cache_hits: int = field(default_factory=lambda: figure_cache.FIGURE_CACHE.hits)
+    figure_cache_misses: int = field(default_factory=lambda: figure_cache.FIGURE_CACHE.misses)
+
+
+# *************** HELPERS ***************
+#*************** Rows of a frame, a rollup object or the frame inside a loader result
+def _row_count(value) -> int | None:
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return len(value)
+    record_count = getattr(value, 'record_count', None)
+    if isinstance(record_count, (int, np.integer)):
+        return int(record_count)
+    if isinstance(value, (tuple, list)):
+        # Loaders return (frame, error) style tuples
+        for item in value:
+            count = _row_count(item) if isinstance(item, (pd.DataFrame, pd.Series, np.ndarray)) else None
+            if count is not None:
+                return count
+    return None
+
+
+def _rows_in(args: tuple, kwargs: dict) -> int | None:
+    counts = [_row_count(value) for value in (*args, *kwargs.values())
+              if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)) or hasattr(value, 'record_count')]
+    counts = [count for count in counts if count is not None]
+    return sum(counts) if counts else None
+
+
+def _active_recorder() -> RerunRecorder | None:
+    return getattr(_THREAD_STATE, 'recorder', None)
+
+
+def _start_memory_tracing() -> None:
+    global _memory_tracing_reruns
+    with _MEMORY_TRACING_LOCK:
+        if _memory_tracing_reruns == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _memory_tracing_reruns += 1
+
+
+def _stop_memory_tracing() -> None:
+    global _memory_tracing_reruns
+    with _MEMORY_TRACING_LOCK:
+        _memory_tracing_reruns -= 1
+        if _memory_tracing_reruns == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+# *************** DATA PROCESSING: SPANS ***************
+def _open_span(recorder: RerunRecorder, name: str, kind: str, rows_in: int = None, cached: bool = False) -> Span:
+    parent = recorder.stack[-1] if recorder.stack else None
+    if parent is not None:
+        parent.computed = True
+
+    span = Span(name=name, kind=kind, depth=len(recorder.stack), start=time.perf_counter() - recorder.started,
+                rows_in=rows_in, cached=cached)
+    if recorder.track_memory:
+        # The peak is reset per span; parents keep the highest peak seen by their children
+        current, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            parent.seen_peak = max(parent.seen_peak, peak)
+        span.base_memory = span.seen_peak = current
+        tracemalloc.reset_peak()
+
+    recorder.stack.append(span)
+    recorder.spans.append(span)
+    return span
+
+
+def _close_span(recorder: RerunRecorder, span: Span) -> None:
+    span.wall_seconds = time.perf_counter() - recorder.started - span.start
+    recorder.stack.pop()
+
+    if recorder.track_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        span.seen_peak = max(span.seen_peak, peak)
+        span.peak_bytes = max(span.seen_peak - span.base_memory, 0)
+        if recorder.stack:
+            recorder.stack[-1].seen_peak = max(recorder.stack[-1].seen_peak, span.seen_peak)
+
+    if span.cached:
+        span.cache = 'miss' if span.computed else 'hit'
+
+
+#*************** Record a block of code as a span of the current rerun
+@contextmanager
+def trace_span(name: str, kind: str = 'transform', rows_in: int = None, cached: bool = False):
+    """
+    Time a block while recording is on; does nothing otherwise.
+    Args:
+        name (str): span name
+        kind (str): 'loader', 'transform' or 'section'
+        rows_in (int): input rows, optional
+        cached (bool): the block is a cache lookup; it counts as a miss when
+                       mark_cache_miss is called or a span opens inside it
+    Returns:
+        Span | None : the open span (set rows_out on it), None when not recording
+    """
+    recorder = _active_recorder()
+    if recorder is None:
+        yield None
+        return
+
+    span = _open_span(recorder, name, kind, rows_in, cached)
+    try:
+        yield span
+    finally:
+        _close_span(recorder, span)
+
+
+#*************** Flag the innermost cached span as a miss
+def mark_cache_miss() -> None:
+    recorder = _active_recorder()
+    if recorder is not None and recorder.stack:
+        recorder.stack[-1].computed = True
+
+
+#*************** Record every call of a function as a span
+def instrumented(func=None, *, name: str = None, kind: str = 'section', cached: bool = False):
+    """
+    Decorator recording wall time, rows in and out, peak allocation and cache
+    status of each call while recording is on.
+    Args:
+        func (callable): function to wrap (when used without arguments)
+        name (str): span name, the function name by default
+        kind (str): 'loader', 'transform' or 'section'
+        cached (bool): the function returns cached results (see trace_span)
+    Returns:
+        callable : the wrapped function, or a decorator when func is None
+    """
+    def decorator(wrapped):
+        span_name = name or wrapped.__name__
+
+        @functools.wraps(wrapped)
+        def wrapper(*args, **kwargs):
+            recorder = _active_recorder()
+            if recorder is None:
+                return wrapped(*args, **kwargs)
+
+            span = _open_span(recorder, span_name, kind, _rows_in(args, kwargs), cached)
+            try:
+                result = wrapped(*args, **kwargs)
+                span.rows_out = _row_count(result)
+                return result
+            finally:
+                _close_span(recorder, span)
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+
+#*************** st.cache_data whose hits and misses are recorded
+def instrumented_cache_data(func=None, *, name: str = None, kind: str = 'loader', **cache_kwargs):
+    """
+    Drop-in replacement for st.cache_data that records each call as a cached span.
+    Args:
+        func (callable): function to cache (when used without arguments)
+        name (str): span name, the function name by default
+        kind (str): 'loader' or 'transform'
+        **cache_kwargs: st.cache_data arguments (ttl, max_entries, ...)
+    Returns:
+        callable : the cached and instrumented function, or a decorator when func is None
+    """
+    def decorator(wrapped):
+        # Runs only when st.cache_data has no entry for the arguments
+        @functools.wraps(wrapped)
+        def compute(*args, **kwargs):
+            mark_cache_miss()
+            return wrapped(*args, **kwargs)
+
+        cached_function = st.cache_data(**cache_kwargs)(compute) if cache_kwargs else st.cache_data(compute)
+        return instrumented(cached_function, name=name or wrapped.__name__, kind=kind, cached=True)
+
+    return decorator(func) if func is not None else decorator
+
+
+# *************** DATA PROCESSING: RERUNS ***************
+#*************** Record the spans of each rerun of a dashboard's main function
+def performance_rerun(main):
+    """
+    Decorator for a dashboard's main function: records the rerun when
+    recording is on and renders the sidebar Performance panel at the end.
+    Args:
+        main (callable): the dashboard's main function
+    Returns:
+        callable : the wrapped main function
+    """
+    @functools.wraps(main)
+    def wrapper(*args, **kwargs):
+        st.session_state.setdefault(PERFORMANCE_ENABLED_KEY, PERFORMANCE_DEFAULT_ENABLED)
+        st.session_state.setdefault(PERFORMANCE_MEMORY_KEY, False)
+        if not st.session_state[PERFORMANCE_ENABLED_KEY]:
+            result = main(*args, **kwargs)
+            show_performance_panel()
+            return result
+
+        recorder = RerunRecorder(track_memory=st.session_state[PERFORMANCE_MEMORY_KEY])
+        if recorder.track_memory:
+            _start_memory_tracing()
+        _THREAD_STATE.recorder = recorder
+        try:
+            with trace_span(main.__name__, kind='rerun'):
+                result = main(*args, **kwargs)
+        finally:
+            _THREAD_STATE.recorder = None
+            if recorder.track_memory:
+                _stop_memory_tracing()
+            _store_rerun(recorder)
+
+        show_performance_panel()
+        return result
+
+    return wrapper
+
+
+def _store_rerun(recorder: RerunRecorder) -> None:
+    history = st.session_state.get(PERFORMANCE_HISTORY_STATE_KEY)
+    if history is None:
+        history = st.session_state[PERFORMANCE_HISTORY_STATE_KEY] = deque(maxlen=PERFORMANCE_HISTORY_RERUNS)
+    history.append({
+        'started_at': recorder.started_at,
+        'track_memory': recorder.track_memory,
+        # Process-wide counters: concurrent sessions' lookups are included
+        'figure_cache_hits': figure_cache.FIGURE_CACHE.hits - recorder.figure_cache_hits,
+        'figure_cache_misses': figure_cache.FIGURE_CACHE.misses - recorder.figure_cache_misses,
+        'spans': [span.to_record() for span in recorder.spans],
+    })
+
+
+#*************** Recent reruns as a Chrome trace file
+def build_trace(history: list) -> str:
+    """
+    Convert recorded reruns to the Chrome trace event format.
+    Args:
+        history (list): rerun records, oldest first
+    Returns:
+        str : JSON document loadable in chrome://tracing or ui.perfetto.dev
+    """
+    events = []
+    for rerun_number, rerun in enumerate(history, start=1):
+        rerun_start_us = rerun['started_at'] * 1e6
+        for span in rerun['spans']:
+            events.append({
+                'name': span['name'],
+                'cat': span['kind'],
+                'ph': 'X',
+                'ts': round(rerun_start_us + span['start'] * 1e6),
+                'dur': round(span['wall_seconds'] * 1e6),
+                'pid': 1,
+                'tid': rerun_number,
+                'args': {key: span[key] for key in ('rows_in', 'rows_out', 'peak_bytes', 'cache') if span[key] is not None},
+            })
+    return json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
+
+
+# *************** DISPLAY ***************
+#*************** Sidebar panel listing the spans of the last rerun
+def show_performance_panel() -> None:
+    with st.sidebar.expander("⏱️ Performance", expanded=False):
+        st.checkbox("Record timings", key=PERFORMANCE_ENABLED_KEY,
+                    help="Time every loader, transform and section of each rerun")
+        st.checkbox("Track peak memory (slower)", key=PERFORMANCE_MEMORY_KEY,
+                    disabled=not st.session_state[PERFORMANCE_ENABLED_KEY])
+
+        history = st.session_state.get(PERFORMANCE_HISTORY_STATE_KEY)
+        if not st.session_state[PERFORMANCE_ENABLED_KEY] or not history:
+            st.caption("Switch recording on, then use the dashboard: the next rerun is timed.")
+            return
+
+        last_rerun = history[-1]
+        spans = last_rerun['spans']
+        total_seconds = spans[0]['wall_seconds'] if spans else 0.0
+        st.caption(f"Last rerun: {total_seconds * 1000:,.0f} ms, figure cache "
+                   f"{last_rerun['figure_cache_hits']} hits / {last_rerun['figure_cache_misses']} misses")
+
+        st.dataframe(pd.DataFrame({
+            'Step': [' ' * span['depth'] + span['name'] for span in spans],
+            'Kind': [span['kind'] for span in spans],
+            'ms': [round(span['wall_seconds'] * 1000, 1) for span in spans],
+            'Rows in': pd.array([span['rows_in'] for span in spans], dtype='Int64'),
+            'Rows out': pd.array([span['rows_out'] for span in spans], dtype='Int64'),
+            'Peak MB': [None if span['peak_bytes'] is None else round(span['peak_bytes'] / _BYTES_PER_MB, 1) for span in spans],
+            'Cache': [span['cache'] or '' for span in spans],
+        }), hide_index=True)
+
+        st.download_button(
+            "📥 Download trace",
+            data=build_trace(list(history)),
+            file_name="performance-trace.json",
+            mime="application/json",
+            help=f"Last {len(history)} reruns, for chrome://tracing or ui.perfetto.dev",
+        )
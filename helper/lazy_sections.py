@@ -0,0 +1,92 @@
+"""
+Lazily rendered dashboard tabs and per-filter-state memoization of their data.
+
+st.tabs runs the body of every tab on each rerun, although only one tab is
+visible. lazy_tabs tracks the selected tab in session state so a tab body can
+skip its work unless the tab is open, and memoize_section keeps the data a
+section computed for a given filter state, so switching back to a tab, paging
+the raw data or any other rerun with unchanged filters does not recompute it.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import os
+from collections import OrderedDict
+from contextlib import nullcontext
+
+import streamlit as st
+
+# *************** IMPORTS: HELPERS ***************
+from helper.instrumentation import mark_cache_miss, trace_span
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Section results kept per browser session, least recently used evicted first
+SECTION_MEMO_MAX_ENTRIES = int(os.getenv('SECTION_MEMO_MAX_ENTRIES', '16'))
+
+SECTION_MEMO_STATE_KEY = '_section_memo'
+
+
+# *************** MODELS ***************
+class LazySection:
+    """Stand-in for a tab on Streamlit releases without tab state; only the open section gets a container"""
+
+    def __init__(self, is_open: bool):
+        self.open = is_open
+        self._container = st.container() if is_open else None
+
+    def __enter__(self):
+        self._context = self._container if self._container is not None else nullcontext()
+        return self._context.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._context.__exit__(*exc_info)
+
+
+# *************** DISPLAY ***************
+#*************** Tabs whose selection is tracked, so closed tabs can skip their work
+def lazy_tabs(labels: list, key: str) -> list:
+    """
+    Create tabs that rerun the script on selection and report which one is open.
+    Args:
+        labels (list): tab labels
+        key (str): session state key holding the selected label
+    Returns:
+        list : one tab per label; render a tab's body only when tab.open is True
+    """
+    try:
+        return st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        # Releases without tab state: a horizontal radio picks the rendered section
+        selected = st.radio("Section", labels, key=key, horizontal=True, label_visibility="collapsed")
+        return [LazySection(label == selected) for label in labels]
+
+
+# *************** DATA PROCESSING ***************
+#*************** Reuse a section's data while the filter state is unchanged
+def memoize_section(name: str, state_key, compute):
+    """
+    Return the data a section computed for the same filter state, computing it on a miss.
+    Args:
+        name (str): section name
+        state_key: hashable description of everything the data depends on
+                   (dataset and filter values); None disables memoization
+        compute (callable): takes no argument and returns the section data
+    Returns:
+        the memoized or freshly computed section data
+    """
+    if state_key is None:
+        with trace_span(name, kind='transform'):
+            return compute()
+
+    with trace_span(name, kind='transform', cached=True):
+        memo = st.session_state.setdefault(SECTION_MEMO_STATE_KEY, OrderedDict())
+        memo_key = (name, state_key)
+        if memo_key in memo:
+            memo.move_to_end(memo_key)
+            return memo[memo_key]
+
+        mark_cache_miss()
+        result = compute()
+        memo[memo_key] = result
+        while len(memo) > SECTION_MEMO_MAX_ENTRIES:
+            memo.popitem(last=False)
+        return result
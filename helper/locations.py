@@ -0,0 +1,255 @@
+"""
+Location parsing for the scraped job dataset.
+
+location strings ("Paris, France") are split into city and country once at
+load time, and country names are resolved to ISO-3 codes through a bounded
+in-process memo that also remembers names that do not resolve. pycountry is
+only imported on the first lookup.
+
+location_detail holds a Python-literal list of (latitude, longitude) pairs per
+job, e.g. "[(48.85, 2.35), (None, None)]". Parsing it with ast.literal_eval
+row by row on every render is the slowest path of the Locations tab, so the
+column is parsed once at load time with regular expressions into a flat
+coordinate frame that later renders only mask.
+
+Large point sets are not sent to the GPS map one by one: they are binned into
+latitude/longitude grid cells sized for the map zoom, and only each cell's
+centroid and job count are plotted, with a bounded number of cells.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Distinct country names remembered by the ISO-3 resolver, misses included
+COUNTRY_CACHE_SIZE = 4096
+
+# Names pycountry does not resolve, keyed by casefolded name
+COUNTRY_ALIASES = {
+    'uk': 'GBR',
+    'great britain': 'GBR',
+    'england': 'GBR',
+    'scotland': 'GBR',
+    'wales': 'GBR',
+    'northern ireland': 'GBR',
+    'u.s.': 'USA',
+    'u.s.a.': 'USA',
+    'america': 'USA',
+    'uae': 'ARE',
+    'russia': 'RUS',
+    'turkey': 'TUR',
+    'korea': 'KOR',
+    'ivory coast': 'CIV',
+    'macedonia': 'MKD',
+    'holland': 'NLD',
+    'the netherlands': 'NLD',
+    'deutschland': 'DEU',
+    'brasil': 'BRA',
+    'palestine': 'PSE',
+}
+
+# GPS maps with at most this many points plot them individually
+GPS_RAW_POINT_LIMIT = int(os.getenv('GPS_RAW_POINT_LIMIT', '5000'))
+
+# Upper bound on the cells of a binned GPS map, whatever the dataset size
+GPS_MAX_CELLS = int(os.getenv('GPS_MAX_CELLS', '4000'))
+
+# Grid cells across one 256 px map tile, i.e. cells of about 16 px on screen
+GPS_CELLS_PER_TILE = 16
+
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+# One element of the outer list: a tuple/list of scalars, or None
+_ELEMENT = r'(?:[\(\[][^\(\)\[\]]*[\)\]]|None)'
+
+# A whole value must look like a list (or tuple) of such elements, like the
+# literals ast.literal_eval accepted; anything else yields no coordinates
+LOCATION_DETAIL_PATTERN = re.compile(
+    rf'^\s*[\[\(]\s*(?:{_ELEMENT}\s*(?:,\s*{_ELEMENT}\s*)*,?\s*)?[\]\)]\s*$'
+)
+
+# A valid point: at least two numbers and no None; only the first two are kept
+COORDINATE_PAIR_PATTERN = re.compile(
+    rf'[\(\[]\s*(?P<latitude>{_NUMBER})\s*,\s*(?P<longitude>{_NUMBER})\s*(?:,\s*{_NUMBER}\s*)*,?\s*[\)\]]'
+)
+
+# A one-number point made literal_eval-based parsing fail for the whole value
+SHORT_POINT_PATTERN = re.compile(rf'[\(\[]\s*{_NUMBER}\s*,?\s*[\)\]]')
+
+
+# *************** DATA PROCESSING ***************
+#*************** Explode location_detail into one row per valid GPS point
+def parse_location_details(location_detail: pd.Series) -> pd.DataFrame:
+    """
+    Extract every valid (latitude, longitude) pair of a location_detail column.
+    Args:
+        location_detail (pd.Series): raw location_detail values, indexed by job
+    Returns:
+        pd.DataFrame : job_id (index label of the job), latitude and longitude (float64),
+                       one row per point, in job then point order
+    """
+    text = location_detail.dropna().astype(str)
+    text = text[text.str.match(LOCATION_DETAIL_PATTERN) & ~text.str.contains(SHORT_POINT_PATTERN)]
+    if text.empty:
+        return pd.DataFrame({
+            'job_id': pd.Series(dtype=location_detail.index.dtype),
+            'latitude': pd.Series(dtype='float64'),
+            'longitude': pd.Series(dtype='float64'),
+        })
+
+    pairs = text.str.extractall(COORDINATE_PAIR_PATTERN)
+    return pd.DataFrame({
+        'job_id': pairs.index.get_level_values(0),
+        'latitude': pairs['latitude'].astype('float64').to_numpy(),
+        'longitude': pairs['longitude'].astype('float64').to_numpy(),
+    })
+
+
+#*************** Keep the GPS points of the jobs still present after filtering
+def select_job_coordinates(gps_coords: pd.DataFrame, df: pd.DataFrame, attribute_columns: list = None) -> pd.DataFrame:
+    """
+    Mask the precomputed GPS points down to the jobs of a filtered frame and
+    attach the requested job attributes for hover labels.
+    Args:
+        gps_coords (pd.DataFrame): output of parse_location_details for the whole dataset
+        df (pd.DataFrame): filtered job frame, indexed like the dataset
+        attribute_columns (list): job columns to copy onto each point
+    Returns:
+        pd.DataFrame : GPS points of the jobs in df
+    """
+    geo_df = gps_coords[np.isin(gps_coords['job_id'].to_numpy(), df.index.to_numpy())].reset_index(drop=True)
+    for col in attribute_columns or []:
+        values = df[col].reindex(geo_df['job_id']).to_numpy() if col in df.columns else None
+        geo_df[col] = values
+    return geo_df
+
+
+# *************** DATA PROCESSING: GPS DENSITY ***************
+#*************** Grid cell size matching a map zoom level
+def grid_cell_degrees(zoom: float) -> float:
+    """
+    Size of the grid cells for a web-mercator map zoom level: the world is
+    2 ** zoom tiles wide and each tile holds GPS_CELLS_PER_TILE cells.
+    Args:
+        zoom (float): map zoom level
+    Returns:
+        float : cell size in degrees
+    """
+    return 360.0 / (2 ** zoom * GPS_CELLS_PER_TILE)
+
+
+#*************** Bin GPS points into grid cells
+def bin_coordinates(geo_df: pd.DataFrame, cell_degrees: float, max_cells: int = GPS_MAX_CELLS,
+                    label_columns: list = None) -> pd.DataFrame:
+    """
+    Count the points falling in each latitude/longitude grid cell. Cells are
+    doubled in size until at most max_cells remain.
+    Args:
+        geo_df (pd.DataFrame): points with latitude and longitude columns
+        cell_degrees (float): initial cell size in degrees
+        max_cells (int): maximum number of cells returned
+        label_columns (list): point columns labelling each cell with their most frequent value
+    Returns:
+        pd.DataFrame : one row per non-empty cell: latitude and longitude of
+                       the points' centroid, count, and the label columns
+    """
+    latitude = geo_df['latitude'].to_numpy(dtype='float64')
+    longitude = geo_df['longitude'].to_numpy(dtype='float64')
+
+    # *************** START: Cell Assignment ***************
+    while True:
+        rows = np.floor((latitude + 90.0) / cell_degrees).astype('int64')
+        columns = np.floor((longitude + 180.0) / cell_degrees).astype('int64')
+        cell_keys = rows * (int(np.ceil(360.0 / cell_degrees)) + 1) + columns
+        unique_keys, cell_ids, counts = np.unique(cell_keys, return_inverse=True, return_counts=True)
+        if len(unique_keys) <= max_cells:
+            break
+        cell_degrees *= 2
+    # *************** END: Cell Assignment ***************
+
+    cells = pd.DataFrame({
+        'latitude': np.bincount(cell_ids, weights=latitude) / counts,
+        'longitude': np.bincount(cell_ids, weights=longitude) / counts,
+        'count': counts,
+    })
+
+    for col in label_columns or []:
+        # Most frequent value per cell; ties go to the first value seen
+        labelled = pd.DataFrame({'cell': cell_ids, col: geo_df[col].to_numpy()}).dropna()
+        value_counts = labelled.groupby(['cell', col], sort=False, observed=True).size()
+        top_values = value_counts.sort_values(ascending=False, kind='stable').reset_index().drop_duplicates('cell')
+        cells[col] = top_values.set_index('cell')[col].reindex(cells.index).to_numpy()
+
+    return cells
+
+
+#*************** Points to plot on the GPS map: raw when few, binned otherwise
+def gps_map_points(geo_df: pd.DataFrame, zoom: float, label_columns: list = None) -> tuple:
+    """
+    Keep small point sets as they are and bin larger ones for the given zoom,
+    so the map payload stays bounded.
+    Args:
+        geo_df (pd.DataFrame): output of select_job_coordinates
+        zoom (float): map zoom level
+        label_columns (list): columns labelling each cell (see bin_coordinates)
+    Returns:
+        tuple : (points or cells frame, True when the points were binned)
+    """
+    if len(geo_df) <= GPS_RAW_POINT_LIMIT:
+        return geo_df, False
+    return bin_coordinates(geo_df, grid_cell_degrees(zoom), GPS_MAX_CELLS, label_columns), True
+
+
+# *************** DATA PROCESSING: CITY AND COUNTRY ***************
+#*************** Split "City, Country" locations into two columns in one pass
+def split_location(location: pd.Series) -> tuple:
+    """
+    Split locations on commas: the city is the first part and the country the
+    last part. A location without a comma is used as both. Missing values
+    become the string 'nan', as str() produces.
+    Args:
+        location (pd.Series): raw location column
+    Returns:
+        tuple : (city, country) string Series with the same index
+    """
+    # Split each distinct location once and broadcast through the codes
+    codes, uniques = pd.factorize(location, use_na_sentinel=False)
+    text = pd.Series([str(value) for value in uniques], dtype=object)
+    city = text.str.split(',', n=1).str[0].str.strip().to_numpy()
+    country = text.str.rsplit(',', n=1).str[-1].str.strip().to_numpy()
+    return pd.Series(city[codes], index=location.index), pd.Series(country[codes], index=location.index)
+
+
+# *************** DATA PROCESSING: ISO-3 CODES ***************
+#*************** Resolve one normalized country name, remembering hits and misses
+@lru_cache(maxsize=COUNTRY_CACHE_SIZE)
+def _lookup_iso3(normalized_name: str) -> str | None:
+    if normalized_name in COUNTRY_ALIASES:
+        return COUNTRY_ALIASES[normalized_name]
+
+    # Deferred so pages that never resolve a country do not load the ISO database
+    import pycountry
+
+    try:
+        return pycountry.countries.lookup(normalized_name).alpha_3
+    except LookupError:
+        return None
+
+
+#*************** Map a country name to its ISO Alpha-3 code
+def resolve_iso3(country_name) -> str | None:
+    """
+    Map a country name (or ISO code) to its ISO Alpha-3 code.
+    Args:
+        country_name: country name as found in the data
+    Returns:
+        str | None : ISO Alpha-3 code, or None when the name does not resolve
+    """
+    if not isinstance(country_name, str):
+        return None
+    return _lookup_iso3(country_name.strip().casefold())
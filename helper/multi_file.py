@@ -0,0 +1,168 @@
+"""
+Multi-file ingestion for monthly OpenAI cost and activity exports.
+
+A path setting may name a single CSV, a directory of monthly exports or a
+glob pattern. Each export goes through the per-file Parquet cache (see
+helper.parquet_cache), so only new or changed months are parsed, and the
+files are loaded in parallel. Rows repeated by adjacent exports whose date
+ranges overlap are dropped.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# *************** IMPORTS: HELPERS ***************
+from helper.parquet_cache import get_file_signature, load_cached_frame
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# File name patterns used when a path setting points to a directory
+OPENAI_COST_EXPORT_PATTERN = 'cost-*.csv'
+OPENAI_ACTIVITY_EXPORT_PATTERN = 'activity-*.csv'
+
+# Columns added by the loaders; they derive from the source columns and are
+# left out when comparing rows across exports
+DERIVED_COLUMNS = ['datetime', 'date', 'hour', 'total_tokens']
+
+# pandas' C parser releases the GIL, so threads parse files concurrently
+# without pickling whole frames between processes
+MAX_LOAD_WORKERS = min(8, os.cpu_count() or 1)
+
+GLOB_CHARACTERS = ('*', '?', '[')
+
+
+# *************** HELPERS: PATH RESOLUTION ***************
+#*************** Expand a file, directory or glob setting into export file paths
+def resolve_export_paths(path_spec: str, directory_pattern: str) -> list:
+    """
+    Resolve a path setting into the sorted list of CSV exports it designates.
+    Args:
+        path_spec (str): single file path, directory, or glob pattern
+        directory_pattern (str): file name pattern applied when path_spec is a directory
+    Returns:
+        list : sorted existing file paths (empty when nothing matches)
+    """
+    if not path_spec:
+        return []
+    if os.path.isdir(path_spec):
+        return sorted(glob.glob(os.path.join(path_spec, directory_pattern)))
+    if any(char in path_spec for char in GLOB_CHARACTERS):
+        return sorted(path for path in glob.glob(path_spec) if os.path.isfile(path))
+    return [path_spec] if os.path.isfile(path_spec) else []
+
+
+#*************** Combined size and mtime signature of every export a setting designates
+def get_exports_signature(path_spec: str, directory_pattern: str) -> tuple:
+    """
+    Return a hashable signature that changes whenever an export is added, removed or modified.
+    Args:
+        path_spec (str): single file path, directory, or glob pattern
+        directory_pattern (str): file name pattern applied when path_spec is a directory
+    Returns:
+        tuple : ((path, size, mtime_ns), ...) for every resolved export
+    """
+    signature = []
+    for file_path in resolve_export_paths(path_spec, directory_pattern):
+        file_signature = get_file_signature(file_path)
+        if file_signature is not None:
+            signature.append((file_path, *file_signature))
+    return tuple(signature)
+
+
+# *************** HELPERS: MERGING ***************
+#*************** Give every frame the same categories so concat keeps categorical dtypes
+def align_categories(frames: list) -> list:
+    """
+    Cast each categorical column of several frames to the union of their categories, in place.
+    Args:
+        frames (list): frames about to be concatenated
+    Returns:
+        list : the same frames, sharing one CategoricalDtype per categorical column
+    """
+    categorical_columns = {
+        col for frame in frames for col in frame.columns
+        if isinstance(frame[col].dtype, pd.CategoricalDtype)
+    }
+    for col in categorical_columns:
+        categories = pd.Index([])
+        for frame in frames:
+            if col in frame.columns:
+                values = frame[col].cat.categories if isinstance(frame[col].dtype, pd.CategoricalDtype) \
+                    else pd.Index(frame[col].dropna().unique())
+                categories = categories.union(values, sort=False)
+        for frame in frames:
+            if col in frame.columns:
+                frame[col] = frame[col].astype(pd.CategoricalDtype(categories))
+    return frames
+
+
+#*************** Drop rows that an earlier export already contains
+def _drop_overlapping_rows(df: pd.DataFrame, file_ranges: list) -> pd.DataFrame:
+    """
+    Remove rows repeated across exports. Only rows whose timestamp falls inside
+    another export's range are compared, so non-overlapping months cost nothing.
+    Rows repeated inside a single export are kept.
+    """
+    if 'timestamp' not in df.columns or len(file_ranges) < 2:
+        return df
+
+    file_index = df['_export_index'].to_numpy()
+    timestamps = df['timestamp'].to_numpy()
+    candidate = np.zeros(len(df), dtype=bool)
+    for index, (start, end) in enumerate(file_ranges):
+        candidate |= (file_index != index) & (timestamps >= start) & (timestamps <= end)
+    if not candidate.any():
+        return df
+
+    compare_columns = [col for col in df.columns if col not in DERIVED_COLUMNS]
+    candidates = df.loc[candidate, compare_columns]
+    key_columns = [col for col in compare_columns if col != '_export_index']
+    first_export = candidates.groupby(key_columns, dropna=False, observed=True)['_export_index'].transform('min')
+    repeated = candidates.index[candidates['_export_index'] > first_export]
+    return df.drop(index=repeated)
+
+
+# *************** DATA PROCESSING ***************
+#*************** Load, merge and deduplicate several exports of the same report
+def load_exports(file_paths: list, report_name: str, build_frame, max_workers: int = MAX_LOAD_WORKERS) -> pd.DataFrame:
+    """
+    Load every export through the Parquet cache in parallel and merge them into one frame.
+    Args:
+        file_paths (list): export files, oldest first
+        report_name (str): short report name used to key the Parquet cache
+        build_frame (callable): function parsing one export file into a processed frame
+        max_workers (int): maximum number of files loaded concurrently
+    Returns:
+        pd.DataFrame : merged frame without the rows repeated by overlapping exports
+    """
+    # *************** START: Input Validation ***************
+    if not file_paths:
+        raise ValueError(f"No {report_name} export files to load.")
+    # *************** END: Input Validation ***************
+
+    if len(file_paths) == 1:
+        return load_cached_frame(file_paths[0], report_name, build_frame)
+
+    # *************** START: Parallel Load ***************
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(file_paths)))) as executor:
+        frames = list(executor.map(lambda path: load_cached_frame(path, report_name, build_frame), file_paths))
+    # *************** END: Parallel Load ***************
+
+    # *************** START: Merge And Deduplicate ***************
+    file_ranges = []
+    for index, frame in enumerate(frames):
+        frame['_export_index'] = np.int32(index)
+        if 'timestamp' in frame.columns and len(frame):
+            file_ranges.append((frame['timestamp'].min(), frame['timestamp'].max()))
+        else:
+            file_ranges.append((np.inf, -np.inf))
+
+    df = pd.concat(align_categories(frames), ignore_index=True)
+    df = _drop_overlapping_rows(df, file_ranges)
+    # *************** END: Merge And Deduplicate ***************
+
+    return df.drop(columns='_export_index').reset_index(drop=True)
@@ -0,0 +1,104 @@
+"""
+Single-pass rollups for the OpenAI cost and activity reports.
+
+Every metric and chart of the OpenAI dashboard (overview, cost analysis,
+activity analysis and executive summary) reads from these rollups, so each
+loaded dataset is grouped exactly once.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+from dataclasses import dataclass
+
+import pandas as pd
+
+# *************** IMPORTS: HELPERS ***************
+from helper.schemas import widen_for_sum
+
+
+# *************** MODELS ***************
+@dataclass
+class CostRollups:
+    total_cost: float
+    mean_cost: float
+    record_count: int
+    day_count: int
+    # cost_in_major summed per date, indexed by date
+    daily_cost: pd.Series
+    # cost_in_major summed per service name, None when the export has no name column
+    service_cost: pd.Series | None
+
+
+@dataclass
+class ActivityRollups:
+    total_requests: float
+    total_tokens: float
+    record_count: int
+    # num_requests summed per date, indexed by date
+    daily_requests: pd.Series
+    # num_requests summed per model, None when the export has no model column
+    model_requests: pd.Series | None
+    # num_requests summed per user, None when the export has no user column
+    user_requests: pd.Series | None
+
+    @property
+    def unique_users(self) -> int:
+        return len(self.user_requests) if self.user_requests is not None else 0
+
+
+# *************** DATA PROCESSING ***************
+#*************** Sum a value column per key in one grouped pass
+def _sum_by(df: pd.DataFrame, key_column: str, value_column: str) -> pd.Series | None:
+    if key_column not in df.columns:
+        return None
+    return widen_for_sum(df[value_column]).groupby(df[key_column], observed=True).sum()
+
+
+#*************** Compute every cost rollup used by the OpenAI dashboard
+def build_cost_rollups(cost_df: pd.DataFrame) -> CostRollups:
+    """
+    Compute the totals, daily and per-service cost rollups of an OpenAI cost export.
+    Args:
+        cost_df (pd.DataFrame): processed cost frame with date and cost_in_major columns
+    Returns:
+        CostRollups : totals and grouped series for the cost report
+    """
+    # *************** START: Input Validation ***************
+    missing_columns = [col for col in ['date', 'cost_in_major'] if col not in cost_df.columns]
+    if missing_columns:
+        raise ValueError(f"Cost data is missing required columns: {', '.join(missing_columns)}")
+    # *************** END: Input Validation ***************
+
+    daily_cost = _sum_by(cost_df, 'date', 'cost_in_major')
+    return CostRollups(
+        total_cost=cost_df['cost_in_major'].sum(),
+        mean_cost=cost_df['cost_in_major'].mean(),
+        record_count=len(cost_df),
+        day_count=len(daily_cost),
+        daily_cost=daily_cost,
+        service_cost=_sum_by(cost_df, 'name', 'cost_in_major'),
+    )
+
+
+#*************** Compute every activity rollup used by the OpenAI dashboard
+def build_activity_rollups(activity_df: pd.DataFrame) -> ActivityRollups:
+    """
+    Compute the totals, daily, per-model and per-user rollups of an OpenAI activity export.
+    Args:
+        activity_df (pd.DataFrame): processed activity frame with date, num_requests and total_tokens columns
+    Returns:
+        ActivityRollups : totals and grouped series for the activity report
+    """
+    # *************** START: Input Validation ***************
+    missing_columns = [col for col in ['date', 'num_requests', 'total_tokens'] if col not in activity_df.columns]
+    if missing_columns:
+        raise ValueError(f"Activity data is missing required columns: {', '.join(missing_columns)}")
+    # *************** END: Input Validation ***************
+
+    return ActivityRollups(
+        total_requests=widen_for_sum(activity_df['num_requests']).sum(),
+        total_tokens=widen_for_sum(activity_df['total_tokens']).sum(),
+        record_count=len(activity_df),
+        daily_requests=_sum_by(activity_df, 'date', 'num_requests'),
+        model_requests=_sum_by(activity_df, 'model', 'num_requests'),
+        user_requests=_sum_by(activity_df, 'user', 'num_requests'),
+    )
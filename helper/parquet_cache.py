@@ -0,0 +1,171 @@
+"""
+On-disk columnar cache for processed report frames.
+
+Parsing a large CSV export and re-running the timestamp and numeric
+conversions is the slowest part of a cold start. This module stores the
+already-typed frame (including derived columns) as Parquet so the next load
+is a memory-mapped read instead of a full parse.
+
+The content hash of each source is recorded in its own manifest entry file,
+keyed by the source path, so processes loading different files in parallel
+(see helper.batch_reports) never overwrite each other's entries.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Directory holding the cached Parquet files and the signature manifest
+REPORT_CACHE_DIR = os.getenv('REPORT_CACHE_DIR', '.report_cache')
+
+# Bump whenever a loader changes the shape or dtypes of the frame it builds,
+# so stale cache entries from an older layout are never served
+FRAME_CACHE_VERSION = 2
+
+# Block size used when hashing source files
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Subdirectory of REPORT_CACHE_DIR holding one manifest entry file per source
+MANIFEST_DIR_NAME = 'manifest'
+
+LOGGER = logging.getLogger(__name__)
+
+
+# *************** CUSTOM EXCEPTIONS ***************
+class FrameCacheError(Exception):
+    pass
+
+
+# *************** HELPERS: FILE SIGNATURES ***************
+#*************** Cheap identity of a file based on its size and modification time
+def get_file_signature(file_path: str) -> tuple | None:
+    """
+    Return the size and modification time of a file, used as a cheap change detector.
+    Args:
+        file_path (str): path to the source file
+    Returns:
+        tuple | None : (size_in_bytes, mtime_ns), or None when the file does not exist
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return None
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+#*************** Hash the full content of a file
+def compute_content_hash(file_path: str) -> str:
+    """
+    Hash the content of a file in fixed-size blocks.
+    Args:
+        file_path (str): path to the source file
+    Returns:
+        str : hexadecimal BLAKE2b digest of the file content
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as source_file:
+        for block in iter(lambda: source_file.read(HASH_CHUNK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _manifest_entry_path(absolute_path: str) -> str:
+    path_hash = hashlib.blake2b(absolute_path.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(REPORT_CACHE_DIR, MANIFEST_DIR_NAME, f"{path_hash}.json")
+
+
+def _read_manifest_entry(absolute_path: str) -> dict | None:
+    try:
+        with open(_manifest_entry_path(absolute_path), 'r', encoding='utf-8') as entry_file:
+            entry = json.load(entry_file)
+    except (OSError, ValueError):
+        return None
+    # Guards against a path hash collision
+    return entry if entry.get('path') == absolute_path else None
+
+
+def _write_manifest_entry(absolute_path: str, entry: dict) -> None:
+    entry_path = _manifest_entry_path(absolute_path)
+    os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+    # Unique per process and thread; the rename replaces the entry atomically
+    temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as entry_file:
+        json.dump({'path': absolute_path, **entry}, entry_file)
+    os.replace(temp_path, entry_path)
+
+
+#*************** Resolve the content hash, skipping the rehash when size and mtime are unchanged
+def resolve_content_hash(file_path: str, signature: tuple) -> str:
+    """
+    Return the content hash of a file, reusing the hash recorded in the manifest
+    when the file size and modification time have not changed.
+    Args:
+        file_path (str): path to the source file
+        signature (tuple): (size_in_bytes, mtime_ns) from get_file_signature
+    Returns:
+        str : content hash of the file
+    """
+    absolute_path = os.path.abspath(file_path)
+    size, mtime_ns = signature
+
+    entry = _read_manifest_entry(absolute_path)
+    if entry and entry.get('size') == size and entry.get('mtime_ns') == mtime_ns:
+        return entry['content_hash']
+
+    content_hash = compute_content_hash(file_path)
+    try:
+        _write_manifest_entry(absolute_path, {'size': size, 'mtime_ns': mtime_ns, 'content_hash': content_hash})
+    except OSError as error:
+        LOGGER.warning("Could not update frame cache manifest: %s", error)
+    return content_hash
+
+
+# *************** DATA PROCESSING ***************
+#*************** Load a processed frame from the Parquet cache, building it on a miss
+def load_cached_frame(file_path: str, report_name: str, build_frame) -> pd.DataFrame:
+    """
+    Return the processed frame for a source file, served from the on-disk
+    Parquet cache when the file content has not changed since the last build.
+    Args:
+        file_path (str): path to the source CSV file
+        report_name (str): short name of the report, part of the cache key
+        build_frame (callable): function taking file_path and returning the processed DataFrame
+    Returns:
+        pd.DataFrame : processed frame with every derived column already computed
+    """
+    # *************** START: Input Validation ***************
+    if not report_name:
+        raise FrameCacheError("A report name is required to key the frame cache.")
+    signature = get_file_signature(file_path)
+    if signature is None:
+        raise FrameCacheError(f"File not found: {file_path}")
+    # *************** END: Input Validation ***************
+
+    # *************** START: Cache Lookup ***************
+    content_hash = resolve_content_hash(file_path, signature)
+    cache_path = os.path.join(REPORT_CACHE_DIR, f"{report_name}-v{FRAME_CACHE_VERSION}-{content_hash}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path, memory_map=True)
+        except Exception as error:
+            LOGGER.warning("Discarding unreadable frame cache %s: %s", cache_path, error)
+    # *************** END: Cache Lookup ***************
+
+    # *************** START: Build And Store ***************
+    df = build_frame(file_path)
+    try:
+        os.makedirs(REPORT_CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, cache_path)
+    except Exception as error:
+        LOGGER.warning("Could not write frame cache for %s: %s", file_path, error)
+    # *************** END: Build And Store ***************
+
+    return df
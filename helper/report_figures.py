@@ -0,0 +1,182 @@
+"""
+Plotly figures of the OpenAI and AstraDB reports.
+
+Each builder takes the rollups the dashboard already computes and returns a
+plain plotly figure, so the same charts are rendered by st.plotly_chart in
+the dashboard and written to HTML or images by the batch generator. Figures
+go through the shared figure cache (helper.figure_cache), keyed by the
+aggregate each chart plots.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import plotly.express as px
+import plotly.graph_objects as go
+
+# *************** IMPORTS: HELPERS ***************
+from helper.astradb_cube import AstraDBCube
+from helper.figure_cache import cached_figure
+from helper.openai_rollups import ActivityRollups, CostRollups
+
+
+# *************** DATA PROCESSING: OPENAI ***************
+#*************** Daily cost trend
+def openai_daily_cost_figure(cost_rollups: CostRollups) -> go.Figure:
+    daily_cost = cost_rollups.daily_cost.reset_index()
+
+    def build():
+        fig_daily = px.line(daily_cost, x='date', y='cost_in_major',
+                           title='Daily Cost Trend',
+                           labels={'cost_in_major': 'Cost (USD)', 'date': 'Date'})
+        fig_daily.update_traces(line_color='#FF6B6B')
+        return fig_daily
+
+    return cached_figure('openai_daily_cost', daily_cost, build)
+
+
+#*************** Cost of the ten most expensive services (None without a service column)
+def openai_service_cost_figure(cost_rollups: CostRollups) -> go.Figure | None:
+    if cost_rollups.service_cost is None:
+        return None
+    service_cost = cost_rollups.service_cost.reset_index()
+    service_cost = service_cost.sort_values('cost_in_major', ascending=False).head(10)
+
+    def build():
+        fig_service = px.bar(service_cost, x='cost_in_major', y='name',
+                           orientation='h', title='Cost by Service (Top 10)',
+                           labels={'cost_in_major': 'Cost (USD)', 'name': 'Service'})
+        fig_service.update_layout(yaxis={'categoryorder': 'total ascending'})
+        return fig_service
+
+    return cached_figure('openai_service_cost', service_cost, build)
+
+
+#*************** Daily API requests
+def openai_daily_requests_figure(activity_rollups: ActivityRollups) -> go.Figure:
+    daily_requests = activity_rollups.daily_requests.reset_index()
+
+    def build():
+        fig_requests = px.line(daily_requests, x='date', y='num_requests',
+                              title='Daily API Requests',
+                              labels={'num_requests': 'Number of Requests', 'date': 'Date'})
+        fig_requests.update_traces(line_color='#45B7D1')
+        return fig_requests
+
+    return cached_figure('openai_daily_requests', daily_requests, build)
+
+
+#*************** Requests per model (None without a model column)
+def openai_model_usage_figure(activity_rollups: ActivityRollups) -> go.Figure | None:
+    if activity_rollups.model_requests is None:
+        return None
+    model_usage = activity_rollups.model_requests.reset_index()
+    model_usage = model_usage.sort_values('num_requests', ascending=False)
+
+    def build():
+        fig_models = px.bar(model_usage, x='num_requests', y='model',
+                           orientation='h', title='Usage by Model',
+                           labels={'num_requests': 'Number of Requests'})
+        fig_models.update_layout(yaxis={'categoryorder': 'total ascending'})
+        return fig_models
+
+    return cached_figure('openai_model_usage', model_usage, build)
+
+
+# *************** DATA PROCESSING: ASTRADB ***************
+#*************** Cost per usage type
+def astradb_usage_type_figure(cube: AstraDBCube) -> go.Figure:
+    cost_by_type = cube.rollup('USAGE_TYPE').reset_index()
+
+    def build():
+        fig1 = px.bar(cost_by_type, x='USAGE_TYPE', y='CALCULATED_COST',
+                     title="Cost Distribution by Usage Type",
+                     labels={'CALCULATED_COST': 'Cost ($)', 'USAGE_TYPE': 'Usage Type'})
+        fig1.update_traces(marker_color='lightblue')
+        return fig1
+
+    return cached_figure('astradb_usage_type_cost', cost_by_type, build)
+
+
+#*************** Cost share per cloud provider (None without a provider column)
+def astradb_provider_figure(cube: AstraDBCube) -> go.Figure | None:
+    if not cube.has_dimension('CLOUD_PROVIDER'):
+        return None
+    cost_by_provider = cube.rollup('CLOUD_PROVIDER').reset_index()
+    return cached_figure('astradb_provider_cost', cost_by_provider,
+                         lambda: px.pie(cost_by_provider, values='CALCULATED_COST', names='CLOUD_PROVIDER',
+                                        title="Cost Distribution by Cloud Provider"))
+
+
+#*************** Cost over time (None for a single billing period)
+def astradb_cost_trend_figure(cube: AstraDBCube) -> go.Figure | None:
+    if not (cube.has_dimension('BREAKDOWN_START_TIMESTAMP_DATE') and cube.nunique('BREAKDOWN_START_TIMESTAMP_DATE') > 1):
+        return None
+    time_series = cube.rollup('BREAKDOWN_START_TIMESTAMP_DATE').reset_index()
+
+    def build():
+        fig3 = px.line(time_series, x='BREAKDOWN_START_TIMESTAMP_DATE', y='CALCULATED_COST',
+                      title="Cost Trend Over Time",
+                      labels={'CALCULATED_COST': 'Cost ($)', 'BREAKDOWN_START_TIMESTAMP_DATE': 'Date'})
+        fig3.update_traces(line_color='orange')
+        return fig3
+
+    return cached_figure('astradb_cost_trend', time_series, build)
+
+
+#*************** Cost per region (None without a region column)
+def astradb_region_figure(cube: AstraDBCube) -> go.Figure | None:
+    if not cube.has_dimension('REGION'):
+        return None
+    region_cost = cube.rollup('REGION').reset_index()
+    return cached_figure('astradb_region_cost', region_cost,
+                         lambda: px.bar(region_cost, x='REGION', y='CALCULATED_COST',
+                                        title="Cost by Region"))
+
+
+#*************** Cost share per organization (None without an organization column)
+def astradb_org_figure(cube: AstraDBCube) -> go.Figure | None:
+    if not cube.has_dimension('ORG_NAME'):
+        return None
+    org_cost = cube.rollup('ORG_NAME').reset_index()
+    return cached_figure('astradb_org_cost', org_cost,
+                         lambda: px.pie(org_cost, values='CALCULATED_COST', names='ORG_NAME',
+                                        title="Cost by Organization"))
+
+
+# *************** DATA PROCESSING: REPORTS ***************
+#*************** Every chart of the OpenAI report, by name
+def openai_report_figures(cost_rollups: CostRollups | None, activity_rollups: ActivityRollups | None) -> dict:
+    """
+    Build every OpenAI chart available for the loaded rollups.
+    Args:
+        cost_rollups (CostRollups | None): cost rollups
+        activity_rollups (ActivityRollups | None): activity rollups
+    Returns:
+        dict : chart name to plotly figure, charts without data left out
+    """
+    figures = {}
+    if cost_rollups is not None:
+        figures['daily_cost'] = openai_daily_cost_figure(cost_rollups)
+        figures['service_cost'] = openai_service_cost_figure(cost_rollups)
+    if activity_rollups is not None:
+        figures['daily_requests'] = openai_daily_requests_figure(activity_rollups)
+        figures['model_usage'] = openai_model_usage_figure(activity_rollups)
+    return {name: fig for name, fig in figures.items() if fig is not None}
+
+
+#*************** Every chart of the AstraDB report, by name
+def astradb_report_figures(cube: AstraDBCube) -> dict:
+    """
+    Build every AstraDB chart available for the cube.
+    Args:
+        cube (AstraDBCube): cube of the loaded report
+    Returns:
+        dict : chart name to plotly figure, charts without data left out
+    """
+    figures = {
+        'usage_type_cost': astradb_usage_type_figure(cube),
+        'provider_cost': astradb_provider_figure(cube),
+        'cost_trend': astradb_cost_trend_figure(cube),
+        'region_cost': astradb_region_figure(cube),
+        'org_cost': astradb_org_figure(cube),
+    }
+    return {name: fig for name, fig in figures.items() if fig is not None}
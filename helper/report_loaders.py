@@ -0,0 +1,126 @@
+"""
+CSV parsing and type conversion for the OpenAI and AstraDB exports.
+
+The process_* functions work on any frame (a whole file or a single chunk of
+it), the read_* functions parse a full CSV file. Neither depends on Streamlit,
+so the dashboards and offline tooling share the same loading logic.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import pandas as pd
+
+# *************** IMPORTS: VALIDATORS ***************
+from helper.schemas import (
+    ASTRADB_SCHEMA,
+    OPENAI_ACTIVITY_SCHEMA,
+    OPENAI_COST_SCHEMA,
+    apply_schema,
+    read_dtypes,
+    validate_schema,
+)
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+OPENAI_ACTIVITY_NUMERIC_COLUMNS = [
+    'n_context_tokens_total',
+    'n_generated_tokens_total',
+    'n_cached_context_tokens_total',
+    'n_context_audio_tokens_total',
+    'n_generated_audio_tokens_total',
+    'num_requests',
+]
+ASTRADB_TIMESTAMP_COLUMNS = ['BREAKDOWN_START_TIMESTAMP', 'BREAKDOWN_END_TIMESTAMP']
+ASTRADB_NUMERIC_COLUMNS = ['CALCULATED_COST', 'USAGE', 'UNIT_PRICE']
+
+
+# *************** HELPERS ***************
+#*************** Derive datetime, date and hour from a unix timestamp column
+def _add_timestamp_columns(df: pd.DataFrame) -> None:
+    if 'timestamp' in df.columns:
+        df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
+        df['date'] = df['datetime'].dt.date
+        df['hour'] = df['datetime'].dt.hour
+
+
+# *************** DATA PROCESSING: OPENAI COST ***************
+#*************** Type the columns of an OpenAI cost frame
+def process_openai_cost_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert timestamps and cost columns of a raw OpenAI cost frame, in place.
+    Args:
+        df (pd.DataFrame): raw frame as parsed from the cost CSV
+    Returns:
+        pd.DataFrame : the same frame with datetime, date and hour added
+    """
+    _add_timestamp_columns(df)
+
+    if 'cost' in df.columns:
+        df['cost'] = pd.to_numeric(df['cost'], errors='coerce')
+
+    if 'cost_in_major' in df.columns:
+        df['cost_in_major'] = pd.to_numeric(df['cost_in_major'], errors='coerce')
+
+    return df
+
+
+def read_openai_cost_csv(file_path: str) -> pd.DataFrame:
+    """Parse an OpenAI cost CSV, validate it and derive the typed columns"""
+    df = pd.read_csv(file_path, dtype=read_dtypes(OPENAI_COST_SCHEMA))
+    validate_schema(df, OPENAI_COST_SCHEMA)
+    return apply_schema(process_openai_cost_frame(df), OPENAI_COST_SCHEMA)
+
+
+# *************** DATA PROCESSING: OPENAI ACTIVITY ***************
+#*************** Type the columns of an OpenAI activity frame
+def process_openai_activity_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert timestamps and token counters of a raw OpenAI activity frame, in place.
+    Args:
+        df (pd.DataFrame): raw frame (or chunk) as parsed from the activity CSV
+    Returns:
+        pd.DataFrame : the same frame with datetime, date, hour and total_tokens added
+    """
+    _add_timestamp_columns(df)
+
+    for col in OPENAI_ACTIVITY_NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    if 'n_context_tokens_total' in df.columns and 'n_generated_tokens_total' in df.columns:
+        df['total_tokens'] = df['n_context_tokens_total'].fillna(0) + df['n_generated_tokens_total'].fillna(0)
+
+    return df
+
+
+def read_openai_activity_csv(file_path: str) -> pd.DataFrame:
+    """Parse an OpenAI activity CSV, validate it and derive the typed columns"""
+    df = pd.read_csv(file_path, dtype=read_dtypes(OPENAI_ACTIVITY_SCHEMA))
+    validate_schema(df, OPENAI_ACTIVITY_SCHEMA)
+    return apply_schema(process_openai_activity_frame(df), OPENAI_ACTIVITY_SCHEMA)
+
+
+# *************** DATA PROCESSING: ASTRADB ***************
+#*************** Type the columns of an AstraDB usage frame
+def process_astradb_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert timestamps and cost columns of a raw AstraDB usage frame, in place.
+    Args:
+        df (pd.DataFrame): raw frame as parsed from the AstraDB report CSV
+    Returns:
+        pd.DataFrame : the same frame with *_DATE columns added
+    """
+    for col in ASTRADB_TIMESTAMP_COLUMNS:
+        if col in df.columns:
+            df[f'{col}_DATE'] = pd.to_datetime(df[col]).dt.date
+
+    for col in ASTRADB_NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    return df
+
+
+def read_astradb_csv(file_path: str) -> pd.DataFrame:
+    """Parse an AstraDB usage CSV, validate it and derive the typed columns"""
+    df = pd.read_csv(file_path, dtype=read_dtypes(ASTRADB_SCHEMA))
+    validate_schema(df, ASTRADB_SCHEMA)
+    return apply_schema(process_astradb_frame(df), ASTRADB_SCHEMA)
@@ -0,0 +1,147 @@
+"""
+Executive summary metrics for the OpenAI and AstraDB reports.
+
+The numbers behind the dashboard's executive summaries are computed here from
+the rollups, without Streamlit, so the dashboard and the headless batch
+generator (report_batch.py) report exactly the same figures.
+"""
+
+# *************** IMPORTS: HELPERS ***************
+from helper.astradb_cube import AstraDBCube
+from helper.openai_rollups import ActivityRollups, CostRollups
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+OPENAI_RECOMMENDATIONS = [
+    "🎯 **Cost Optimization**: Monitor high-cost operations and implement batching where possible",
+    "📊 **Regular Monitoring**: Set up automated reports to track usage trends",
+    "💰 **Budget Planning**: Use historical data to forecast future OpenAI spending",
+    "🔍 **Usage Audit**: Review API usage patterns to ensure optimal efficiency"
+]
+
+ASTRADB_RECOMMENDATIONS = [
+    "🎯 **Resource Optimization**: Review underutilized resources in expensive regions",
+    "💰 **Cost Control**: Implement budget alerts for high-cost usage types",
+    "🌍 **Regional Strategy**: Consider resource distribution across cost-effective regions",
+    "📊 **Usage Monitoring**: Set up regular reports to track resource consumption patterns"
+]
+
+
+# *************** DATA PROCESSING: OPENAI ***************
+#*************** Key figures of the OpenAI executive summary
+def openai_summary_metrics(cost_rollups: CostRollups | None, activity_rollups: ActivityRollups | None) -> dict:
+    """
+    Compute the OpenAI executive summary figures from whichever rollups are loaded.
+    Args:
+        cost_rollups (CostRollups | None): cost rollups
+        activity_rollups (ActivityRollups | None): activity rollups
+    Returns:
+        dict : summary figures; keys of a missing report are left out
+    """
+    metrics = {}
+
+    if cost_rollups is not None:
+        metrics.update({
+            'total_cost': cost_rollups.total_cost,
+            'daily_avg_cost': cost_rollups.daily_cost.mean(),
+            'peak_cost_day': cost_rollups.daily_cost.idxmax(),
+            'peak_cost_amount': cost_rollups.daily_cost.max(),
+        })
+        if cost_rollups.service_cost is not None:
+            metrics.update({
+                'top_service': cost_rollups.service_cost.idxmax(),
+                'top_service_pct': (cost_rollups.service_cost.max() / cost_rollups.total_cost) * 100,
+            })
+
+    if activity_rollups is not None:
+        metrics.update({
+            'total_requests': activity_rollups.total_requests,
+            'total_tokens': activity_rollups.total_tokens,
+            'daily_avg_requests': activity_rollups.daily_requests.mean(),
+        })
+
+    if cost_rollups is not None and activity_rollups is not None:
+        metrics.update({
+            'cost_per_request': metrics['total_cost'] / metrics['total_requests'],
+            'cost_per_1k_tokens': (metrics['total_cost'] / metrics['total_tokens']) * 1000,
+        })
+
+    return metrics
+
+
+#*************** Markdown lines of the OpenAI key findings
+def openai_summary_insights(metrics: dict) -> list:
+    """
+    Format the OpenAI summary figures as the key findings shown to stakeholders.
+    Args:
+        metrics (dict): output of openai_summary_metrics
+    Returns:
+        list : markdown lines
+    """
+    insights = []
+
+    if 'total_cost' in metrics:
+        insights.extend([
+            f"💰 **Total OpenAI spend**: ${metrics['total_cost']:.2f} for the analyzed period",
+            f"📊 **Daily average cost**: ${metrics['daily_avg_cost']:.2f}",
+            f"📈 **Peak cost day**: {metrics['peak_cost_day']} with ${metrics['peak_cost_amount']:.2f}"
+        ])
+        if 'top_service' in metrics:
+            insights.append(f"🔧 **Most expensive service**: {metrics['top_service']} ({metrics['top_service_pct']:.1f}% of total cost)")
+
+    if 'total_requests' in metrics:
+        insights.extend([
+            f"🔄 **Total API requests**: {metrics['total_requests']:,}",
+            f"🔤 **Total tokens processed**: {metrics['total_tokens']:,}",
+            f"📊 **Daily average requests**: {metrics['daily_avg_requests']:.0f}"
+        ])
+
+    if 'cost_per_request' in metrics:
+        insights.extend([
+            f"💡 **Cost per request**: ${metrics['cost_per_request']:.4f}",
+            f"💡 **Cost per 1,000 tokens**: ${metrics['cost_per_1k_tokens']:.4f}"
+        ])
+
+    return insights
+
+
+# *************** DATA PROCESSING: ASTRADB ***************
+#*************** Key figures of the AstraDB executive summary
+def astradb_summary_metrics(cube: AstraDBCube) -> dict:
+    """
+    Compute the AstraDB executive summary figures from the rollup cube.
+    Args:
+        cube (AstraDBCube): cube of the loaded report
+    Returns:
+        dict : summary figures
+    """
+    total_cost = cube.total_cost
+    cost_by_usage_type = cube.rollup('USAGE_TYPE')
+    cost_by_region = cube.rollup('REGION')
+
+    return {
+        'total_cost': total_cost,
+        'unique_orgs': cube.nunique('ORG_NAME'),
+        'unique_resources': cube.nunique('RESOURCE_NAME'),
+        'top_usage_type': cost_by_usage_type.idxmax(),
+        'top_usage_pct': (cost_by_usage_type.max() / total_cost) * 100,
+        'top_region': cost_by_region.idxmax(),
+        'top_region_pct': (cost_by_region.max() / total_cost) * 100,
+    }
+
+
+#*************** Markdown lines of the AstraDB key findings
+def astradb_summary_insights(metrics: dict) -> list:
+    """
+    Format the AstraDB summary figures as the key findings shown to stakeholders.
+    Args:
+        metrics (dict): output of astradb_summary_metrics
+    Returns:
+        list : markdown lines
+    """
+    return [
+        f"💰 **Total AstraDB spend**: ${metrics['total_cost']:.2f}",
+        f"🏢 **Organizations**: {metrics['unique_orgs']}",
+        f"🛠️ **Unique resources**: {metrics['unique_resources']}",
+        f"📊 **Most expensive usage type**: {metrics['top_usage_type']} ({metrics['top_usage_pct']:.1f}% of total)",
+        f"🌍 **Most expensive region**: {metrics['top_region']} ({metrics['top_region_pct']:.1f}% of total)"
+    ]
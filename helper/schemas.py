@@ -0,0 +1,188 @@
+"""
+Explicit column schemas for every report the dashboards load.
+
+Low-cardinality string columns are read as categoricals and counters are
+downcast to the smallest integer dtype that holds them, which cuts the memory
+of each cached frame and speeds up groupby and value_counts. Each schema also
+lists the columns a report cannot be rendered without, validated at load time.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+
+# *************** CUSTOM EXCEPTIONS ***************
+class SchemaValidationError(Exception):
+    pass
+
+
+# *************** MODELS ***************
+@dataclass(frozen=True)
+class ReportSchema:
+    name: str
+    # Columns the report cannot be rendered without
+    required_columns: list = field(default_factory=list)
+    # Low-cardinality string columns stored as pandas categoricals
+    categorical_columns: list = field(default_factory=list)
+    # Non-negative count columns downcast to the smallest integer dtype
+    counter_columns: list = field(default_factory=list)
+    # Measurements where single precision is enough (ratings, not money)
+    float32_columns: list = field(default_factory=list)
+
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Costs stay float64: float32 sums drift by whole cents on large exports
+OPENAI_COST_SCHEMA = ReportSchema(
+    name='openai_cost',
+    required_columns=['timestamp', 'cost_in_major'],
+    categorical_columns=['name', 'project_id', 'line_item', 'organization_id'],
+)
+
+OPENAI_ACTIVITY_SCHEMA = ReportSchema(
+    name='openai_activity',
+    required_columns=['timestamp', 'num_requests', 'n_context_tokens_total', 'n_generated_tokens_total'],
+    categorical_columns=['model', 'user', 'project_id', 'api_key_id', 'organization_id', 'batch'],
+    counter_columns=[
+        'n_context_tokens_total',
+        'n_generated_tokens_total',
+        'n_cached_context_tokens_total',
+        'n_context_audio_tokens_total',
+        'n_generated_audio_tokens_total',
+        'num_requests',
+        'total_tokens',
+    ],
+)
+
+ASTRADB_SCHEMA = ReportSchema(
+    name='astradb',
+    required_columns=['CALCULATED_COST', 'USAGE', 'USAGE_TYPE', 'REGION', 'ORG_NAME', 'RESOURCE_NAME'],
+    categorical_columns=['USAGE_TYPE', 'REGION', 'CLOUD_PROVIDER', 'ORG_NAME', 'RESOURCE_NAME', 'ORG_ID', 'RESOURCE_ID'],
+)
+
+JOB_SCHEMA = ReportSchema(
+    name='jobs',
+    categorical_columns=[
+        'source',
+        'company',
+        'location',
+        'city',
+        'country',
+        'job_type',
+        'job_contract',
+        'job_category',
+        'standardized_level',
+        'company_size',
+        'company_size_clean',
+    ],
+    float32_columns=['company_rating'],
+)
+
+
+# *************** VALIDATORS ***************
+#*************** Fail fast when a report is missing columns it cannot be rendered without
+def validate_schema(df: pd.DataFrame, schema: ReportSchema) -> bool:
+    """
+    Check that every required column of a schema is present.
+    Args:
+        df (pd.DataFrame): frame to validate
+        schema (ReportSchema): expected schema of the report
+    Returns:
+        bool : True when the frame is valid, otherwise SchemaValidationError is raised
+    """
+    missing_columns = [col for col in schema.required_columns if col not in df.columns]
+    if missing_columns:
+        raise SchemaValidationError(
+            f"{schema.name} data is missing required columns: {', '.join(missing_columns)}"
+        )
+    return True
+
+
+# *************** DATA PROCESSING ***************
+#*************** dtype mapping for pd.read_csv
+def read_dtypes(schema: ReportSchema) -> dict:
+    """
+    Return the dtype mapping that reads the schema's string columns as categoricals.
+    Args:
+        schema (ReportSchema): schema of the report being parsed
+    Returns:
+        dict : column name to dtype, suitable for pd.read_csv(dtype=...)
+    """
+    return {col: 'category' for col in schema.categorical_columns}
+
+
+#*************** Downcast an integral counter column, leaving columns with gaps or fractions as float64
+def downcast_counter(series: pd.Series) -> pd.Series:
+    """
+    Convert a counter column to the smallest integer dtype that holds it.
+    Args:
+        series (pd.Series): raw or numeric counter column
+    Returns:
+        pd.Series : integer column when every value is a whole number, otherwise float64
+    """
+    numeric = pd.to_numeric(series, errors='coerce')
+    if numeric.dtype.kind == 'f' and (numeric.isna().any() or not np.array_equal(numeric, np.floor(numeric))):
+        return numeric
+    downcast = 'unsigned' if len(numeric) == 0 or numeric.min() >= 0 else 'integer'
+    return pd.to_numeric(numeric, downcast=downcast)
+
+
+#*************** Cast a processed frame to its compact schema dtypes, in place
+def apply_schema(df: pd.DataFrame, schema: ReportSchema) -> pd.DataFrame:
+    """
+    Convert the columns of a processed frame to the dtypes declared by its schema.
+    Args:
+        df (pd.DataFrame): processed frame
+        schema (ReportSchema): schema of the report
+    Returns:
+        pd.DataFrame : the same frame with categorical, counter and float32 columns converted
+    """
+    for col in schema.categorical_columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+    for col in schema.counter_columns:
+        if col in df.columns:
+            df[col] = downcast_counter(df[col])
+
+    for col in schema.float32_columns:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+
+    return df
+
+
+#*************** Widen a downcast column so sums cannot overflow
+def widen_for_sum(series: pd.Series) -> pd.Series:
+    """
+    Return a counter column as int64, uint64 or float64 before summing it.
+    Args:
+        series (pd.Series): numeric column, possibly downcast
+    Returns:
+        pd.Series : column in a 64-bit dtype (no copy when already 64-bit)
+    """
+    wide_dtype = {'u': 'uint64', 'i': 'int64', 'f': 'float64', 'b': 'int64'}.get(series.dtype.kind)
+    if wide_dtype is None or series.dtype == wide_dtype:
+        return series
+    return series.astype(wide_dtype)
+
+
+#*************** Drop categories that no longer occur after filtering
+def drop_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Remove unused categories from every categorical column, so value_counts and
+    nunique on a filtered frame only report values that are actually present.
+    Args:
+        df (pd.DataFrame): filtered frame
+    Returns:
+        pd.DataFrame : frame whose categoricals only hold observed categories
+    """
+    categorical_columns = [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+    if not categorical_columns:
+        return df
+    df = df.copy(deep=False)
+    for col in categorical_columns:
+        df[col] = df[col].cat.remove_unused_categories()
+    return df
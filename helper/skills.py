@@ -0,0 +1,119 @@
+"""
+Skill tokenization for the scraped job dataset.
+
+skills_needed is a free-text list ("Python, SQL; Spark"). It is tokenized
+once at load time into an exploded job/skill table, so skill counts for any
+filter, per-source counts and skill co-occurrence are array reductions
+instead of a Python loop over every posting on every render.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import numpy as np
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Delimiters separating skills inside skills_needed
+SKILL_DELIMITER_PATTERN = r'[,;|\n]'
+
+# Skill sets are packed into one 64-bit mask per job for co-occurrence counts
+MAX_COOCCURRENCE_SKILLS = 64
+
+
+# *************** DATA PROCESSING ***************
+#*************** Explode skills_needed into one row per (job, skill)
+def tokenize_skills(skills_needed: pd.Series) -> pd.DataFrame:
+    """
+    Split every skills string on the delimiters, strip and lowercase each skill
+    and drop empty tokens. Non-string values are ignored.
+    Args:
+        skills_needed (pd.Series): raw skills_needed column, indexed by job
+    Returns:
+        pd.DataFrame : job_id (index label of the job) and skill (categorical),
+                       one row per skill mention, in job then mention order
+    """
+    try:
+        # .str yields NaN for non-string values, which are dropped below
+        tokens = skills_needed.str.split(SKILL_DELIMITER_PATTERN, regex=True).explode()
+    except AttributeError:
+        # No string values at all
+        tokens = pd.Series(dtype=object)
+    tokens = tokens.str.strip().str.lower() if len(tokens) else tokens
+    tokens = tokens[tokens.notna() & (tokens != '')]
+
+    return pd.DataFrame({
+        'job_id': tokens.index.to_numpy(),
+        'skill': pd.Categorical(tokens.to_numpy(dtype=object)),
+    })
+
+
+#*************** Keep the skill mentions of the jobs still present after filtering
+def select_job_skills(job_skills: pd.DataFrame, df: pd.DataFrame, attribute_columns: list = None) -> pd.DataFrame:
+    """
+    Mask the skill table down to the jobs of a filtered frame and attach job attributes.
+    Args:
+        job_skills (pd.DataFrame): output of tokenize_skills for the whole dataset
+        df (pd.DataFrame): filtered job frame, indexed like the dataset
+        attribute_columns (list): job columns to copy onto each mention (e.g. source)
+    Returns:
+        pd.DataFrame : skill mentions of the jobs in df
+    """
+    selected = job_skills[np.isin(job_skills['job_id'].to_numpy(), df.index.to_numpy())].reset_index(drop=True)
+    for col in attribute_columns or []:
+        if col in df.columns:
+            selected[col] = df[col].reindex(selected['job_id']).to_numpy()
+    return selected
+
+
+#*************** Most frequent skills
+def count_skills(job_skills: pd.DataFrame, n: int = None) -> pd.Series:
+    """
+    Count skill mentions, most frequent first; ties keep first-mention order.
+    Args:
+        job_skills (pd.DataFrame): skill table (possibly filtered)
+        n (int): number of skills returned, all when None
+    Returns:
+        pd.Series : mention count indexed by skill
+    """
+    codes, uniques = pd.factorize(job_skills['skill'].to_numpy(dtype=object))
+    counts = np.bincount(codes, minlength=len(uniques))
+    order = np.argsort(-counts, kind='stable')[:n]
+    return pd.Series(counts[order], index=pd.Index(uniques[order], name='skill'), name='count')
+
+
+#*************** Number of jobs requiring each pair of skills
+def skill_cooccurrence(job_skills: pd.DataFrame, skills: list) -> pd.DataFrame:
+    """
+    Count, for every pair of the given skills, the jobs that mention both.
+    Each job's skills are packed into a bitmask, so the counts are computed
+    over the distinct skill sets rather than over every job.
+    Args:
+        job_skills (pd.DataFrame): skill table (possibly filtered)
+        skills (list): skills forming the rows and columns of the matrix, at most MAX_COOCCURRENCE_SKILLS
+    Returns:
+        pd.DataFrame : skills x skills job counts; the diagonal holds the
+                       number of jobs mentioning each skill
+    """
+    # *************** START: Input Validation ***************
+    if len(skills) > MAX_COOCCURRENCE_SKILLS:
+        raise ValueError(f"Co-occurrence supports at most {MAX_COOCCURRENCE_SKILLS} skills, got {len(skills)}.")
+    # *************** END: Input Validation ***************
+
+    # *************** START: Job Skill Masks ***************
+    # Position of each mention's skill in skills, -1 for the other skills
+    skill_position = pd.Index(skills).get_indexer(job_skills['skill'])
+    listed = skill_position >= 0
+    pairs = pd.DataFrame({
+        'job_id': job_skills['job_id'].to_numpy()[listed],
+        'bit': np.left_shift(np.uint64(1), skill_position[listed].astype(np.uint64)),
+    }).drop_duplicates()
+    # Distinct bits of a job add up to the OR of its skills
+    job_masks = pairs.groupby('job_id', sort=False)['bit'].sum().to_numpy(dtype=np.uint64)
+    # *************** END: Job Skill Masks ***************
+
+    # *************** START: Pair Counts ***************
+    skill_sets, job_counts = np.unique(job_masks, return_counts=True)
+    indicator = ((skill_sets[:, None] >> np.arange(len(skills), dtype=np.uint64)) & np.uint64(1)).astype(np.int64)
+    cooccurrence = (indicator * job_counts[:, None]).T @ indicator
+    # *************** END: Pair Counts ***************
+
+    return pd.DataFrame(cooccurrence, index=skills, columns=skills)
@@ -0,0 +1,310 @@
+"""
+Seeded synthetic exports for benchmarking the loaders and reports.
+
+One generator per input the dashboards read: OpenAI cost and activity
+exports, AstraDB usage reports and scraped job CSVs. Columns, value formats
+and cardinalities follow the real files (categorical columns draw from small
+pools, salaries and GPS details mix the formats seen in scraped data), so
+the timings reflect the real parsing and grouping work. The same kind, row
+count and seed always produce the same file.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import os
+
+import numpy as np
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Rows generated and written per step, bounding memory for large files
+SYNTHETIC_CHUNK_ROWS = int(os.getenv('SYNTHETIC_CHUNK_ROWS', '500000'))
+
+SYNTHETIC_KINDS = ['openai_cost', 'openai_activity', 'astradb', 'jobs']
+
+# Exports cover one month
+PERIOD_START = pd.Timestamp('2025-05-01')
+PERIOD_DAYS = 31
+
+OPENAI_LINE_ITEMS = ['gpt-4o, input', 'gpt-4o, output', 'gpt-4o-mini, input', 'gpt-4o-mini, output',
+                     'embeddings', 'fine-tuning', 'assistants', 'web search']
+OPENAI_MODELS = ['gpt-4o', 'gpt-4o-mini', 'gpt-4.1', 'gpt-4.1-mini', 'o3', 'o4-mini',
+                 'text-embedding-3-small', 'text-embedding-3-large']
+
+ASTRADB_REGIONS = ['us-east1', 'us-east-2', 'us-west-2', 'eu-west1', 'eu-west-1', 'europe-west4',
+                   'ap-south-1', 'ap-southeast-1', 'australiaeast', 'canadacentral']
+ASTRADB_PROVIDERS = ['GCP', 'AWS', 'AZURE']
+ASTRADB_USAGE_TYPES = ['read', 'write', 'storage', 'data transfer', 'vector search', 'indexing',
+                       'backup', 'serverless compute']
+
+JOB_SOURCES = ['linkedin', 'indeed', 'glassdoor', 'welcometothejungle', 'monster', 'apec', 'hellowork',
+               'jobteaser', 'pole-emploi', 'stepstone', 'xing', 'remoteok', 'wellfound', 'dice', 'otta']
+JOB_COUNTRIES = {
+    'France': [('Paris', 48.85, 2.35), ('Lyon', 45.76, 4.84), ('Marseille', 43.30, 5.37), ('Lille', 50.63, 3.06)],
+    'United Kingdom': [('London', 51.51, -0.13), ('Manchester', 53.48, -2.24), ('Edinburgh', 55.95, -3.19)],
+    'Germany': [('Berlin', 52.52, 13.40), ('Munich', 48.14, 11.58), ('Hamburg', 53.55, 9.99)],
+    'United States': [('New York', 40.71, -74.01), ('San Francisco', 37.77, -122.42), ('Austin', 30.27, -97.74)],
+    'Indonesia': [('Jakarta', -6.21, 106.85), ('Surabaya', -7.25, 112.75), ('Bandung', -6.92, 107.61)],
+    'Spain': [('Madrid', 40.42, -3.70), ('Barcelona', 41.39, 2.17)],
+    'Netherlands': [('Amsterdam', 52.37, 4.90), ('Rotterdam', 51.92, 4.48)],
+    'Canada': [('Toronto', 43.65, -79.38), ('Montreal', 45.50, -73.57)],
+}
+JOB_SKILLS = ['Python', 'SQL', 'AWS', 'Docker', 'Kubernetes', 'Spark', 'Java', 'JavaScript', 'TypeScript',
+              'React', 'Node.js', 'Go', 'Rust', 'C++', 'Terraform', 'Airflow', 'dbt', 'Pandas', 'NumPy',
+              'PyTorch', 'TensorFlow', 'scikit-learn', 'Excel', 'Power BI', 'Tableau', 'Git', 'Linux',
+              'GCP', 'Azure', 'Kafka', 'PostgreSQL', 'MongoDB', 'Redis', 'FastAPI', 'Django', 'Flask']
+JOB_TITLES = ['Python developer', 'Data engineer', 'Data scientist', 'Backend engineer', 'Frontend developer',
+              'DevOps engineer', 'Machine learning engineer', 'Data analyst', 'Product manager', 'QA engineer']
+JOB_SENIORITIES = ['Junior', 'Senior', 'Lead', 'Staff', '']
+JOB_TYPES = ['Full-time', 'Part-time', 'Internship', 'Freelance']
+JOB_CONTRACTS = ['CDI', 'CDD', 'Stage', 'Alternance', 'Freelance']
+JOB_ROLES = ['DS', 'DE', 'SWE', 'DA', 'PM', 'MLE']
+COMPANY_SIZES = ['1-10', '11-50', '51-200', '201-500', '501-1000', '1001-5000', '5000+', None]
+REMOTE_VALUES = ['1', '0', 'remote', 'yes', 'no', 'Hybrid', 'on-site', None]
+
+# Distinct location_detail values generated around each city
+DETAILS_PER_CITY = 20
+
+# Column holding each row's time, for the kinds that can be sliced by day
+DAY_COLUMNS = {'openai_cost': 'timestamp', 'openai_activity': 'timestamp', 'astradb': 'BREAKDOWN_START_TIMESTAMP'}
+
+
+# *************** HELPERS ***************
+#*************** Draw values from a pool, with None rendered as an empty CSV cell
+def _choice(rng: np.random.Generator, pool, size: int, p=None) -> np.ndarray:
+    return np.asarray(pool, dtype=object)[rng.choice(len(pool), size=size, p=p)]
+
+
+def _timestamps(rng: np.random.Generator, size: int) -> np.ndarray:
+    start = int(PERIOD_START.timestamp())
+    return start + rng.integers(0, PERIOD_DAYS * 86400, size=size)
+
+
+def _zipf_weights(count: int) -> np.ndarray:
+    # A few very frequent values and a long tail, like companies and users
+    weights = 1.0 / np.arange(1, count + 1)
+    return weights / weights.sum()
+
+
+# *************** DATA PROCESSING: GENERATORS ***************
+#*************** OpenAI cost export rows
+def openai_cost_frame(rng: np.random.Generator, rows: int) -> pd.DataFrame:
+    cost = rng.gamma(shape=1.5, scale=0.4, size=rows)
+    return pd.DataFrame({
+        'timestamp': _timestamps(rng, rows),
+        'name': _choice(rng, OPENAI_LINE_ITEMS, rows),
+        'cost': cost * 100,
+        'cost_in_major': cost,
+        'project_id': _choice(rng, [f"proj_{index:03d}" for index in range(40)], rows),
+    })
+
+
+#*************** OpenAI activity export rows
+def openai_activity_frame(rng: np.random.Generator, rows: int) -> pd.DataFrame:
+    users = [f"user-{index:04d}" for index in range(500)] + [None]
+    return pd.DataFrame({
+        'timestamp': _timestamps(rng, rows),
+        'model': _choice(rng, OPENAI_MODELS, rows),
+        'user': _choice(rng, users, rows, _zipf_weights(len(users))),
+        'n_context_tokens_total': rng.integers(0, 200_000, size=rows),
+        'n_generated_tokens_total': rng.integers(0, 20_000, size=rows),
+        'n_cached_context_tokens_total': rng.integers(0, 50_000, size=rows),
+        'n_context_audio_tokens_total': np.where(rng.random(rows) < 0.05, rng.integers(0, 10_000, size=rows), 0),
+        'n_generated_audio_tokens_total': np.where(rng.random(rows) < 0.05, rng.integers(0, 10_000, size=rows), 0),
+        'num_requests': rng.integers(1, 500, size=rows),
+        'project_id': _choice(rng, [f"proj_{index:03d}" for index in range(40)], rows),
+    })
+
+
+#*************** AstraDB usage report rows
+def astradb_frame(rng: np.random.Generator, rows: int) -> pd.DataFrame:
+    days = PERIOD_START + pd.to_timedelta(rng.integers(0, PERIOD_DAYS, size=rows), unit='D')
+    usage = rng.gamma(shape=1.2, scale=5.0, size=rows)
+    unit_price = _choice(rng, [0.01, 0.05, 0.1, 0.25, 1.0], rows).astype('float64')
+    organizations = [f"org-{index:02d}" for index in range(20)]
+    resources = [f"db-{index:04d}" for index in range(1000)]
+    return pd.DataFrame({
+        'ORG_NAME': _choice(rng, organizations, rows, _zipf_weights(len(organizations))),
+        'RESOURCE_NAME': _choice(rng, resources, rows, _zipf_weights(len(resources))),
+        'REGION': _choice(rng, ASTRADB_REGIONS, rows),
+        'CLOUD_PROVIDER': _choice(rng, ASTRADB_PROVIDERS, rows),
+        'USAGE_TYPE': _choice(rng, ASTRADB_USAGE_TYPES, rows),
+        'BREAKDOWN_START_TIMESTAMP': days.strftime('%Y-%m-%d %H:%M:%S'),
+        'BREAKDOWN_END_TIMESTAMP': (days + pd.Timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S'),
+        'USAGE': usage,
+        'UNIT_PRICE': unit_price,
+        'CALCULATED_COST': usage * unit_price,
+    })
+
+
+#*************** Value pools of the job generator, drawn once per seed
+def _job_pools(rng: np.random.Generator) -> dict:
+    cities = [(city, country, latitude, longitude)
+              for country, country_cities in JOB_COUNTRIES.items()
+              for city, latitude, longitude in country_cities]
+    locations = [f"{city}, {country}" for city, country, _, _ in cities] + ['Remote', None]
+
+    # location_detail: a few jittered points around the city, then values without usable points
+    details = []
+    for _, _, latitude, longitude in cities:
+        for _ in range(DETAILS_PER_CITY):
+            points = ', '.join(f"({latitude + jitter_lat:.4f}, {longitude + jitter_lon:.4f})"
+                               for jitter_lat, jitter_lon in rng.normal(0, 0.05, size=(rng.integers(1, 4), 2)))
+            details.append(f"[{points}]")
+    details += ['[]', '[(None, None)]', None]
+
+    salaries = []
+    for low in rng.integers(25, 150, size=400) * 1000:
+        high = low + int(rng.integers(5, 40)) * 1000
+        salaries += [str(low), f"€{low // 1000}k per year", f"${low:,} - ${high:,}", f"{low // 1000}K-{high // 1000}K"]
+    salaries += ['', 'Competitive', None]
+
+    skill_sets = [', '.join(rng.choice(JOB_SKILLS, size=rng.integers(1, 8), replace=False)) for _ in range(3000)]
+    skill_sets = [text.replace(', ', delimiter, 1) for text, delimiter in zip(skill_sets, rng.choice([', ', '|', '; '], size=3000))]
+
+    return {
+        'city_count': len(cities),
+        'locations': locations,
+        'location_weights': np.append(np.full(len(cities), 0.9 / len(cities)), [0.07, 0.03]),
+        'details': np.asarray(details, dtype=object),
+        'salaries': salaries,
+        'skill_sets': skill_sets + [None],
+        'companies': [f"Company {index:05d}" for index in range(5000)],
+        'summaries': [f"{seniority} {title}".strip() for seniority in JOB_SENIORITIES for title in JOB_TITLES],
+    }
+
+
+#*************** Scraped job posting rows
+def jobs_frame(rng: np.random.Generator, rows: int, pools: dict = None, first_id: int = 0) -> pd.DataFrame:
+    pools = pools or _job_pools(rng)
+    publication = PERIOD_START + pd.to_timedelta(rng.integers(0, PERIOD_DAYS, size=rows), unit='D')
+    rating = np.round(rng.uniform(1.0, 5.0, size=rows), 1)
+
+    # GPS details match the row's city; remote, unknown and 10% of city rows get no usable point
+    location_codes = rng.choice(len(pools['locations']), size=rows, p=pools['location_weights'])
+    city_count = pools['city_count']
+    has_points = (location_codes < city_count) & (rng.random(rows) >= 0.1)
+    detail_codes = np.where(
+        has_points,
+        location_codes * DETAILS_PER_CITY + rng.integers(0, DETAILS_PER_CITY, size=rows),
+        city_count * DETAILS_PER_CITY + rng.integers(0, 3, size=rows),
+    )
+    return pd.DataFrame({
+        'id': np.arange(first_id, first_id + rows),
+        'summary': _choice(rng, pools['summaries'], rows),
+        'location': np.asarray(pools['locations'], dtype=object)[location_codes],
+        'company': _choice(rng, pools['companies'], rows, _zipf_weights(len(pools['companies']))),
+        'source': _choice(rng, JOB_SOURCES, rows, _zipf_weights(len(JOB_SOURCES))),
+        'job_salary': _choice(rng, pools['salaries'], rows),
+        'skills_needed': _choice(rng, pools['skill_sets'], rows),
+        'remote_working': _choice(rng, REMOTE_VALUES, rows),
+        'publication_date': publication.strftime('%Y-%m-%d'),
+        'company_size': _choice(rng, COMPANY_SIZES, rows),
+        'company_rating': np.where(rng.random(rows) < 0.3, np.nan, rating),
+        'job_type': _choice(rng, JOB_TYPES, rows),
+        'job_contract': _choice(rng, JOB_CONTRACTS, rows),
+        'job_role': _choice(rng, JOB_ROLES, rows),
+        'location_detail': pools['details'][detail_codes],
+    })
+
+
+# *************** DATA PROCESSING: FILES ***************
+#*************** Write a synthetic export, chunk by chunk
+def write_synthetic_csv(kind: str, rows: int, file_path: str, seed: int = 0,
+                        chunk_rows: int = SYNTHETIC_CHUNK_ROWS) -> str:
+    """
+    Generate a seeded synthetic export and write it as CSV without holding
+    more than one chunk in memory.
+    Args:
+        kind (str): one of SYNTHETIC_KINDS
+        rows (int): number of data rows
+        file_path (str): CSV path to write
+        seed (int): random seed; the same kind, rows, seed and chunk_rows give the same file
+        chunk_rows (int): rows generated per step
+    Returns:
+        str : file_path
+    """
+    # *************** START: Input Validation ***************
+    if kind not in SYNTHETIC_KINDS:
+        raise ValueError(f"Unknown synthetic data kind '{kind}'. Expected one of {SYNTHETIC_KINDS}.")
+    # *************** END: Input Validation ***************
+
+    rng = np.random.default_rng(seed)
+    pools = _job_pools(rng) if kind == 'jobs' else None
+    os.makedirs(os.path.dirname(file_path) or os.curdir, exist_ok=True)
+
+    # Write to a temporary name so an interrupted run never leaves a truncated file behind
+    partial_path = f"{file_path}.partial"
+    with open(partial_path, 'w', encoding='utf-8', newline='') as csv_file:
+        for first_row in range(0, max(rows, 1), chunk_rows):
+            chunk_size = min(chunk_rows, rows - first_row)
+            if kind == 'openai_cost':
+                chunk = openai_cost_frame(rng, chunk_size)
+            elif kind == 'openai_activity':
+                chunk = openai_activity_frame(rng, chunk_size)
+            elif kind == 'astradb':
+                chunk = astradb_frame(rng, chunk_size)
+            else:
+                chunk = jobs_frame(rng, chunk_size, pools, first_id=first_row)
+            chunk.to_csv(csv_file, index=False, header=first_row == 0)
+    os.replace(partial_path, file_path)
+    return file_path
+
+
+#*************** Reuse a previously generated export of the same kind, size and seed
+def synthetic_csv(kind: str, rows: int, data_dir: str, seed: int = 0) -> str:
+    """
+    Path of a synthetic export in data_dir, generating it on first use.
+    Args:
+        kind (str): one of SYNTHETIC_KINDS
+        rows (int): number of data rows
+        data_dir (str): directory holding the generated files
+        seed (int): random seed
+    Returns:
+        str : path of the CSV file
+    """
+    file_path = os.path.join(data_dir, f"{kind}-{rows}-seed{seed}.csv")
+    if not os.path.exists(file_path):
+        write_synthetic_csv(kind, rows, file_path, seed)
+    return file_path
+
+
+#*************** Rows of a synthetic export falling in a range of days
+def synthetic_csv_days(kind: str, rows: int, data_dir: str, seed: int, first_day: int, end_day: int) -> str:
+    """
+    Path of the slice of a synthetic export whose rows fall between two days
+    of the period, e.g. one monthly export of several, or yesterday's report.
+    The slice is written chunk by chunk on first use.
+    Args:
+        kind (str): 'openai_cost', 'openai_activity' or 'astradb'
+        rows (int): number of data rows of the whole export
+        data_dir (str): directory holding the generated files
+        seed (int): random seed of the whole export
+        first_day (int): first day kept, counted from PERIOD_START
+        end_day (int): first day no longer kept
+    Returns:
+        str : path of the CSV file
+    """
+    # *************** START: Input Validation ***************
+    if kind not in DAY_COLUMNS:
+        raise ValueError(f"Synthetic '{kind}' data cannot be sliced by day. Expected one of {list(DAY_COLUMNS)}.")
+    # *************** END: Input Validation ***************
+
+    file_path = os.path.join(data_dir, f"{kind}-{rows}-seed{seed}-days{first_day}-{end_day}.csv")
+    if os.path.exists(file_path):
+        return file_path
+
+    source_path = synthetic_csv(kind, rows, data_dir, seed)
+    day_column = DAY_COLUMNS[kind]
+    partial_path = f"{file_path}.partial"
+    with open(partial_path, 'w', encoding='utf-8', newline='') as csv_file:
+        # Values are copied as text: re-formatting floats could change their last digit,
+        # and a slice must repeat its rows exactly like a real export does
+        for index, chunk in enumerate(pd.read_csv(source_path, chunksize=SYNTHETIC_CHUNK_ROWS,
+                                                  dtype=str, keep_default_na=False)):
+            if kind == 'astradb':
+                days = (pd.to_datetime(chunk[day_column]) - PERIOD_START).dt.days
+            else:
+                days = (pd.to_numeric(chunk[day_column]) - int(PERIOD_START.timestamp())) // 86400
+            chunk[(days >= first_day) & (days < end_day)].to_csv(csv_file, index=False, header=index == 0)
+    os.replace(partial_path, file_path)
+    return file_path
@@ -0,0 +1,239 @@
+"""
+Full-text search over the job summary, company and location columns.
+
+The index is an inverted token index: every lowercased word (\\w+ run) maps
+to the rows and fields containing it. A word-only query term is answered by
+scanning the vocabulary (much smaller than the corpus) for tokens containing
+the term, so substring semantics are kept; a term with punctuation or spaces
+is narrowed to candidate rows through its word parts and then verified.
+
+Queries are AND-ed terms; "quoted text" is a single term. Rows are ranked by
+the weight of the fields a term occurs in, doubled for whole-word matches.
+The index is built on a background thread; until it is ready, queries fall
+back to a column scan that returns the same rows in the same order.
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import logging
+import re
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# *************** CONFIGURATION AND ENVIRONMENT ***************
+# Searched columns and their ranking weight
+SEARCH_FIELD_WEIGHTS = {'summary': 1.0, 'company': 2.0, 'location': 2.0}
+
+TOKEN_PATTERN = r'\w+'
+QUERY_TERM_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+
+LOGGER = logging.getLogger(__name__)
+
+
+# *************** HELPERS ***************
+#*************** Split a query into lowercased terms, keeping "quoted text" together
+def parse_query(query: str) -> list:
+    """
+    Split a search query into terms.
+    Args:
+        query (str): raw text typed in the search box
+    Returns:
+        list : lowercased, de-duplicated terms in query order
+    """
+    terms = [(quoted or bare).strip().lower() for quoted, bare in QUERY_TERM_PATTERN.findall(query or '')]
+    return list(dict.fromkeys(term for term in terms if term))
+
+
+def _is_word(term: str) -> bool:
+    return re.fullmatch(TOKEN_PATTERN, term) is not None
+
+
+def _lowercase_text(series: pd.Series) -> pd.Series:
+    return series.astype(object).where(series.notna(), '').astype(str).str.lower()
+
+
+def _ranked_labels(row_labels: pd.Index, total_scores: np.ndarray, matched: np.ndarray) -> pd.Index:
+    hits = np.flatnonzero(matched)
+    return row_labels[hits[np.argsort(-total_scores[hits], kind='stable')]]
+
+
+def _candidate_mask(row_count: int, rows: np.ndarray | None) -> np.ndarray:
+    if rows is None:
+        return np.ones(row_count, dtype=bool)
+    mask = np.zeros(row_count, dtype=bool)
+    mask[rows] = True
+    return mask
+
+
+# *************** MODELS ***************
+@dataclass
+class TextSearchIndex:
+    row_labels: pd.Index
+    field_weights: np.ndarray
+    # Lowercased text of each field, '' for missing values
+    field_text: list
+    # Distinct tokens, indexed by token code
+    vocabulary: pd.Series
+    # Entries of token c are entry_rows/entry_fields[offsets[c]:offsets[c + 1]]
+    offsets: np.ndarray
+    entry_rows: np.ndarray
+    entry_fields: np.ndarray
+
+    def _entries(self, codes: np.ndarray) -> tuple:
+        starts, ends = self.offsets[codes], self.offsets[codes + 1]
+        lengths = ends - starts
+        if lengths.sum() == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8), np.empty(0, dtype=np.int64)
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return self.entry_rows[positions], self.entry_fields[positions], np.repeat(codes, lengths)
+
+    def term_scores(self, term: str) -> np.ndarray:
+        """Score of every row for one term (0 when the term does not occur)"""
+        row_count, field_count = len(self.row_labels), len(self.field_weights)
+
+        if _is_word(term):
+            # A word-only substring always lies inside a single token
+            codes = np.flatnonzero(self.vocabulary.str.contains(term, regex=False).to_numpy())
+            rows, fields, entry_codes = self._entries(codes)
+            whole_word = self.vocabulary.to_numpy()[entry_codes] == term
+            weights = self.field_weights[fields] * np.where(whole_word, 2.0, 1.0)
+            # One contribution per (row, field): the best match in that field
+            field_scores = np.zeros(row_count * field_count)
+            np.maximum.at(field_scores, rows * field_count + fields, weights)
+            return field_scores.reshape(row_count, field_count).sum(axis=1)
+
+        # Narrow down through the word parts, then verify the exact substring
+        candidates = np.ones(row_count, dtype=bool)
+        for part in re.findall(TOKEN_PATTERN, term):
+            candidates &= self.term_scores(part) > 0
+        candidate_rows = np.flatnonzero(candidates)
+        scores = np.zeros(row_count)
+        for weight, text in zip(self.field_weights, self.field_text):
+            found = text.iloc[candidate_rows].str.contains(term, regex=False).to_numpy()
+            scores[candidate_rows[found]] += weight
+        return scores
+
+    def search(self, query: str, rows: np.ndarray = None) -> pd.Index:
+        """
+        Rows matching every query term, best match first (ties keep row order).
+        Args:
+            query (str): search box text
+            rows (np.ndarray): positions of the rows to search, all rows when None
+        Returns:
+            pd.Index : labels of the matching rows, ranked
+        """
+        matched = _candidate_mask(len(self.row_labels), rows)
+        total_scores = np.zeros(len(self.row_labels))
+        for term in parse_query(query):
+            scores = self.term_scores(term)
+            matched &= scores > 0
+            total_scores += scores
+        return _ranked_labels(self.row_labels, total_scores, matched)
+
+
+# *************** DATA PROCESSING ***************
+#*************** Build the token index of the searched columns
+def build_text_search_index(df: pd.DataFrame, field_weights: dict = None) -> TextSearchIndex:
+    """
+    Tokenize the searched columns and group their (row, field) entries by token.
+    Args:
+        df (pd.DataFrame): job frame
+        field_weights (dict): searched column to ranking weight (SEARCH_FIELD_WEIGHTS by default)
+    Returns:
+        TextSearchIndex : index over the columns of field_weights present in df
+    """
+    field_weights = {col: weight for col, weight in (field_weights or SEARCH_FIELD_WEIGHTS).items() if col in df.columns}
+    field_text = [_lowercase_text(df[col]).reset_index(drop=True) for col in field_weights]
+
+    # *************** START: Token Entries ***************
+    entry_frames = []
+    for field_position, text in enumerate(field_text):
+        tokens = text.str.findall(TOKEN_PATTERN).explode().dropna()
+        entry_frames.append(pd.DataFrame({
+            'row': tokens.index.to_numpy(dtype=np.int64),
+            'field': np.int8(field_position),
+            'token': tokens.to_numpy(dtype=object),
+        }))
+    entries = pd.concat(entry_frames, ignore_index=True).drop_duplicates() if entry_frames else \
+        pd.DataFrame({'row': np.empty(0, dtype=np.int64), 'field': np.empty(0, dtype=np.int8), 'token': []})
+    # *************** END: Token Entries ***************
+
+    # *************** START: Postings ***************
+    codes, vocabulary = pd.factorize(entries['token'])
+    order = np.argsort(codes, kind='stable')
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=len(vocabulary)))))
+    # *************** END: Postings ***************
+
+    return TextSearchIndex(
+        row_labels=df.index,
+        field_weights=np.array(list(field_weights.values()), dtype=float),
+        field_text=field_text,
+        vocabulary=pd.Series(np.asarray(vocabulary, dtype=object), dtype=object),
+        offsets=offsets,
+        entry_rows=entries['row'].to_numpy()[order],
+        entry_fields=entries['field'].to_numpy()[order],
+    )
+
+
+#*************** Same matching and ranking as the index, by scanning the columns
+def scan_search(df: pd.DataFrame, query: str, rows: np.ndarray = None, field_weights: dict = None) -> pd.Index:
+    """
+    Answer a query without an index, with the same results as TextSearchIndex.search.
+    Args:
+        df (pd.DataFrame): job frame the index would be built on
+        query (str): search box text
+        rows (np.ndarray): positions of the rows to search, all rows when None
+        field_weights (dict): searched column to ranking weight (SEARCH_FIELD_WEIGHTS by default)
+    Returns:
+        pd.Index : labels of the matching rows, ranked
+    """
+    field_weights = {col: weight for col, weight in (field_weights or SEARCH_FIELD_WEIGHTS).items() if col in df.columns}
+    matched = _candidate_mask(len(df), rows)
+    candidate_rows = np.flatnonzero(matched)
+    field_text = {col: _lowercase_text(df[col].iloc[candidate_rows]) for col in field_weights}
+
+    total_scores = np.zeros(len(df))
+    for term in parse_query(query):
+        scores = np.zeros(len(candidate_rows))
+        for col, weight in field_weights.items():
+            found = field_text[col].str.contains(term, regex=False).to_numpy()
+            if _is_word(term):
+                whole_word = field_text[col].str.contains(rf'(?<!\w){re.escape(term)}(?!\w)', regex=True).to_numpy()
+                scores += np.where(whole_word, 2.0 * weight, np.where(found, weight, 0.0))
+            else:
+                scores += np.where(found, weight, 0.0)
+        matched[candidate_rows] &= scores > 0
+        total_scores[candidate_rows] += scores
+    return _ranked_labels(df.index, total_scores, matched)
+
+
+# *************** MODELS: BACKGROUND BUILD ***************
+class BackgroundTextSearch:
+    """Builds a TextSearchIndex on a daemon thread and scans until it is ready"""
+
+    def __init__(self, df: pd.DataFrame, field_weights: dict = None):
+        self._df = df
+        self._field_weights = field_weights
+        self._index = None
+        self._ready = threading.Event()
+        threading.Thread(target=self._build, name='text-search-index', daemon=True).start()
+
+    def _build(self) -> None:
+        try:
+            self._index = build_text_search_index(self._df, self._field_weights)
+        except Exception as error:
+            LOGGER.warning("Could not build the text search index: %s", error)
+        finally:
+            self._ready.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set() and self._index is not None
+
+    def search(self, query: str, rows: np.ndarray = None) -> pd.Index:
+        """Ranked labels of the rows matching query, from the index once it is built"""
+        if self.ready:
+            return self._index.search(query, rows)
+        return scan_search(self._df, query, rows, self._field_weights)
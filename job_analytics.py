@@ -5,9 +5,28 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
-import re
-import pycountry
-import ast
+import io
+
+from helper.coercion import JOB_BOOLEAN_COLUMNS, coerce_boolean
+from helper.data_viewer import show_paginated_dataframe
+from helper.dataset_cache import JOB_DATASET_CACHE
+from helper.exports import show_export_controls
+from helper.figure_cache import cached_figure
+from helper.filter_index import JOB_DATE_FILTER_COLUMNS, build_filter_index, intersect_rows
+from helper.grouped import grouped_distribution, grouped_top_n
+from helper.instrumentation import instrumented, performance_rerun, trace_span
+from helper.lazy_sections import lazy_tabs, memoize_section
+from helper.locations import (
+    GPS_RAW_POINT_LIMIT,
+    gps_map_points,
+    parse_location_details,
+    resolve_iso3,
+    select_job_coordinates,
+    split_location,
+)
+from helper.schemas import JOB_SCHEMA, apply_schema, drop_unused_categories
+from helper.skills import count_skills, select_job_skills, skill_cooccurrence, tokenize_skills
+from helper.text_search import BackgroundTextSearch
 
 # Page configuration
 st.set_page_config(
@@ -17,95 +36,107 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@instrumented(kind='transform')
 def clean_salary_data(df):
     """Clean and extract salary information"""
     if 'job_salary' in df.columns:
-        # Extract numeric values from salary strings
-        def extract_salary_range(salary_str):
-            if pd.isna(salary_str) or salary_str == '':
-                return None, None
-# def clean_salary_data(df):
-#     """Clean and extract salary information"""
-#     if 'job_salary' in df.columns:
-#         # Extract numeric values from salary strings
-#         def extract_salary_range(salary_str):
-#             if pd.isna(salary_str) or salary_str == '':
-#                 return None, None
-            
-            # Remove common currency symbols and text
-            clean_str = str(salary_str).replace('$', '').replace(',', '').replace('K', '000').replace('k', '000')
-            numbers = re.findall(r'\d+', clean_str)
-#             # Remove common currency symbols and text
-#             clean_str = str(salary_str).replace('$', '').replace(',', '').replace('K', '000').replace('k', '000')
-#             numbers = re.findall(r'\d+', clean_str)
-            
-            if len(numbers) >= 2:
-                return int(numbers[0]), int(numbers[1])
-            elif len(numbers) == 1:
-                return int(numbers[0]), int(numbers[0])
-            return None, None
-#             if len(numbers) >= 2:
-#                 return int(numbers[0]), int(numbers[1])
-#             elif len(numbers) == 1:
-#                 return int(numbers[0]), int(numbers[0])
-#             return None, None
-        
-        df['salary_min'], df['salary_max'] = zip(*df['job_salary'].apply(extract_salary_range))
+        # Remove common currency symbols and text, then take the first two numbers
+        has_salary = df['job_salary'].notna() & (df['job_salary'] != '')
+        clean_str = (df.loc[has_salary, 'job_salary'].astype(str)
+                     .str.replace('$', '', regex=False).str.replace(',', '', regex=False)
+                     .str.replace('K', '000', regex=False).str.replace('k', '000', regex=False))
+        numbers = clean_str.str.extract(r'(\d+)(?:\D+(\d+))?')
+
+        salary_min = digits_to_number(numbers[0])
+        salary_max = digits_to_number(numbers[1]).fillna(salary_min)
+        df['salary_min'] = salary_min.reindex(df.index)
+        df['salary_max'] = salary_max.reindex(df.index)
         df['salary_avg'] = df[['salary_min', 'salary_max']].mean(axis=1)
-#         df['salary_min'], df['salary_max'] = zip(*df['job_salary'].apply(extract_salary_range))
-#         df['salary_avg'] = df[['salary_min', 'salary_max']].mean(axis=1)
     
     return df
-#     return df
 
+def digits_to_number(digits):
+    """Convert extracted digit runs to numbers, like int() does for non-ASCII digits"""
+    numbers = pd.to_numeric(digits, errors='coerce').astype('float64')
+    # \d also matches other scripts' digits (e.g. Arabic-Indic), which only int() parses
+    unparsed = digits.notna() & numbers.isna()
+    if unparsed.any():
+        numbers[unparsed] = digits[unparsed].map(int).astype('float64')
+    return numbers
+
+@instrumented(kind='transform')
+def process_job_data(raw_bytes):
+    """Parse and process an uploaded CSV into the jobs, their GPS points, skills, filter and search indexes"""
+    df = pd.read_csv(io.BytesIO(raw_bytes))
+    
+    # Clean column names
+    df.columns = df.columns.str.strip()
+    
+    # Process dates
+    date_columns = ['scrapped_on_date', 'publication_date', 'date_of_publication', 'start_date']
+    for col in date_columns:
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+    
+    # Clean salary data
+    df = clean_salary_data(df)
+    # # Clean salary data
+    # df = clean_salary_data(df)
+    
+    # Clean company size data
+    if 'company_size' in df.columns:
+        df['company_size_clean'] = df['company_size'].fillna('Unknown')
+    
+    # Clean remote working and other yes/no columns
+    for col in JOB_BOOLEAN_COLUMNS:
+        if col in df.columns:
+            df[col] = coerce_boolean(df[col])
+    
+    # Clean company rating data
+    if 'company_rating' in df.columns:
+        df['company_rating'] = pd.to_numeric(df['company_rating'], errors='coerce')
+    
+    # Split location into city and country once
+    if 'location' in df.columns:
+        df['city'], df['country'] = split_location(df['location'])
+    
+    # Tokenize skills once, so renders only mask and count them
+    if 'skills_needed' in df.columns:
+        job_skills = tokenize_skills(df['skills_needed'])
+    else:
+        job_skills = tokenize_skills(pd.Series(dtype=object))
+    
+    # Parse GPS points once, so renders only mask them
+    if 'location_detail' in df.columns:
+        gps_coords = parse_location_details(df['location_detail'])
+    else:
+        gps_coords = parse_location_details(pd.Series(dtype=object))
+    
+    # Compact dtypes: categoricals for low-cardinality text, float32 ratings
+    df = apply_schema(df, JOB_SCHEMA)
+    
+    # Sidebar filter indexes, built once per upload
+    filter_index = build_filter_index(df)
+    
+    # Raw data search index, built in the background
+    search_index = BackgroundTextSearch(df)
+    
+    return df, gps_coords, job_skills, filter_index, search_index
+
+@instrumented(kind='loader', cached=True)
 def load_and_process_data(uploaded_file):
-    """Load and process the CSV data"""
+    """Load and process the CSV data, reusing the processed dataset when the same content was loaded before"""
     try:
-        df = pd.read_csv(uploaded_file)
-        
-        # Clean column names
-        df.columns = df.columns.str.strip()
-        
-        # Process dates
-        date_columns = ['scrapped_on_date', 'publication_date', 'date_of_publication', 'start_date']
-        for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-        
-        # Clean salary data
-        df = clean_salary_data(df)
-        # # Clean salary data
-        # df = clean_salary_data(df)
-        
-        # Clean company size data
-        if 'company_size' in df.columns:
-            df['company_size_clean'] = df['company_size'].fillna('Unknown')
-        
-        # Clean remote working data
-        if 'remote_working' in df.columns:
-            def clean_remote_working(value):
-                if pd.isna(value):
-                    return False
-                if isinstance(value, bool):
-                    return value
-                if isinstance(value, str):
-                    value_lower = value.lower().strip()
-                    return value_lower in ['true', '1', 'yes', 'remote', 'y']
-                if isinstance(value, (int, float)):
-                    return bool(value)
-                return False
-            
-            df['remote_working'] = df['remote_working'].apply(clean_remote_working)
-        
-        # Clean company rating data
-        if 'company_rating' in df.columns:
-            df['company_rating'] = pd.to_numeric(df['company_rating'], errors='coerce')
-        
-        return df
+        return JOB_DATASET_CACHE.get_or_build(
+            uploaded_file.getvalue,
+            process_job_data,
+            alias=getattr(uploaded_file, 'file_id', None)
+        )
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
-        return None
+        return None, None, None, None, None
 
+@instrumented
 def show_overview_metrics(df):
     """Display key metrics overview"""
     st.subheader("📊 Key Metrics")
@@ -140,43 +171,37 @@ def show_overview_metrics(df):
     #     else:
     #         st.metric("Avg Salary", "N/A")
 
-def show_job_trends(df):
-    """Show job posting trends over time"""
+@instrumented
+def show_job_trends(df, state_key=None):
+    """Show job posting trends over time (state_key memoizes the daily counts per filter state)"""
     st.subheader("📈 Job Posting Trends")
     
-    # Use the most appropriate date column
-    date_col = None
-    for col in ['publication_date', 'date_of_publication', 'scrapped_on_date']:
-        if col in df.columns and not df[col].isna().all():
-            date_col = col
-            break
-    
-    if date_col:
-        # Create daily job postings chart
+    def daily_job_counts():
+        # Use the most appropriate date column
+        date_col = None
+        for col in ['publication_date', 'date_of_publication', 'scrapped_on_date']:
+            if col in df.columns and not df[col].isna().all():
+                date_col = col
+                break
+        
+        if not date_col:
+            return None
         daily_jobs = df[df[date_col].notna()].groupby(df[date_col].dt.date).size().reset_index()
         daily_jobs.columns = ['date', 'job_count']
-        
-        fig = px.line(daily_jobs, x='date', y='job_count', 
-                     title="Daily Job Postings",
-                     labels={'job_count': 'Number of Jobs', 'date': 'Date'})
+        return daily_jobs
+    
+    daily_jobs = memoize_section('trends', state_key, daily_job_counts)
+    if daily_jobs is not None:
+        # Create daily job postings chart
+        fig = cached_figure('daily_job_postings', daily_jobs, lambda: px.line(
+            daily_jobs, x='date', y='job_count',
+            title="Daily Job Postings",
+            labels={'job_count': 'Number of Jobs', 'date': 'Date'}
+        ))
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("No valid date information found for trend analysis")
 
-import streamlit as st
-import plotly.express as px
-import pycountry
-
-# ------------------------------
-# 🌍 ISO Code Mapper
-# ------------------------------
-def get_iso3(country_name):
-    """Map country name to ISO Alpha-3 code using pycountry"""
-    try:
-        return pycountry.countries.lookup(country_name).alpha_3
-    except:
-        return None
-
 # ------------------------------
 # 📊 Location-Based Analysis
 # ------------------------------
@@ -184,139 +209,165 @@ def get_iso3(country_name):
 # ------------------------------
 # 🌍 Location Analysis Function
 # ------------------------------
-def show_location_analysis(df):
+@instrumented
+def show_location_analysis(df, gps_coords, state_key=None):
     """Display location-based insights including pie charts and a choropleth map."""
     st.subheader("🌍 Location Analysis")
 
-    # ------------------------------
-    # 🔍 Step 1: Extract 'city' and 'country'
-    # ------------------------------
-    if 'location' in df.columns:
-        df['city'] = df['location'].apply(lambda x: str(x).split(',')[0].strip() if ',' in str(x) else str(x).strip())
-        df['country'] = df['location'].apply(lambda x: str(x).split(',')[-1].strip() if ',' in str(x) else str(x).strip())
+    def location_data():
+        # Prepare country distribution data with ISO mapping
+        country_counts = df['country'].value_counts().reset_index()
+        country_counts.columns = ['country', 'count']
+        country_counts['iso_alpha'] = country_counts['country'].map(resolve_iso3)
+        country_counts = country_counts.dropna(subset=['iso_alpha'])
+        country_counts['log_count'] = country_counts['count'].apply(lambda x: np.log1p(x))  # log(1 + x)
+        return {
+            'top_countries': df['country'].value_counts().head(5),
+            'top_cities': df['city'].value_counts().head(5),
+            'country_counts': country_counts,
+            # Points were parsed once at load time; keep those of the filtered jobs
+            'geo_df': select_job_coordinates(gps_coords, df, ['location', 'country']),
+        }
+
+    location = memoize_section('locations', state_key, location_data)
 
     # ------------------------------
-    # 🥧 Step 2: Top 5 Pie Charts
+    # 🥧 Step 1: Top 5 Pie Charts
     # ------------------------------
     col1, col2 = st.columns(2)
 
     with col1:
-        top_countries = df['country'].value_counts().head(5)
-        fig_country = px.pie(
+        top_countries = location['top_countries']
+        fig_country = cached_figure('top_countries', top_countries, lambda: px.pie(
             values=top_countries.values,
             names=top_countries.index,
             title="Top 5 Countries by Job Count"
-        )
+        ))
         st.plotly_chart(fig_country, use_container_width=True)
 
     with col2:
-        top_cities = df['city'].value_counts().head(5)
-        fig_city = px.pie(
+        top_cities = location['top_cities']
+        fig_city = cached_figure('top_cities', top_cities, lambda: px.pie(
             values=top_cities.values,
             names=top_cities.index,
             title="Top 5 Cities by Job Count"
-        )
+        ))
         st.plotly_chart(fig_city, use_container_width=True)
 
     # ------------------------------
-    # 🗺️ Step 3: Choropleth Map (Global Distribution)
+    # 🗺️ Step 2: Choropleth Map (Global Distribution)
     # ------------------------------
     st.subheader("🗺️ Global Job Distribution")
 
-    # Prepare country distribution data with ISO mapping
-    # Step 1: Prepare the data
-    country_counts = df['country'].value_counts().reset_index()
-    country_counts.columns = ['country', 'count']
-    country_counts['iso_alpha'] = country_counts['country'].apply(get_iso3)
-    country_counts = country_counts.dropna(subset=['iso_alpha'])
-
-    # Step 2: Log-transform the job counts for coloring
-    country_counts['log_count'] = country_counts['count'].apply(lambda x: np.log1p(x))  # log(1 + x)
-
-    # Step 3: Create the choropleth
-    fig_map = px.choropleth(
-        country_counts,
-        locations="iso_alpha",
-        locationmode="ISO-3",
-        color="log_count",  # Use log-transformed value for coloring
-        hover_name="country",
-        hover_data={
-            "count": True,        # Show actual job count
-            "log_count": False,   # Hide log-transformed value from hover
-            "iso_alpha": False    # Hide ISO code
-        },
-        color_continuous_scale="YlOrRd",  # Or "Blues", "OrRd", etc.
-        title="📍 Jobs by Country (Log Scaled Color)"
-    )
+    # Step 1: Country counts with ISO codes and log-transformed counts for coloring
+    country_counts = location['country_counts']
+
+    def build_country_map():
+        # Step 2: Create the choropleth
+        fig_map = px.choropleth(
+            country_counts,
+            locations="iso_alpha",
+            locationmode="ISO-3",
+            color="log_count",  # Use log-transformed value for coloring
+            hover_name="country",
+            hover_data={
+                "count": True,        # Show actual job count
+                "log_count": False,   # Hide log-transformed value from hover
+                "iso_alpha": False    # Hide ISO code
+            },
+            color_continuous_scale="YlOrRd",  # Or "Blues", "OrRd", etc.
+            title="📍 Jobs by Country (Log Scaled Color)"
+        )
 
-    # Step 4: Customize the map style
-    fig_map.update_geos(
-        showframe=False,
-        showcoastlines=True,
-        projection_type='natural earth',
-        showland=True,
-        landcolor='White',
-        oceancolor='LightBlue',
-    )
+        # Step 3: Customize the map style
+        fig_map.update_geos(
+            showframe=False,
+            showcoastlines=True,
+            projection_type='natural earth',
+            showland=True,
+            landcolor='White',
+            oceancolor='LightBlue',
+        )
 
-    # Step 5: Show actual count in color bar
-    # Add tickvals/ticktext if you want fixed steps too
-    fig_map.update_layout(
-        margin={"r": 0, "t": 40, "l": 0, "b": 0},
-        coloraxis_colorbar={
-            'title': 'Job Count (log-scaled color)',
-            'tickvals': [np.log1p(x) for x in [1, 10, 100, 1000, 10000]],
-            'ticktext': ['1', '10', '100', '1,000', '10,000'],
-            'ticksuffix': ' jobs'
-        }
-    )
+        # Step 4: Show actual count in color bar
+        # Add tickvals/ticktext if you want fixed steps too
+        fig_map.update_layout(
+            margin={"r": 0, "t": 40, "l": 0, "b": 0},
+            coloraxis_colorbar={
+                'title': 'Job Count (log-scaled color)',
+                'tickvals': [np.log1p(x) for x in [1, 10, 100, 1000, 10000]],
+                'ticktext': ['1', '10', '100', '1,000', '10,000'],
+                'ticksuffix': ' jobs'
+            }
+        )
+        return fig_map
+
+    fig_map = cached_figure('jobs_by_country_map', country_counts, build_country_map)
 
-    # Step 6: Display in Streamlit
+    # Step 5: Display in Streamlit
     st.plotly_chart(fig_map, use_container_width=True)
 
     # ------------------------------
-    # 📍 Step 4: GPS-Based Scatter Map
+    # 📍 Step 3: GPS-Based Scatter Map
     # ------------------------------
     st.subheader("📌 Exact Location Map (GPS Points)")
 
-    def extract_valid_coords(row):
-        job_id = row.name
-        try:
-            coords_list = ast.literal_eval(row['location_detail'])
-            valid_coords = [c for c in coords_list if c and None not in c]
-            return [(job_id, c[0], c[1], row.get('location', None), row.get('country', None)) for c in valid_coords]
-        except:
-            return []
-
-    # Flatten coordinates into a new DataFrame
-    all_coords = []
-    for _, row in df.iterrows():
-        all_coords.extend(extract_valid_coords(row))
-
-    if all_coords:
-        geo_df = pd.DataFrame(all_coords, columns=['job_id', 'latitude', 'longitude', 'location', 'country'])
-
-        fig_gps = px.scatter_mapbox(
-            geo_df,
-            lat="latitude",
-            lon="longitude",
-            hover_name="location",
-            hover_data=["country"],
-            zoom=1,
-            height=600,
-            color_discrete_sequence=["#636EFA"]
+    geo_df = location['geo_df']
+
+    if not geo_df.empty:
+        zoom = 1
+        if len(geo_df) > GPS_RAW_POINT_LIMIT:
+            # Too many points to send one by one: plot grid cells sized for the zoom
+            zoom = st.select_slider("Map zoom", options=list(range(0, 11)), value=1, key="gps_zoom",
+                                    help="Finer grid cells at higher zoom levels")
+        map_points, binned = memoize_section(
+            'gps_map_points', None if state_key is None else (state_key, zoom),
+            lambda: gps_map_points(geo_df, zoom, ['location', 'country'])
         )
 
-        fig_gps.update_layout(
-            mapbox_style="open-street-map",
-            title="📍 Jobs with Precise GPS (Mapbox)",
-            margin={"r": 0, "t": 50, "l": 0, "b": 0}
-        )
+        def build_gps_map():
+            if binned:
+                fig_gps = px.scatter_mapbox(
+                    map_points,
+                    lat="latitude",
+                    lon="longitude",
+                    size="count",
+                    hover_name="location",
+                    hover_data={"country": True, "count": True},
+                    labels={"count": "Jobs", "location": "Most frequent location"},
+                    size_max=30,
+                    zoom=zoom,
+                    height=600,
+                    color_discrete_sequence=["#636EFA"]
+                )
+            else:
+                fig_gps = px.scatter_mapbox(
+                    map_points,
+                    lat="latitude",
+                    lon="longitude",
+                    hover_name="location",
+                    hover_data=["country"],
+                    zoom=zoom,
+                    height=600,
+                    color_discrete_sequence=["#636EFA"]
+                )
+
+            fig_gps.update_layout(
+                mapbox_style="open-street-map",
+                title="📍 Jobs with Precise GPS (Mapbox)",
+                margin={"r": 0, "t": 50, "l": 0, "b": 0}
+            )
+            return fig_gps
 
+        fig_gps = cached_figure('jobs_gps_map', map_points, build_gps_map, zoom=zoom, binned=binned)
         st.plotly_chart(fig_gps, use_container_width=True)
+        if binned:
+            st.caption(f"{len(geo_df):,} GPS points grouped into {len(map_points):,} map cells; "
+                       "marker size shows the number of jobs in each cell.")
     else:
         st.info("No valid GPS coordinates found in `location_detail`.")
 
+@instrumented
 def show_company_analysis(df):
     """Show company-based analysis"""
     st.subheader("🏢 Company Analysis")
@@ -327,20 +378,24 @@ def show_company_analysis(df):
         if 'company' in df.columns:
             # Top hiring companies
             top_companies = df['company'].value_counts().head(10)
-            fig = px.bar(x=top_companies.values, y=top_companies.index,
-                        orientation='h', title="Top 10 Hiring Companies",
-                        labels={'x': 'Number of Jobs', 'y': 'Company'})
-            fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+            fig = cached_figure('top_companies', top_companies, lambda: px.bar(
+                x=top_companies.values, y=top_companies.index,
+                orientation='h', title="Top 10 Hiring Companies",
+                labels={'x': 'Number of Jobs', 'y': 'Company'}
+            ).update_layout(yaxis={'categoryorder': 'total ascending'}))
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         if 'company_size_clean' in df.columns:
             # Company size distribution
             size_dist = df['company_size_clean'].value_counts()
-            fig = px.pie(values=size_dist.values, names=size_dist.index,
-                        title="Distribution by Company Size")
+            fig = cached_figure('company_sizes', size_dist, lambda: px.pie(
+                values=size_dist.values, names=size_dist.index,
+                title="Distribution by Company Size"
+            ))
             st.plotly_chart(fig, use_container_width=True)
 
+@instrumented
 def show_salary_analysis(df):
     """Show salary analysis"""
     st.subheader("💰 Salary Analysis")
@@ -352,9 +407,12 @@ def show_salary_analysis(df):
             # Salary distribution
             salary_data = df[df['salary_avg'].notna() & (df['salary_avg'] > 0)]
             if len(salary_data) > 0:
-                fig = px.histogram(salary_data, x='salary_avg', nbins=30,
-                                 title="Salary Distribution",
-                                 labels={'salary_avg': 'Average Salary ($)', 'count': 'Number of Jobs'})
+                # Only the plotted column is fingerprinted
+                fig = cached_figure('salary_distribution', salary_data['salary_avg'], lambda: px.histogram(
+                    salary_data, x='salary_avg', nbins=30,
+                    title="Salary Distribution",
+                    labels={'salary_avg': 'Average Salary ($)', 'count': 'Number of Jobs'}
+                ))
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -362,31 +420,26 @@ def show_salary_analysis(df):
             if 'job_role' in df.columns:
                 salary_by_role = df[df['salary_avg'].notna() & (df['salary_avg'] > 0)].groupby('job_role')['salary_avg'].mean().sort_values(ascending=False).head(10)
                 if len(salary_by_role) > 0:
-                    fig = px.bar(x=salary_by_role.values, y=salary_by_role.index,
-                               orientation='h', title="Average Salary by Job Role (Top 10)",
-                               labels={'x': 'Average Salary ($)', 'y': 'Job Role'})
-                    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+                    fig = cached_figure('salary_by_role', salary_by_role, lambda: px.bar(
+                        x=salary_by_role.values, y=salary_by_role.index,
+                        orientation='h', title="Average Salary by Job Role (Top 10)",
+                        labels={'x': 'Average Salary ($)', 'y': 'Job Role'}
+                    ).update_layout(yaxis={'categoryorder': 'total ascending'}))
                     st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("No salary data available for analysis")
 
-def show_skills_analysis(df):
+@instrumented
+def show_skills_analysis(df, job_skills):
     """Show skills analysis"""
     st.subheader("🛠️ Skills Analysis")
     
     if 'skills_needed' in df.columns:
-        # Extract and count skills
-        all_skills = []
-        for skills_str in df['skills_needed'].dropna():
-            if isinstance(skills_str, str):
-                # Split by common delimiters
-                skills = re.split(r'[,;|\n]', skills_str)
-                all_skills.extend([skill.strip().lower() for skill in skills if skill.strip()])
-        
-        if all_skills:
-            from collections import Counter
-            skill_counts = Counter(all_skills)
-            top_skills = dict(skill_counts.most_common(20))
+        # Skills were tokenized once at load time; keep those of the filtered jobs
+        filtered_skills = select_job_skills(job_skills, df, ['source'])
+        
+        if len(filtered_skills) > 0:
+            top_skills = count_skills(filtered_skills, n=20)
 # def show_salary_analysis(df):
 #     """Show salary analysis"""
 #     st.subheader("💰 Salary Analysis")
@@ -434,11 +487,38 @@ def show_skills_analysis(df):
 #             skill_counts = Counter(all_skills)
 #             top_skills = dict(skill_counts.most_common(20))
             
-            fig = px.bar(x=list(top_skills.values()), y=list(top_skills.keys()),
-                        orientation='h', title="Top 20 Required Skills",
-                        labels={'x': 'Frequency', 'y': 'Skill'})
-            fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+            fig = cached_figure('top_skills', top_skills, lambda: px.bar(
+                x=top_skills.values, y=top_skills.index,
+                orientation='h', title="Top 20 Required Skills",
+                labels={'x': 'Frequency', 'y': 'Skill'}
+            ).update_layout(yaxis={'categoryorder': 'total ascending'}))
             st.plotly_chart(fig, use_container_width=True)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Skills requested together
+                top_10 = top_skills.head(10).index.tolist()
+                cooccurrence = skill_cooccurrence(filtered_skills, top_10)
+                fig = cached_figure('skill_cooccurrence', cooccurrence, lambda: px.imshow(
+                    cooccurrence, text_auto=True, color_continuous_scale='Blues',
+                    title="Skill Co-occurrence (Top 10 Skills)",
+                    labels={'x': 'Skill', 'y': 'Skill', 'color': 'Jobs'}
+                ))
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                # Top skills per source
+                if 'source' in filtered_skills.columns:
+                    top_sources = df['source'].value_counts().head(5).index.tolist()
+                    source_skills = grouped_top_n(filtered_skills, 'source', 'skill', top_sources, n=5)
+                    source_skills.columns = ['Source', 'Skill', 'Mentions']
+                    fig = cached_figure('skills_by_source', source_skills, lambda: px.bar(
+                        source_skills, x='Skill', y='Mentions', color='Source',
+                        title="Top Skills by Source (Top 5 Sources)",
+                        barmode='group'
+                    ))
+                    st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No skills data available for analysis")
     else:
@@ -453,17 +533,88 @@ def show_skills_analysis(df):
 #     else:
 #         st.info("Skills column not found in the dataset")
 
-def show_source_comparison(df):
-    """Show comprehensive job source comparison analysis"""
+@instrumented
+def show_source_comparison(df, state_key=None):
+    """Show comprehensive job source comparison analysis (state_key memoizes the per-source aggregates)"""
     st.subheader("🔄 Job Source Comparison")
     
     if 'source' not in df.columns:
         st.warning("No 'source' column found in the dataset")
         return
     
+    def source_data():
+        source_counts = df['source'].value_counts()
+        
+        # Daily postings of the top 5 sources
+        timeline_data = None
+        date_col = None
+        for col in ['publication_date', 'date_of_publication', 'scrapped_on_date']:
+            if col in df.columns and not df[col].isna().all():
+                date_col = col
+                break
+        
+        if date_col:
+            top_5_sources = source_counts.head(5).index.tolist()
+            df_filtered = df[df['source'].isin(top_5_sources) & df[date_col].notna()]
+            
+            if len(df_filtered) > 0:
+                timeline_data = df_filtered.groupby([df_filtered[date_col].dt.date, 'source'], observed=True).size().reset_index()
+                timeline_data.columns = ['date', 'source', 'job_count']
+        
+        # Calculate metrics for every source in one grouped pass
+        source_groups = df.groupby('source', observed=True)
+        source_stats = pd.DataFrame({'jobs': source_groups.size()})
+        if 'remote_working' in df.columns:
+            source_stats['remote_jobs'] = source_groups['remote_working'].sum()
+        if 'job_salary' in df.columns:
+            source_stats['with_salary'] = source_groups['job_salary'].count()
+        if 'skills_needed' in df.columns:
+            source_stats['with_skills'] = source_groups['skills_needed'].count()
+        if 'salary_avg' in df.columns:
+            source_stats['avg_salary'] = source_groups['salary_avg'].mean()
+        if 'company_rating' in df.columns:
+            source_stats['avg_rating'] = source_groups['company_rating'].mean()
+        if 'company' in df.columns:
+            source_stats['unique_companies'] = source_groups['company'].nunique()
+        
+        def share_of_jobs(stats, column):
+            if column not in stats.columns:
+                return 0
+            return (stats[column] / stats['jobs'] * 100).where(stats['jobs'] > 0, 0).round(1).to_numpy()
+        
+        def optional_stat(stats, column, missing):
+            if column not in stats.columns:
+                return missing
+            return stats[column].astype(object).where(stats[column].notna(), None).to_numpy()
+        
+        # Rows follow source_counts, like the per-source table did
+        ordered_stats = source_stats.reindex(source_counts.index)
+        ordered_stats['jobs'] = ordered_stats['jobs'].fillna(0).astype(int)
+        metrics_df = pd.DataFrame({
+            'Source': list(source_counts.index),
+            'Total Jobs': ordered_stats['jobs'].to_numpy(),
+            'Unique Companies': optional_stat(ordered_stats, 'unique_companies', 0),
+            'Avg Company Rating': optional_stat(ordered_stats, 'avg_rating', None),
+            'Remote Jobs %': share_of_jobs(ordered_stats, 'remote_jobs'),
+            'Has Salary Info %': share_of_jobs(ordered_stats, 'with_salary'),
+            'Has Skills Info %': share_of_jobs(ordered_stats, 'with_skills'),
+            'Avg Salary': optional_stat(ordered_stats, 'avg_salary', None),
+        })
+        metrics_df = metrics_df.sort_values('Total Jobs', ascending=False)
+        
+        return {
+            'source_counts': source_counts,
+            'timeline_data': timeline_data,
+            'source_stats': source_stats,
+            'metrics_df': metrics_df,
+        }
+    
+    sources = memoize_section('sources', state_key, source_data)
+    source_counts = sources['source_counts']
+    source_stats = sources['source_stats']
+    
     # Source overview metrics
     st.markdown("### 📊 Source Overview")
-    source_counts = df['source'].value_counts()
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -481,132 +632,39 @@ def show_source_comparison(df):
     
     with col1:
         # Pie chart of source distribution
-        fig = px.pie(values=source_counts.values, names=source_counts.index,
-                    title="Job Distribution by Source")
+        fig = cached_figure('source_distribution', source_counts, lambda: px.pie(
+            values=source_counts.values, names=source_counts.index,
+            title="Job Distribution by Source"
+        ))
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Bar chart of top sources
         top_sources = source_counts.head(10)
-        fig = px.bar(x=top_sources.values, y=top_sources.index,
-                    orientation='h', title="Top 10 Job Sources",
-                    labels={'x': 'Number of Jobs', 'y': 'Source'})
-        fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+        fig = cached_figure('top_sources', top_sources, lambda: px.bar(
+            x=top_sources.values, y=top_sources.index,
+            orientation='h', title="Top 10 Job Sources",
+            labels={'x': 'Number of Jobs', 'y': 'Source'}
+        ).update_layout(yaxis={'categoryorder': 'total ascending'}))
         st.plotly_chart(fig, use_container_width=True)
     
     # Source trends over time
     st.markdown("### 📈 Source Trends Over Time")
-    date_col = None
-    for col in ['publication_date', 'date_of_publication', 'scrapped_on_date']:
-        if col in df.columns and not df[col].isna().all():
-            date_col = col
-            break
-    
-    if date_col:
+    timeline_data = sources['timeline_data']
+    if timeline_data is not None:
         # Create timeline chart for top sources
-        top_5_sources = source_counts.head(5).index.tolist()
-        df_filtered = df[df['source'].isin(top_5_sources) & df[date_col].notna()]
-        
-        if len(df_filtered) > 0:
-            timeline_data = df_filtered.groupby([df_filtered[date_col].dt.date, 'source']).size().reset_index()
-            timeline_data.columns = ['date', 'source', 'job_count']
-            
-            fig = px.line(timeline_data, x='date', y='job_count', color='source',
-                         title="Job Posting Trends by Source (Top 5 Sources)",
-                         labels={'job_count': 'Number of Jobs', 'date': 'Date'})
-            st.plotly_chart(fig, use_container_width=True)
+        fig = cached_figure('source_timeline', timeline_data, lambda: px.line(
+            timeline_data, x='date', y='job_count', color='source',
+            title="Job Posting Trends by Source (Top 5 Sources)",
+            labels={'job_count': 'Number of Jobs', 'date': 'Date'}
+        ))
+        st.plotly_chart(fig, use_container_width=True)
     
     # Source quality comparison
     st.markdown("### 🏆 Source Quality Comparison")
     
-    # Calculate metrics by source
-    source_metrics = []
-    for source in source_counts.index:
-        source_df = df[df['source'] == source]
-        
-        # Safe calculation for remote working percentage
-        remote_pct = 0
-        if 'remote_working' in df.columns:
-            try:
-                remote_count = source_df['remote_working'].sum()
-                remote_pct = (remote_count / len(source_df) * 100) if len(source_df) > 0 else 0
-            except (TypeError, ValueError):
-                remote_pct = 0
-        
-        # Safe calculation for salary info percentage
-        salary_info_pct = 0
-        if 'job_salary' in df.columns:
-            try:
-                has_salary = (~source_df['job_salary'].isna()).sum()
-                salary_info_pct = (has_salary / len(source_df) * 100) if len(source_df) > 0 else 0
-            except (TypeError, ValueError):
-                salary_info_pct = 0
-        
-        # Safe calculation for skills info percentage
-        skills_info_pct = 0
-        if 'skills_needed' in df.columns:
-            try:
-                has_skills = (~source_df['skills_needed'].isna()).sum()
-                skills_info_pct = (has_skills / len(source_df) * 100) if len(source_df) > 0 else 0
-            except (TypeError, ValueError):
-                skills_info_pct = 0
-        # # Safe calculation for salary info percentage
-        # salary_info_pct = 0
-        # if 'job_salary' in df.columns:
-        #     try:
-        #         has_salary = (~source_df['job_salary'].isna()).sum()
-        #         salary_info_pct = (has_salary / len(source_df) * 100) if len(source_df) > 0 else 0
-        #     except (TypeError, ValueError):
-        #         salary_info_pct = 0
-        
-        # # Safe calculation for skills info percentage
-        # skills_info_pct = 0
-        # if 'skills_needed' in df.columns:
-        #     try:
-        #         has_skills = (~source_df['skills_needed'].isna()).sum()
-        #         skills_info_pct = (has_skills / len(source_df) * 100) if len(source_df) > 0 else 0
-        #     except (TypeError, ValueError):
-        #         skills_info_pct = 0
-        
-        # Safe calculation for average salary
-        avg_salary = None
-        if 'salary_avg' in source_df.columns:
-            try:
-                avg_salary = source_df['salary_avg'].mean()
-                if pd.isna(avg_salary):
-                    avg_salary = None
-            except (TypeError, ValueError):
-                avg_salary = None
-        
-        # Safe calculation for company rating
-        avg_rating = None
-        if 'company_rating' in df.columns:
-            try:
-                avg_rating = source_df['company_rating'].mean()
-                if pd.isna(avg_rating):
-                    avg_rating = None
-            except (TypeError, ValueError):
-                avg_rating = None
-        
-        metrics = {
-            'Source': source,
-            'Total Jobs': len(source_df),
-            'Unique Companies': source_df['company'].nunique() if 'company' in df.columns else 0,
-            'Avg Company Rating': avg_rating,
-            'Remote Jobs %': round(remote_pct, 1),
-            'Has Salary Info %': round(salary_info_pct, 1),
-            'Has Skills Info %': round(skills_info_pct, 1),
-            # 'Has Salary Info %': round(salary_info_pct, 1),
-            # 'Has Skills Info %': round(skills_info_pct, 1),
-            'Avg Salary': avg_salary
-        }
-        source_metrics.append(metrics)
-    
-    metrics_df = pd.DataFrame(source_metrics)
-    metrics_df = metrics_df.sort_values('Total Jobs', ascending=False)
-    
     # Display metrics table
-    st.dataframe(metrics_df, use_container_width=True)
+    st.dataframe(sources['metrics_df'], use_container_width=True)
     
     # Comparison charts
     col1, col2 = st.columns(2)
@@ -614,21 +672,23 @@ def show_source_comparison(df):
     with col1:
         # Remote work percentage by source
         if 'remote_working' in df.columns:
-            remote_by_source = df.groupby('source')['remote_working'].apply(lambda x: x.sum() / len(x) * 100).sort_values(ascending=False).head(10)
-            fig = px.bar(x=remote_by_source.values, y=remote_by_source.index,
-                        orientation='h', title="Remote Work % by Source (Top 10)",
-                        labels={'x': 'Remote Jobs (%)', 'y': 'Source'})
-            fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+            remote_by_source = (source_stats['remote_jobs'] / source_stats['jobs'] * 100).sort_values(ascending=False).head(10)
+            fig = cached_figure('remote_by_source', remote_by_source, lambda: px.bar(
+                x=remote_by_source.values, y=remote_by_source.index,
+                orientation='h', title="Remote Work % by Source (Top 10)",
+                labels={'x': 'Remote Jobs (%)', 'y': 'Source'}
+            ).update_layout(yaxis={'categoryorder': 'total ascending'}))
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Salary information completeness by source
         if 'job_salary' in df.columns:
-            salary_completeness = df.groupby('source')['job_salary'].apply(lambda x: (~x.isna()).sum() / len(x) * 100).sort_values(ascending=False).head(10)
-            fig = px.bar(x=salary_completeness.values, y=salary_completeness.index,
-                        orientation='h', title="Salary Info Completeness % by Source",
-                        labels={'x': 'Has Salary Info (%)', 'y': 'Source'})
-            fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+            salary_completeness = (source_stats['with_salary'] / source_stats['jobs'] * 100).sort_values(ascending=False).head(10)
+            fig = cached_figure('salary_completeness_by_source', salary_completeness, lambda: px.bar(
+                x=salary_completeness.values, y=salary_completeness.index,
+                orientation='h', title="Salary Info Completeness % by Source",
+                labels={'x': 'Has Salary Info (%)', 'y': 'Source'}
+            ).update_layout(yaxis={'categoryorder': 'total ascending'}))
             st.plotly_chart(fig, use_container_width=True)
     
     # Source-specific analysis selector
@@ -642,58 +702,36 @@ def show_source_comparison(df):
     if selected_sources:
         # Location comparison
         st.markdown("#### 🌍 Location Distribution by Source")
-        location_source_data = []
-        for source in selected_sources:
-            source_df = df[df['source'] == source]
-            if 'location' in df.columns:
-                top_locations = source_df['location'].value_counts().head(5)
-                for location, count in top_locations.items():
-                    location_source_data.append({
-                        'Source': source,
-                        'Location': location,
-                        'Job Count': count
-                    })
-        
-        if location_source_data:
-            location_df = pd.DataFrame(location_source_data)
-            fig = px.bar(location_df, x='Location', y='Job Count', color='Source',
-                        title="Top Locations by Selected Sources",
-                        barmode='group')
-            st.plotly_chart(fig, use_container_width=True)
+        if 'location' in df.columns:
+            location_df = grouped_top_n(df, 'source', 'location', selected_sources, n=5)
+            location_df.columns = ['Source', 'Location', 'Job Count']
+            if len(location_df) > 0:
+                fig = cached_figure('locations_by_source', location_df, lambda: px.bar(
+                    location_df, x='Location', y='Job Count', color='Source',
+                    title="Top Locations by Selected Sources",
+                    barmode='group'
+                ))
+                st.plotly_chart(fig, use_container_width=True)
         
         # Company comparison
         st.markdown("#### 🏢 Top Companies by Source")
-        company_source_data = []
-        for source in selected_sources:
-            source_df = df[df['source'] == source]
-            if 'company' in df.columns:
-                top_companies = source_df['company'].value_counts().head(5)
-                for company, count in top_companies.items():
-                    company_source_data.append({
-                        'Source': source,
-                        'Company': company,
-                        'Job Count': count
-                    })
-        
-        if company_source_data:
-            company_df = pd.DataFrame(company_source_data)
-            fig = px.bar(company_df, x='Company', y='Job Count', color='Source',
-                        title="Top Companies by Selected Sources",
-                        barmode='group')
-            fig.update_xaxes(tickangle=45)
-            st.plotly_chart(fig, use_container_width=True)
+        if 'company' in df.columns:
+            company_df = grouped_top_n(df, 'source', 'company', selected_sources, n=5)
+            company_df.columns = ['Source', 'Company', 'Job Count']
+            if len(company_df) > 0:
+                fig = cached_figure('companies_by_source', company_df, lambda: px.bar(
+                    company_df, x='Company', y='Job Count', color='Source',
+                    title="Top Companies by Selected Sources",
+                    barmode='group'
+                ).update_xaxes(tickangle=45))
+                st.plotly_chart(fig, use_container_width=True)
         
         # Salary comparison by source
         if 'salary_avg' in df.columns:
             st.markdown("#### 💰 Salary Comparison by Source")
-            salary_comparison = []
-            for source in selected_sources:
-                source_df = df[(df['source'] == source) & (df['salary_avg'].notna()) & (df['salary_avg'] > 0)]
-                if len(source_df) > 0:
-                    salary_comparison.extend([{
-                        'Source': source,
-                        'Salary': salary
-                    } for salary in source_df['salary_avg'].tolist()])
+            has_salary = df['salary_avg'].notna() & (df['salary_avg'] > 0)
+            salary_comp_df = grouped_distribution(df, 'source', 'salary_avg', selected_sources, row_mask=has_salary)
+            salary_comp_df.columns = ['Source', 'Salary']
         # # Salary comparison by source
         # if 'salary_avg' in df.columns:
         #     st.markdown("#### 💰 Salary Comparison by Source")
@@ -706,10 +744,11 @@ def show_source_comparison(df):
         #                 'Salary': salary
         #             } for salary in source_df['salary_avg'].tolist()])
             
-            if salary_comparison:
-                salary_comp_df = pd.DataFrame(salary_comparison)
-                fig = px.box(salary_comp_df, x='Source', y='Salary',
-                           title="Salary Distribution by Source")
+            if len(salary_comp_df) > 0:
+                fig = cached_figure('salary_by_source', salary_comp_df, lambda: px.box(
+                    salary_comp_df, x='Source', y='Salary',
+                    title="Salary Distribution by Source"
+                ))
                 st.plotly_chart(fig, use_container_width=True)
         #     if salary_comparison:
         #         salary_comp_df = pd.DataFrame(salary_comparison)
@@ -717,6 +756,7 @@ def show_source_comparison(df):
         #                    title="Salary Distribution by Source")
         #         st.plotly_chart(fig, use_container_width=True)
 
+@instrumented
 def show_job_type_analysis(df):
     """Show job type and contract analysis"""
     st.subheader("📋 Job Type & Contract Analysis")
@@ -727,40 +767,50 @@ def show_job_type_analysis(df):
         if 'job_type' in df.columns:
             job_type_dist = df['job_type'].value_counts()
             job_type_dist = df['job_type'].value_counts().head(5)
-            fig = px.pie(values=job_type_dist.values, names=job_type_dist.index,
-                        title="Job Type Distribution")
+            fig = cached_figure('job_types', job_type_dist, lambda: px.pie(
+                values=job_type_dist.values, names=job_type_dist.index,
+                title="Job Type Distribution"
+            ))
             st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         if 'job_contract' in df.columns:
             contract_dist = df['job_contract'].value_counts()
             contract_dist = df['job_contract'].value_counts().head(5)
-            fig = px.pie(values=contract_dist.values, names=contract_dist.index,
-                        title="Contract Type Distribution")
+            fig = cached_figure('contract_types', contract_dist, lambda: px.pie(
+                values=contract_dist.values, names=contract_dist.index,
+                title="Contract Type Distribution"
+            ))
             st.plotly_chart(fig, use_container_width=True)
 
-def show_data_quality_report(df):
-    """Show data quality metrics"""
+@instrumented
+def show_data_quality_report(df, state_key=None):
+    """Show data quality metrics (state_key memoizes the missing data counts per filter state)"""
     st.subheader("🔍 Data Quality Report")
     
-    # Missing data analysis
-    missing_data = df.isnull().sum()
-    missing_percentage = (missing_data / len(df)) * 100
-    
-    quality_df = pd.DataFrame({
-        'Column': missing_data.index,
-        'Missing Count': missing_data.values,
-        'Missing Percentage': missing_percentage.values
-    }).sort_values('Missing Percentage', ascending=False)
+    def missing_data_report():
+        # Missing data analysis
+        missing_data = df.isnull().sum()
+        missing_percentage = (missing_data / len(df)) * 100
+        
+        quality_df = pd.DataFrame({
+            'Column': missing_data.index,
+            'Missing Count': missing_data.values,
+            'Missing Percentage': missing_percentage.values
+        }).sort_values('Missing Percentage', ascending=False)
+        
+        # Only show columns with missing data
+        return quality_df[quality_df['Missing Count'] > 0]
     
-    # Only show columns with missing data
-    quality_df = quality_df[quality_df['Missing Count'] > 0]
+    quality_df = memoize_section('data_quality', state_key, missing_data_report)
     
     if len(quality_df) > 0:
-        fig = px.bar(quality_df.head(15), x='Missing Percentage', y='Column',
-                    orientation='h', title="Missing Data by Column (Top 15)",
-                    labels={'Missing Percentage': 'Percentage Missing (%)', 'Column': 'Column Name'})
-        fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+        top_missing = quality_df.head(15)
+        fig = cached_figure('missing_data', top_missing, lambda: px.bar(
+            top_missing, x='Missing Percentage', y='Column',
+            orientation='h', title="Missing Data by Column (Top 15)",
+            labels={'Missing Percentage': 'Percentage Missing (%)', 'Column': 'Column Name'}
+        ).update_layout(yaxis={'categoryorder': 'total ascending'}))
         st.plotly_chart(fig, use_container_width=True)
         
         # Show the data quality table
@@ -768,6 +818,7 @@ def show_data_quality_report(df):
     else:
         st.success("🎉 No missing data found in the dataset!")
 
+@performance_rerun
 def main():
     st.title("💼 Job Analytics Dashboard")
     st.markdown("---")
@@ -781,24 +832,30 @@ def main():
             st.success("File uploaded successfully!")
             
             # Load data
-            df = load_and_process_data(uploaded_file)
+            df, gps_coords, job_skills, filter_index, search_index = load_and_process_data(uploaded_file)
             
             if df is not None:
                 st.header("🔧 Filters")
                 
+                # Filters intersect the row positions of the indexes built at load;
+                # the filtered frame is materialized once at the end
+                rows = None
+                # Identifies the upload and every filter value; sections memoize their data on it
+                filter_state = [getattr(uploaded_file, 'file_id', None), uploaded_file.name, uploaded_file.size]
+                
                 # Date range filter
-                if any(col in df.columns for col in ['publication_date', 'date_of_publication', 'scrapped_on_date']):
+                if any(col in df.columns for col in JOB_DATE_FILTER_COLUMNS):
                     use_date_filter = st.checkbox("Filter by date range")
                     if use_date_filter:
                         date_col = None
-                        for col in ['publication_date', 'date_of_publication', 'scrapped_on_date']:
-                            if col in df.columns and not df[col].isna().all():
+                        for col in JOB_DATE_FILTER_COLUMNS:
+                            if col in filter_index.dates:
                                 date_col = col
                                 break
                         
                         if date_col:
-                            min_date = df[date_col].min().date()
-                            max_date = df[date_col].max().date()
+                            date_index = filter_index.dates[date_col]
+                            min_date, max_date = date_index.date_bounds()
                             selected_dates = st.date_input(
                                 "Select date range",
                                 value=(min_date, max_date),
@@ -807,70 +864,94 @@ def main():
                             )
                             
                             if len(selected_dates) == 2:
-                                df = df[(df[date_col].dt.date >= selected_dates[0]) & 
-                                       (df[date_col].dt.date <= selected_dates[1])]
+                                rows = intersect_rows(rows, date_index.rows_between(selected_dates[0], selected_dates[1]))
+                                filter_state.append(('dates', date_col, tuple(selected_dates)))
                 
                 # Location filter
-                if 'location' in df.columns:
-                    locations = ['All'] + list(df['location'].dropna().unique())
+                if 'location' in filter_index.columns:
+                    location_index = filter_index.columns['location']
+                    locations = ['All'] + location_index.present_values(rows)
                     selected_location = st.selectbox("Filter by location", locations)
                     if selected_location != 'All':
-                        df = df[df['location'] == selected_location]
+                        rows = intersect_rows(rows, location_index.rows_for(selected_location))
+                        filter_state.append(('location', selected_location))
                 
                 # Company filter
-                if 'company' in df.columns:
-                    companies = ['All'] + list(df['company'].dropna().unique())
+                if 'company' in filter_index.columns:
+                    company_index = filter_index.columns['company']
+                    companies = ['All'] + company_index.present_values(rows)
                     selected_company = st.selectbox("Filter by company", companies)
                     if selected_company != 'All':
-                        df = df[df['company'] == selected_company]
+                        rows = intersect_rows(rows, company_index.rows_for(selected_company))
+                        filter_state.append(('company', selected_company))
                 
                 # Source filter
-                if 'source' in df.columns:
-                    sources = ['All'] + list(df['source'].dropna().unique())
+                if 'source' in filter_index.columns:
+                    source_index = filter_index.columns['source']
+                    sources = ['All'] + source_index.present_values(rows)
                     selected_source = st.selectbox("Filter by source", sources)
                     if selected_source != 'All':
-                        df = df[df['source'] == selected_source]
+                        rows = intersect_rows(rows, source_index.rows_for(selected_source))
+                        filter_state.append(('source', selected_source))
                 
                 # Remote work filter
-                if 'remote_working' in df.columns:
+                if 'remote_working' in filter_index.columns:
+                    remote_index = filter_index.columns['remote_working']
                     remote_filter = st.selectbox("Remote work", ['All', 'Remote Only', 'Non-Remote Only'])
                     if remote_filter == 'Remote Only':
-                        df = df[df['remote_working'] == True]
+                        rows = intersect_rows(rows, remote_index.rows_for(True))
                     elif remote_filter == 'Non-Remote Only':
-                        df = df[df['remote_working'] == False]
+                        rows = intersect_rows(rows, remote_index.rows_for(False))
+                    filter_state.append(('remote_working', remote_filter))
+                
+                filter_state = tuple(filter_state)
+                if rows is not None:
+                    # The frame is taken from the row positions on each rerun rather than kept
+                    # in session state; sections memoize their own data on filter_state.
+                    # Filtered-out values must not show up as zero-count categories
+                    with trace_span('filtered_jobs', rows_in=len(df)):
+                        df = drop_unused_categories(df.take(rows))
     
     if uploaded_file is not None and df is not None:
         # Main dashboard content
         show_overview_metrics(df)
         
-        # Navigation tabs
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-            "📈 Trends", "🔄 Source Comparison", "🌍 Locations", "🏢 Companies", "📋 Job Types", "🔍 Data Quality"
-        ])
+        # Navigation tabs; only the open tab computes
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = lazy_tabs([
+            "📈 Trends", "🔄 Source Comparison", "🌍 Locations", "🏢 Companies", "🛠️ Skills", "📋 Job Types",
+            "🔍 Data Quality"
+        ], key="job_tabs")
         
         with tab1:
-            show_job_trends(df)
+            if tab1.open:
+                show_job_trends(df, filter_state)
         
         with tab2:
-            show_source_comparison(df)
+            if tab2.open:
+                show_source_comparison(df, filter_state)
         
         with tab3:
-            show_location_analysis(df)
+            if tab3.open:
+                show_location_analysis(df, gps_coords, filter_state)
         
         with tab4:
-            show_company_analysis(df)
+            if tab4.open:
+                show_company_analysis(df)
         
         # with tab5:
         #     show_salary_analysis(df)
         
-        # with tab6:
-        #     show_skills_analysis(df)
-        
         with tab5:
-            show_job_type_analysis(df)
+            if tab5.open:
+                show_skills_analysis(df, job_skills)
         
         with tab6:
-            show_data_quality_report(df)
+            if tab6.open:
+                show_job_type_analysis(df)
+        
+        with tab7:
+            if tab7.open:
+                show_data_quality_report(df, filter_state)
         
         # Raw data view
         st.markdown("---")
@@ -879,25 +960,20 @@ def main():
         # Search functionality
         search_term = st.text_input("Search in data (searches job title, company, location)")
         if search_term:
-            search_mask = (
-                df['summary'].str.contains(search_term, case=False, na=False) |
-                df['company'].str.contains(search_term, case=False, na=False) |
-                df['location'].str.contains(search_term, case=False, na=False)
-            )
-            filtered_df = df[search_mask]
+            # All words must match; "quoted text" matches as a whole; best matches first
+            if not search_index.ready:
+                st.caption("Search index is still building; scanning the data instead.")
+            with trace_span('search_jobs', rows_in=len(df)) as span:
+                filtered_df = df.loc[search_index.search(search_term, rows)]
+                if span is not None:
+                    span.rows_out = len(filtered_df)
             st.write(f"Found {len(filtered_df)} matching records")
-            st.dataframe(filtered_df)
+            show_paginated_dataframe(filtered_df, "job_raw", state_key=(filter_state, search_term))
         else:
-            st.dataframe(df)
-        
-        # Download filtered data
-        csv = df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download filtered data as CSV",
-            data=csv,
-            file_name="filtered_job_data.csv",
-            mime="text/csv"
-        )
+            show_paginated_dataframe(df, "job_raw", state_key=filter_state)
+        
+        # Download filtered data, generated only when requested
+        show_export_controls(df, "job_filtered", "filtered_job_data", "📥 Download filtered data")
     
     else:
         st.info("👆 Please upload a CSV file to get started with your job analytics dashboard!")
@@ -0,0 +1,49 @@
+"""
+Headless batch generator for the OpenAI and AstraDB reports.
+
+Computes the dashboard's executive summary metrics and charts for every
+report found below a directory, without Streamlit, on several processes:
+
+    python report_batch.py exports/ --output-dir reports/ --formats json html --workers 8
+"""
+
+# *************** IMPORTS: PYTHON LIBRARIES ***************
+import argparse
+import logging
+import sys
+
+# *************** IMPORTS: HELPERS ***************
+from helper.batch_reports import REPORT_FORMATS, BatchReportError, generate_reports
+
+
+#*************** Parse the command line
+def parse_args(argv: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate OpenAI and AstraDB reports for a directory of monthly exports.")
+    parser.add_argument('input_dir', help="Directory of cost-*.csv / activity-*.csv exports and report-*.csv AstraDB "
+                                          "reports, searched recursively (e.g. one subdirectory per organization)")
+    parser.add_argument('--output-dir', default='reports', help="Directory receiving the reports (default: reports)")
+    parser.add_argument('--formats', nargs='+', choices=REPORT_FORMATS, default=['json', 'html'],
+                        help="Output formats (default: json html); png and svg need kaleido")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    try:
+        results = generate_reports(args.input_dir, args.output_dir, args.formats, args.workers)
+    except BatchReportError as error:
+        logging.error("%s", error)
+        return 2
+
+    failed = [result for result in results if result['error']]
+    for result in failed:
+        logging.error("%s: %s", result['name'], result['error'])
+    logging.info("%d of %d reports written to %s", len(results) - len(failed), len(results), args.output_dir)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from helper import astradb_store
+from helper.astradb_cube import build_astradb_cube
+from helper.astradb_store import (
+    AstraDBStoreError,
+    ingest_astradb_report,
+    load_astradb_store_cube,
+    load_astradb_store_frame,
+)
+from helper.report_loaders import read_astradb_csv
+
+
+def line_item(org='o1', day=1, resource='db1', usage_type='read', cost=1.0, month=5):
+    return {
+        'ORG_NAME': org,
+        'RESOURCE_NAME': resource,
+        'REGION': 'us-east1',
+        'CLOUD_PROVIDER': 'GCP',
+        'USAGE_TYPE': usage_type,
+        'BREAKDOWN_START_TIMESTAMP': f'2025-{month:02d}-{day:02d} 00:00:00',
+        'BREAKDOWN_END_TIMESTAMP': f'2025-{month:02d}-{day:02d} 23:59:59',
+        'USAGE': cost * 10,
+        'UNIT_PRICE': 0.1,
+        'CALCULATED_COST': cost,
+    }
+
+
+@pytest.fixture
+def ingest(tmp_path):
+    store_dir = str(tmp_path / 'store')
+    reports = iter(range(1000))
+
+    def ingest_rows(rows):
+        file_path = str(tmp_path / f'report-{next(reports)}.csv')
+        pd.DataFrame(rows).to_csv(file_path, index=False)
+        return ingest_astradb_report(file_path, store_dir)[1]
+    ingest_rows.store_dir = store_dir
+    return ingest_rows
+
+
+def stored_cost(store_dir):
+    return load_astradb_store_frame(store_dir)['CALCULATED_COST'].sum(), load_astradb_store_cube(store_dir).total_cost
+
+
+def test_restated_range_replaces_stored_items(ingest):
+    ingest([line_item(cost=10.0)])
+    assert ingest([line_item(cost=12.0)]) == 1
+    assert stored_cost(ingest.store_dir) == (12.0, 12.0)
+
+
+def test_repeated_report_writes_nothing(ingest):
+    rows = [line_item(day=1), line_item(day=2), line_item(day=2)]
+    assert ingest(rows) == 3
+    assert ingest(rows) == 0
+    assert len(load_astradb_store_frame(ingest.store_dir)) == 3
+
+
+def test_late_item_rewrites_only_its_range(ingest):
+    ingest([line_item(day=1), line_item(day=2)])
+    assert ingest([line_item(day=1), line_item(day=2), line_item(day=2, usage_type='write')]) == 2
+    assert load_astradb_store_cube(ingest.store_dir).record_count == 3
+
+
+def test_identical_items_are_kept_apart(ingest):
+    ingest([line_item(), line_item()])
+    assert ingest([line_item(), line_item(), line_item()]) == 3
+    assert stored_cost(ingest.store_dir) == (3.0, 3.0)
+
+
+def test_added_organization_keeps_history(ingest):
+    ingest([line_item(org='o1', day=1)])
+    ingest([line_item(org='o1', day=1), line_item(org='o1', day=2), line_item(org='o2', day=2)])
+    assert ingest([line_item(org='o2', day=3)]) == 1
+    frame = load_astradb_store_frame(ingest.store_dir)
+    assert sorted(frame['ORG_NAME'].astype(str)) == ['o1', 'o1', 'o2', 'o2']
+
+
+def test_refresh_touches_only_new_days(ingest):
+    ingest([line_item(day=1), line_item(day=2)])
+    first_part = astradb_store._read_state(ingest.store_dir)['days']['2025-05-01']['part']
+    assert ingest([line_item(day=1), line_item(day=2), line_item(day=3)]) == 1
+    state = astradb_store._read_state(ingest.store_dir)
+    assert state['days']['2025-05-01']['part'] == first_part
+    assert sorted(os.listdir(os.path.join(ingest.store_dir, 'parts'))) == sorted(
+        day['part'] for day in state['days'].values()
+    )
+
+
+def test_cube_matches_full_report(ingest, tmp_path):
+    rows = [line_item(org=org, day=day, resource=f'db{day % 3}', cost=day + 0.5, month=month)
+            for org in ['o1', 'o2'] for month in [4, 5] for day in range(1, 8)]
+    ingest(rows[:10])
+    ingest(rows)
+    pd.DataFrame(rows).to_csv(tmp_path / 'full.csv', index=False)
+    expected = build_astradb_cube(read_astradb_csv(str(tmp_path / 'full.csv')))
+    cube = load_astradb_store_cube(ingest.store_dir)
+    for dimension in expected.dimensions:
+        actual, reference = cube.rollup(dimension).sort_index(), expected.rollup(dimension).sort_index()
+        assert list(actual.index) == list(reference.index)
+        assert np.allclose(actual.to_numpy(), reference.to_numpy())
+    assert cube.record_count == len(rows)
+    pd.testing.assert_frame_equal(cube.resource_breakdown().astype(str), expected.resource_breakdown().astype(str))
+
+
+def test_unlisted_files_are_ignored_and_removed(ingest):
+    ingest([line_item(cost=2.0)])
+    stray_path = os.path.join(ingest.store_dir, 'parts', 'part-2025-05-01-000099.parquet')
+    pd.DataFrame({'CALCULATED_COST': [5.0]}).to_parquet(stray_path)
+    assert stored_cost(ingest.store_dir) == (2.0, 2.0)
+    ingest([line_item(cost=2.0), line_item(day=2)])
+    assert not os.path.exists(stray_path)
+
+
+def test_schema_drift_is_rejected(ingest):
+    ingest([line_item()])
+    with pytest.raises(AstraDBStoreError):
+        ingest([dict(line_item(day=2), SERVICE_TIER='x')])
+
+
+def test_store_version_is_checked(ingest):
+    ingest([line_item()])
+    state = astradb_store._read_state(ingest.store_dir)
+    state['store_version'] = astradb_store.STORE_VERSION - 1
+    astradb_store._write_state(ingest.store_dir, state)
+    with pytest.raises(AstraDBStoreError):
+        load_astradb_store_cube(ingest.store_dir)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from helper.coercion import coerce_boolean
+
+
+# The per-row cleaner coerce_boolean replaced; its results are the reference
+def legacy_clean_remote_working(value):
+    if pd.isna(value):
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        value_lower = value.lower().strip()
+        return value_lower in ['true', '1', 'yes', 'remote', 'y']
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return False
+
+
+REAL_COLUMNS = {
+    'mixed_object': pd.Series([True, False, 'Yes', ' remote ', 'No', 'Y', '1', '0', 1, 0, 2.5, 0.0, None, np.nan, ''],
+                              dtype=object),
+    'strings': pd.Series(['TRUE', 'false', 'Remote', 'on-site', 'y', None], dtype='str'),
+    'bool': pd.Series([True, False, True]),
+    'nullable_bool': pd.Series([True, None, False], dtype='boolean'),
+    'int': pd.Series([0, 1, 3]),
+    'nullable_int': pd.Series([0, None, 3], dtype='Int64'),
+    'float': pd.Series([0.0, np.nan, 0.5]),
+    'categorical': pd.Series(['Yes', 'No', None, 'remote', 'Yes'], dtype='category'),
+    'empty_categorical': pd.Series([None, None], dtype='category'),
+    'all_missing': pd.Series([None, None], dtype=object),
+    'empty': pd.Series([], dtype=object),
+}
+
+
+def assert_same_as_legacy(series):
+    expected = series.apply(legacy_clean_remote_working).astype(bool)
+    actual = coerce_boolean(series)
+    pd.testing.assert_series_equal(actual, expected, check_names=False)
+
+
+@pytest.mark.parametrize('name', REAL_COLUMNS)
+def test_column_matches_legacy_cleaner(name):
+    assert_same_as_legacy(REAL_COLUMNS[name])
+
+
+def test_empty_categorical_is_all_false():
+    assert coerce_boolean(pd.Series([None, None], dtype='category')).tolist() == [False, False]
+
+
+def test_numpy_booleans_in_object_column_are_coerced():
+    # Intended difference: the legacy cleaner returned False for np.True_ in an object column
+    series = pd.Series([np.True_, np.False_, 'yes'], dtype=object)
+    assert series.apply(legacy_clean_remote_working).tolist() == [False, False, True]
+    assert coerce_boolean(series).tolist() == [True, False, True]
@@ -0,0 +1,87 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from job_analytics import clean_salary_data
+
+
+# The per-row parser clean_salary_data replaced; its results are the reference
+def legacy_extract_salary_range(salary_str):
+    if pd.isna(salary_str) or salary_str == '':
+        return None, None
+    clean_str = str(salary_str).replace('$', '').replace(',', '').replace('K', '000').replace('k', '000')
+    numbers = re.findall(r'\d+', clean_str)
+    if len(numbers) >= 2:
+        return int(numbers[0]), int(numbers[1])
+    elif len(numbers) == 1:
+        return int(numbers[0]), int(numbers[0])
+    return None, None
+
+
+def legacy_clean_salary_data(df):
+    df['salary_min'], df['salary_max'] = zip(*df['job_salary'].apply(legacy_extract_salary_range))
+    df['salary_avg'] = df[['salary_min', 'salary_max']].mean(axis=1)
+    return df
+
+
+REAL_SALARIES = [
+    '$80K-$100K',
+    '100,000 - 120,000',
+    '$120k',
+    '55000',
+    '45K € per year',
+    '€40 000 - €50 000 / an',
+    'From $90,000 a year',
+    '$25 - $35 an hour',
+    '60k-70k + bonus',
+    'Competitive',
+    'Selon profil',
+    '3500€ brut mensuel',
+    '٣٤-0',
+    '٤٥٠٠٠ - ٦٠٠٠٠',
+    '４０K-５０K',
+    '',
+    None,
+    np.nan,
+]
+
+
+def assert_same_as_legacy(salaries):
+    expected = legacy_clean_salary_data(pd.DataFrame({'job_salary': salaries}))
+    actual = clean_salary_data(pd.DataFrame({'job_salary': salaries}))
+    for column in ['salary_min', 'salary_max', 'salary_avg']:
+        pd.testing.assert_series_equal(actual[column], expected[column].astype('float64'), check_names=False)
+
+
+@pytest.mark.parametrize('salary', REAL_SALARIES)
+def test_each_salary_matches_legacy_parser(salary):
+    # A lone missing value gives an all-None column the legacy parser cannot average
+    assert_same_as_legacy([salary, '$1K'])
+
+
+def test_salary_column_matches_legacy_parser():
+    assert_same_as_legacy(REAL_SALARIES)
+
+
+def test_range_and_single_value():
+    df = clean_salary_data(pd.DataFrame({'job_salary': ['$80K-$100K', '100,000 - 120,000', '$120k']}))
+    assert df['salary_min'].tolist() == [80000, 100000, 120000]
+    assert df['salary_max'].tolist() == [100000, 120000, 120000]
+    assert df['salary_avg'].tolist() == [90000, 110000, 120000]
+
+
+def test_missing_and_unparseable_salaries_are_nan():
+    df = clean_salary_data(pd.DataFrame({'job_salary': ['', None, np.nan, 'Competitive']}))
+    assert df[['salary_min', 'salary_max', 'salary_avg']].isna().all().all()
+
+
+def test_non_ascii_digits_are_parsed():
+    df = clean_salary_data(pd.DataFrame({'job_salary': ['٣٤-0']}))
+    assert df.loc[0, ['salary_min', 'salary_max', 'salary_avg']].tolist() == [34, 0, 17]
+
+
+def test_frame_without_salary_column_is_unchanged():
+    df = pd.DataFrame({'company': ['Acme']})
+    assert clean_salary_data(df).columns.tolist() == ['company']